@@ -37,8 +37,7 @@ import datetime
 
 import pandas as pd
 
-from ansys.conceptev.core import app
-from ansys.conceptev.core.exceptions import ResponseError
+from ansys.conceptev.core import app, batch
 
 # %%
 # Set up inputs.
@@ -157,60 +156,51 @@ assert (
 # %%
 # Submit jobs for each combination.
 # ---------------------------------
-# Create a new design instance with title.
-# Create an output list to store the created designs.
-# Copy the base Concept into that new design instance.
-# Get the component IDs for the new design instance as they change when copied.
-# Change the base concept to use the new components.
-# Update the architecture on the server.
-# Update the local concept instance with the new architecture id.
-# Create and submit a job using the new concept (with the new architecture).
+# Build one specification per combination with a title for the new design instance.
+# The architecture is a function of the component IDs of the copied concept, as the
+# component IDs change when copied.
+# Submit the batch. Each specification is copied from the base concept, gets its new
+# architecture and has its job submitted, with several specifications processed at once.
+# Collect the created designs in an output list and report any failures.
+
+specs = [
+    {
+        "title": f"F_{combo['Front Motor']}_R_{combo['Rear Motor']} {datetime.datetime.now()}",
+        "architecture": lambda components, combo=combo: update_architecture(
+            components, combo, base_architecture
+        ),
+    }
+    for combo in combinations
+]
 
 with app.get_http_client() as client:
     token = app.get_token(client)
-    created_designs = []
-    # Submit jobs for each combination
-    for combo in combinations:
-        try:
-            # Create a new design instance with title.
-            title = f"F_{combo['Front Motor']}_R_{combo['Rear Motor']} {datetime.datetime.now()}"
-            design_instance_id = app.create_design_instance(project_id, title=title, token=token)
-
-            # Copy base Concept into that new design instance.
-            concept = app.copy_concept(base_concept_id, design_instance_id, client)
-            print(f"ID of the cloned concept: {concept['id']}")
-            # Save that in output list.
-            created_designs.append(
-                {
-                    "Project Name": title,
-                    "Design Instance Id": design_instance_id,
-                    "Concept_ID": concept["id"],
-                },
-            )
-            # Get the component IDs for the new design instance as they change when copied.
-            params = {"design_instance_id": design_instance_id}
-            components = app.get_component_id_map(client, design_instance_id)
-            # Change the base concept to use the new components.
-            updated_architecture = update_architecture(components, combo, base_architecture)
-            # Update the architecture on the server.
-            created_arch = app.post(client, "/architectures", data=updated_architecture)
-            print(f"Created architecture: {created_arch}\n")
-
-            # Update the local concept instance with the new architecture id.
-            concept["architecture_id"] = created_arch["id"]
-
-            # Create and submit a job using the new concept (with the new architecture)
-            job_info = app.create_submit_job(
-                client,
-                concept,
-                account_id,
-                hpc_id,
-                job_name=f"cli_job: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}",
-            )
-            print(f"Submitted job for combination {combo}: {job_info}")
-        except ResponseError as err:
-            print(f"Failed to submit job for combination {combo}: {err}")
-            continue  # If one job fails to submit keep trying the other jobs.
+    results = batch.submit_batch(
+        client,
+        project_id,
+        base_concept_id,
+        specs,
+        account_id=account_id,
+        hpc_id=hpc_id,
+        max_workers=8,
+    )
+
+created_designs = []
+for combo, result in zip(combinations, results):
+    if result.design_instance_id is not None:
+        created_designs.append(
+            {
+                "Project Name": result.item["title"],
+                "Design Instance Id": result.design_instance_id,
+                "Concept_ID": result.concept["id"] if result.concept is not None else None,
+            },
+        )
+    if result.ok:
+        print(f"Submitted job for combination {combo}: {result.result}")
+    else:
+        # If one job fails to submit the other jobs are still submitted.
+        print(f"Failed to submit job for combination {combo}: {result.error}")
+
 # %%
 # Save the list of created designs to a file.
 # -------------------------------------------
@@ -229,8 +219,13 @@ all_results.to_excel("created_designs.xlsx")
 #    Only needed for keep test environment clean.
 
 with app.get_http_client() as client:
-    for concept in created_designs:
-        client.params = client.params.set("design_instance_id", concept["Design Instance Id"])
-        app.delete(client, "concepts", id=concept["Concept_ID"])
-    app.delete_project(project_id, token)
+    # A design instance whose concept copy failed has no concept ID, so every concept found in
+    # it is deleted.
+    concepts = [
+        result.concept or {"design_instance_id": result.design_instance_id}
+        for result in results
+        if result.design_instance_id is not None
+    ]
+    batch.delete_concepts(client, concepts, max_workers=8)
+    batch.delete_projects(token, [project_id])
     print(f"Deleted project {project_id}")
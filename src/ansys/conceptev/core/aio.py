@@ -0,0 +1,866 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Asynchronous API client for the Ansys ConceptEV service.
+
+The functions mirror those in ``ansys.conceptev.core.app`` and ``ansys.conceptev.core.ocm`` but
+are awaitable and built on a pooled ``httpx.AsyncClient``, so that many concepts can be driven
+concurrently from one event loop.
+"""
+import asyncio
+from contextlib import nullcontext
+import datetime
+from typing import AsyncIterator, Awaitable, Callable, Iterable
+
+import httpx
+
+from ansys.conceptev.core import auth, instrumentation
+from ansys.conceptev.core.app import (
+    CONCEPT_PARTS,
+    Router,
+    check_product_access,
+    component_id_map,
+    copy_concept_data,
+    data_format_versions,
+    job_input_data,
+    job_start_data,
+    new_concept_data,
+    read_file,
+    results_file_name,
+)
+from ansys.conceptev.core.connections import client_options
+from ansys.conceptev.core.exceptions import DeleteError, ProjectError
+from ansys.conceptev.core.ocm import (
+    PROJECT_PAGE_SIZE,
+    JobRecord,
+    add_to_project_index,
+    find_download_request,
+    find_project_id,
+    index_projects,
+    job_file_path,
+    job_records,
+    metadata_cache,
+    parse_account_ids,
+    parse_created_project,
+    parse_default_hpc,
+    parse_design_instance,
+    parse_job_file,
+    parse_product_id,
+    parse_signed_download,
+    parse_user_id,
+    project_index_key,
+    project_indexes,
+    project_page_count,
+    project_page_data,
+    store_job_record,
+)
+from ansys.conceptev.core.progress import check_status, get_ssl_context, monitor_job_messages
+from ansys.conceptev.core.responses import process_response
+from ansys.conceptev.core.result_cache import ResultCache, resolve_result_cache
+from ansys.conceptev.core.retries import RetryPolicy, retrying
+from ansys.conceptev.core.settings import settings
+
+
+def get_http_client(
+    token: str | None = None,
+    design_instance_id: str | None = None,
+    cache_filepath: str = "token_cache.bin",
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+    timeout: httpx.Timeout | float | None = None,
+    http2: bool | None = None,
+    retry_policy: RetryPolicy | None = None,
+) -> httpx.AsyncClient:
+    """Get an asynchronous HTTP client.
+
+    The client keeps a pool of connections open so that concurrent requests reuse them.
+    Failed requests are retried in the same way as the synchronous client. The pool limits, the
+    timeouts and HTTP/2 are taken from the settings unless given.
+    """
+    httpx_auth = auth.AnsysIDAuth(cache_filepath=cache_filepath) if token is None else None
+    params = {"design_instance_id": design_instance_id} if design_instance_id else None
+    header = {"Authorization": token} if token else None
+
+    client = httpx.AsyncClient(
+        headers=header,
+        auth=httpx_auth,
+        params=params,
+        base_url=settings.conceptev_url,
+        verify=get_ssl_context(),
+        **client_options(
+            max_connections, max_keepalive_connections, keepalive_expiry, timeout, http2
+        ),
+    )
+    return instrumentation.attach(retrying(client, retry_policy))
+
+
+async def get(
+    client: httpx.AsyncClient, router: Router, id: str | None = None, params: dict | None = None
+) -> dict:
+    """Send a GET request to the base client."""
+    if id:
+        path = "/".join([router, id])
+    else:
+        path = router
+    response = await client.get(url=path, params=params)
+    return process_response(response)
+
+
+async def post(
+    client: httpx.AsyncClient,
+    router: Router,
+    data: dict,
+    params: dict = {},
+    account_id: str | None = None,
+) -> dict:
+    """Send a POST request to the base client."""
+    params = check_product_access(router, account_id, params)
+    response = await client.post(url=router, json=data, params=params)
+    return process_response(response)
+
+
+async def delete(
+    client: httpx.AsyncClient,
+    router: Router,
+    id: str,
+    account_id: str | None = None,
+    params: dict | None = None,
+) -> dict:
+    """Send a DELETE request to the base client."""
+    params = check_product_access(router, account_id, params or {})
+    path = "/".join([router, id])
+    response = await client.delete(url=path, params=params)
+    if response.status_code != 204:
+        raise DeleteError(f"Failed to delete from {router} with ID:{id}.")  # nosec B608
+
+
+async def put(client: httpx.AsyncClient, router: Router, id: str, data: dict) -> dict:
+    """Put/update from the client at the specific route."""
+    path = "/".join([router, id])
+    response = await client.put(url=path, json=data)
+    return process_response(response)
+
+
+async def post_component_file(
+    client: httpx.AsyncClient, filename: str, component_file_type: str
+) -> dict:
+    """Send a POST request to the base client with a file."""
+    file_contents = read_file(filename)
+    response = await client.post(
+        url="/components:upload",
+        files={"file": file_contents},
+        params={"component_file_type": component_file_type},
+    )
+    return process_response(response)
+
+
+class AsyncOCMSession:
+    """Pooled asynchronous connection to the OnScale Cloud Manager.
+
+    The asynchronous twin of ``ansys.conceptev.core.ocm.OCMSession``. The token is sent with
+    each request, so one session can be shared by many concurrent tasks.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        timeout: httpx.Timeout | float | None = None,
+        http2: bool | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        """Initialize the pooled OCM client.
+
+        The pool limits, the timeouts and HTTP/2 are taken from the settings unless given.
+        Failed requests are retried by ``retry_policy``, or by the default policy.
+        """
+        client = httpx.AsyncClient(
+            base_url=settings.ocm_url,
+            verify=get_ssl_context(),
+            **client_options(
+                max_connections, max_keepalive_connections, keepalive_expiry, timeout, http2
+            ),
+        )
+        self.client = instrumentation.attach(retrying(client, retry_policy))
+
+    async def request(self, token: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request with the token added to the headers."""
+        headers = {"Authorization": token} | kwargs.pop("headers", {})
+        return await self.client.request(method, url, headers=headers, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncOCMSession":
+        """Enter the context manager."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Close the session on exit."""
+        await self.aclose()
+
+
+def create_ocm_client(token: str, retry_policy: RetryPolicy | None = None) -> httpx.AsyncClient:
+    """Create an asynchronous OCM client, retrying failed requests like the ConceptEV client."""
+    client = httpx.AsyncClient(
+        base_url=settings.ocm_url,
+        verify=get_ssl_context(),
+        headers={"Authorization": token},
+        **client_options(),
+    )
+    return instrumentation.attach(retrying(client, retry_policy))
+
+
+async def ocm_request(
+    token: str, method: str, url: str, session: AsyncOCMSession | None = None, **kwargs
+) -> httpx.Response:
+    """Send a request to OCM, reusing the session connection pool when one is given."""
+    if session is not None:
+        return await session.request(token, method, url, **kwargs)
+    async with create_ocm_client(token) as client:
+        return await client.request(method, url, **kwargs)
+
+
+async def cached_lookup(
+    name: str, token: str, args: tuple, load: Callable[[], Awaitable], use_cache: bool = True
+):
+    """Get a value from the shared OCM metadata cache, loading and storing it if missing."""
+    if not use_cache:
+        return await load()
+    key = metadata_cache.key(name, token, *args)
+    value = metadata_cache.get(key)
+    if value is None:
+        value = await load()
+        metadata_cache.set(key, value)
+    return value
+
+
+async def get_product_id(
+    token: str, session: AsyncOCMSession | None = None, use_cache: bool = True
+) -> str:
+    """Get the product ID."""
+
+    async def load():
+        products = await ocm_request(token, "GET", "/product/list", session=session)
+        return parse_product_id(products)
+
+    return await cached_lookup("product_id", token, (), load, use_cache)
+
+
+async def get_user_id(
+    token: str, session: AsyncOCMSession | None = None, use_cache: bool = True
+) -> str:
+    """Get the user ID."""
+
+    async def load():
+        user_details = await ocm_request(token, "POST", "/user/details", session=session)
+        return parse_user_id(user_details)
+
+    return await cached_lookup("user_id", token, (), load, use_cache)
+
+
+async def get_account_ids(
+    token: str, session: AsyncOCMSession | None = None, use_cache: bool = True
+) -> dict:
+    """Get account IDs."""
+
+    async def load():
+        response = await ocm_request(token, "POST", "/account/list", session=session)
+        return parse_account_ids(response)
+
+    return dict(await cached_lookup("account_ids", token, (), load, use_cache))
+
+
+async def get_account_id(
+    token: str, session: AsyncOCMSession | None = None, use_cache: bool = True
+) -> str:
+    """Get the account ID from OCM using name from config file."""
+    accounts = await get_account_ids(token, session=session, use_cache=use_cache)
+    return accounts[settings.account_name]
+
+
+async def get_default_hpc(
+    token: str, account_id: str, session: AsyncOCMSession | None = None, use_cache: bool = True
+) -> str:
+    """Get the default HPC ID."""
+
+    async def load():
+        response = await ocm_request(
+            token, "POST", "/account/hpc/default", session=session, json={"accountId": account_id}
+        )
+        return parse_default_hpc(response)
+
+    return await cached_lookup("default_hpc", token, (account_id,), load, use_cache)
+
+
+async def create_new_project(
+    client: httpx.AsyncClient,
+    account_id: str,
+    hpc_id: str,
+    title: str,
+    project_goal: str = "Created from the CLI",
+    session: AsyncOCMSession | None = None,
+) -> dict:
+    """Create a project."""
+    token = await asyncio.to_thread(auth.get_token, client)
+    project_data = {
+        "accountId": account_id,
+        "hpcId": hpc_id,
+        "projectTitle": title,
+        "projectGoal": project_goal,
+    }
+    created_project = await ocm_request(
+        token, "POST", "/project/create", session=session, json=project_data
+    )
+    return parse_created_project(created_project)
+
+
+async def get_project_page(
+    token: str,
+    account_id: str,
+    name: str = "",
+    page_number: int = 0,
+    page_size: int = PROJECT_PAGE_SIZE,
+    session: AsyncOCMSession | None = None,
+) -> dict:
+    """Get one page of the projects of an account whose names match a filter."""
+    response = await ocm_request(
+        token,
+        "POST",
+        "/project/list/page",
+        session=session,
+        json=project_page_data(account_id, name, page_number, page_size),
+    )
+    return process_response(response)
+
+
+async def iter_projects(
+    account_id: str,
+    token: str,
+    name: str = "",
+    session: AsyncOCMSession | None = None,
+    page_size: int = PROJECT_PAGE_SIZE,
+    max_concurrency: int = 8,
+) -> AsyncIterator[dict]:
+    """Iterate over all projects of an account whose names match a filter.
+
+    Pages are requested in the same way as ``ansys.conceptev.core.ocm.iter_projects``, with at
+    most ``max_concurrency`` pages requested at the same time.
+    """
+    page = await get_project_page(token, account_id, name, 0, page_size, session=session)
+    for project in page["projects"]:
+        yield project
+    page_count = project_page_count(page, page_size)
+    if page_count is None:
+        page_number = 0
+        while len(page["projects"]) >= page_size:
+            page_number += 1
+            page = await get_project_page(token, account_id, name, page_number, page_size, session)
+            for project in page["projects"]:
+                yield project
+        return
+    if page_count == 1:
+        return
+
+    pool = (
+        AsyncOCMSession(max_connections=max_concurrency)
+        if session is None
+        else nullcontext(session)
+    )
+    async with pool as pooled:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded_get_page(page_number: int) -> dict:
+            async with semaphore:
+                return await get_project_page(
+                    token, account_id, name, page_number, page_size, pooled
+                )
+
+        tasks = [asyncio.ensure_future(bounded_get_page(number)) for number in range(1, page_count)]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                for project in (await next_page)["projects"]:
+                    yield project
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def get_project_ids(
+    name: str, account_id: str, token: str, session: AsyncOCMSession | None = None
+) -> dict:
+    """Get projects."""
+    return index_projects(
+        [project async for project in iter_projects(account_id, token, name, session)]
+    )
+
+
+async def get_project_index(
+    account_id: str, token: str, session: AsyncOCMSession | None = None, use_cache: bool = True
+) -> dict:
+    """Get the IDs of all projects of an account keyed by project title.
+
+    The index is shared with ``ansys.conceptev.core.ocm.get_project_index``.
+    """
+    key = project_index_key(account_id, token)
+    projects = project_indexes.get(key) if use_cache else None
+    if projects is None:
+        projects = dict(
+            index_projects(
+                [project async for project in iter_projects(account_id, token, session=session)]
+            )
+        )
+        project_indexes.set(key, projects)
+    return projects
+
+
+async def get_project_id(
+    name: str, account_id: str, token: str, session: AsyncOCMSession | None = None
+) -> str:
+    """Get project ID."""
+    projects = await get_project_ids(name, account_id, token, session=session)
+    if not projects:
+        raise ProjectError(f"Project with name {name} not found.")
+    if len(projects) > 1:
+        raise ProjectError(f"Multiple projects found with name {name}.")
+    return projects[name][0]
+
+
+async def get_or_create_project(
+    client: httpx.AsyncClient,
+    account_id: str,
+    hpc_id: str,
+    title: str,
+    session: AsyncOCMSession | None = None,
+) -> str:
+    """Get or create a project.
+
+    The project is looked up in the same way as ``ansys.conceptev.core.ocm.get_or_create_project``.
+    """
+    token = await asyncio.to_thread(auth.get_token, client)
+    cached = project_indexes.get(project_index_key(account_id, token)) is not None
+    projects = await get_project_index(account_id, token, session=session)
+    project_id = find_project_id(projects, title)
+    if project_id is None and cached:
+        projects = await get_project_index(account_id, token, session=session, use_cache=False)
+        project_id = find_project_id(projects, title)
+    if project_id is not None:
+        return project_id
+
+    project = await create_new_project(client, account_id, hpc_id, title, session=session)
+    add_to_project_index(account_id, token, title, project["projectId"])
+    return project["projectId"]
+
+
+async def delete_project(project_id: str, token: str, session: AsyncOCMSession | None = None):
+    """Delete a project."""
+    ocm_delete_init = await ocm_request(
+        token,
+        "DELETE",
+        "/project/delete/init",
+        session=session,
+        json={"projectId": project_id},
+        timeout=20,
+    )
+    ocm_delete_init = process_response(ocm_delete_init)
+    ocm_delete = await ocm_request(
+        token,
+        "DELETE",
+        "/project/delete/execute",
+        session=session,
+        json={"projectId": project_id, "hash": ocm_delete_init["hash"]},
+        timeout=20,
+    )
+    project_indexes.invalidate(token)
+    return process_response(ocm_delete)
+
+
+async def create_design_instance(
+    project_id: str,
+    title: str,
+    token: str,
+    product_id: str | None = None,
+    return_design_id: bool = False,
+    session: AsyncOCMSession | None = None,
+):
+    """Create a design instance on OCM."""
+    if product_id is None:
+        product_id = await get_product_id(token, session=session)
+
+    design_data = {
+        "projectId": project_id,
+        "productId": product_id,
+        "designTitle": title,
+    }
+    created_design = await ocm_request(
+        token, "POST", "/design/create", session=session, json=design_data
+    )
+    return parse_design_instance(created_design, return_design_id)
+
+
+async def load_job_record(
+    token: str,
+    job_id: str,
+    session: AsyncOCMSession | None = None,
+    use_cache: bool = True,
+    max_age: float | None = None,
+) -> JobRecord:
+    """Load a job from the OnScale Cloud Manager.
+
+    The job records are cached in the same way as by
+    ``ansys.conceptev.core.ocm.load_job_record`` and shared with it.
+    """
+    key = job_records.key("job", token, job_id)
+    record = job_records.get(key) if use_cache else None
+    if record is None or (max_age is not None and record.age > max_age):
+        response = await ocm_request(
+            token, "POST", "/job/load", session=session, json={"jobId": job_id}
+        )
+        record = JobRecord.from_response(job_id, process_response(response))
+        store_job_record(key, record)
+    return record
+
+
+async def get_job_info(
+    token: str, job_id: str, session: AsyncOCMSession | None = None, use_cache: bool = True
+) -> dict:
+    """Get the job info from the OnScale Cloud Manager."""
+    record = await load_job_record(token, job_id, session=session, use_cache=use_cache)
+    return record.job_info
+
+
+async def get_design_of_job(
+    token: str, job_id: str, session: AsyncOCMSession | None = None, use_cache: bool = True
+) -> str:
+    """Get the design instance ID of a job from the OnScale Cloud Manager."""
+    record = await load_job_record(token, job_id, session=session, use_cache=use_cache)
+    return record.design_instance_id
+
+
+async def get_status(
+    job_info: dict,
+    token: str,
+    session: AsyncOCMSession | None = None,
+    use_cache: bool = True,
+    max_age: float | None = None,
+) -> str:
+    """Get the status of the job."""
+    record = await load_job_record(
+        token, job_info["job_id"], session=session, use_cache=use_cache, max_age=max_age
+    )
+    return record.status
+
+
+async def get_design_title(
+    token: str, design_instance_id: str, session: AsyncOCMSession | None = None
+) -> str:
+    """Get the design Title from the OnScale Cloud Manager."""
+    response = await ocm_request(
+        token,
+        "POST",
+        "/design/instance/load",
+        session=session,
+        json={"designInstanceId": design_instance_id},
+    )
+    response = process_response(response)
+    design = await ocm_request(
+        token, "POST", "/design/load", session=session, json={"designId": response["designId"]}
+    )
+    return process_response(design)["designTitle"]
+
+
+async def get_job_file(
+    token: str,
+    job_id: str,
+    filename: str,
+    simulation_id: str | None = None,
+    encrypted: bool = False,
+    session: AsyncOCMSession | None = None,
+):
+    """Get the job file from the OnScale Cloud Manager."""
+    path = job_file_path(job_id, filename, simulation_id, encrypted)
+    response = await ocm_request(
+        token, "GET", path, session=session, headers={"accept": "application/octet-stream"}
+    )
+    return parse_job_file(response)
+
+
+async def get_job_file_signed_url(
+    token: str,
+    job_id: str,
+    filename: str,
+    session: AsyncOCMSession | None = None,
+    timeout: float = 20,
+):
+    """Fetch JSON content from S3 using the signed download URL from the OCM file list."""
+    list_response = await ocm_request(token, "GET", f"/job/files/list/{job_id}", session=session)
+    download_request = find_download_request(list_response, job_id, filename)
+
+    signed_url = download_request["uri"]
+    method = download_request.get("method", "GET").upper()
+    headers = download_request.get("headers", {})
+
+    if session is not None:
+        s3_response = await session.client.request(
+            method, signed_url, headers=headers, timeout=timeout
+        )
+    else:
+        s3_client = instrumentation.attach(httpx.AsyncClient(verify=get_ssl_context()))
+        async with s3_client:
+            s3_response = await s3_client.request(
+                method, signed_url, headers=headers, timeout=timeout
+            )
+    return parse_signed_download(s3_response, filename)
+
+
+async def create_new_concept(
+    client: httpx.AsyncClient,
+    project_id: str,
+    product_id: str | None = None,
+    title: str | None = None,
+    ocm_session: AsyncOCMSession | None = None,
+) -> dict:
+    """Create a concept within an existing project."""
+    if title is None:
+        title = f"CLI concept {datetime.datetime.now()}"
+
+    token = await asyncio.to_thread(auth.get_token, client)
+    if product_id is None:
+        product_id = await get_product_id(token, session=ocm_session)
+
+    (design_instance_id, design_id), user_id = await asyncio.gather(
+        create_design_instance(
+            project_id, title, token, product_id, return_design_id=True, session=ocm_session
+        ),
+        get_user_id(token, session=ocm_session),
+    )
+    concept_data = new_concept_data(project_id, design_id, design_instance_id, user_id)
+    query = {"design_instance_id": design_instance_id}
+    return await post(client, "/concepts", data=concept_data, params=query)
+
+
+async def get_concept_ids(client: httpx.AsyncClient) -> dict:
+    """Get concept IDs."""
+    concepts = await get(client, "/concepts")
+    return {concept["name"]: concept["id"] for concept in concepts}
+
+
+async def get_concept(client: httpx.AsyncClient, design_instance_id: str) -> dict:
+    """Get the main parts of a concept.
+
+    The concept and its configurations, components, requirements and architecture are
+    requested concurrently.
+    """
+    params = {"design_instance_id": design_instance_id}
+    concept, *values = await asyncio.gather(
+        get(
+            client, "/concepts", id=design_instance_id, params=params | {"populated": False}
+        ),  # populated True is unsupported at this time.
+        *[
+            get(client, f"/concepts/{design_instance_id}/{part}", params=params)
+            for part in CONCEPT_PARTS
+        ],
+    )
+    concept.update(zip(CONCEPT_PARTS, values))
+    return concept
+
+
+async def get_concepts(
+    client: httpx.AsyncClient, design_instance_ids: Iterable[str], max_concurrency: int = 8
+) -> dict:
+    """Get the main parts of many concepts, fetching at most ``max_concurrency`` at a time."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_get_concept(design_instance_id):
+        async with semaphore:
+            return design_instance_id, await get_concept(client, design_instance_id)
+
+    concepts = await asyncio.gather(*[bounded_get_concept(id) for id in design_instance_ids])
+    return dict(concepts)
+
+
+async def copy_concept(
+    base_concept_id: str, design_instance_id: str, client: httpx.AsyncClient
+) -> dict:
+    """Copy the reference concept to the new design instance.
+
+    Unlike the synchronous version, the client parameters are not changed, so that the client
+    can be shared between concurrent copies.
+    """
+    copy = copy_concept_data(base_concept_id, design_instance_id)
+    params = {"design_instance_id": design_instance_id, "populated": False}
+    return await post(client, "/concepts:copy", data=copy, params=params)
+
+
+async def get_component_id_map(client: httpx.AsyncClient, design_instance_id: str) -> dict:
+    """Get a map of component name to component id."""
+    components = await client.get(
+        f"/concepts/{design_instance_id}/components",
+        params={"design_instance_id": design_instance_id},
+    )
+    return component_id_map(process_response(components))
+
+
+async def create_submit_job(
+    client: httpx.AsyncClient,
+    concept: dict,
+    account_id: str,
+    hpc_id: str,
+    job_name: str | None = None,
+    docker_tag: str = "default",
+    extra_memory: bool = False,
+) -> dict:
+    """Create and then submit a job.
+
+    The job is created in the design instance of the concept.
+    """
+    params = {"design_instance_id": concept["design_instance_id"]}
+    job_input = job_input_data(concept, job_name)
+    job, uploaded_file = await post(
+        client, "/jobs", data=job_input, params=params, account_id=account_id
+    )
+    job_start = job_start_data(job, uploaded_file, account_id, hpc_id, docker_tag, extra_memory)
+    return await post(client, "/jobs:start", data=job_start, params=params, account_id=account_id)
+
+
+async def get_results(
+    client: httpx.AsyncClient,
+    job_info: dict,
+    calculate_units: bool = True,
+    filtered: bool = False,
+    ocm_session: AsyncOCMSession | None = None,
+    cache: ResultCache | None = None,
+    use_cache: bool = True,
+    version_number: int | None = None,
+    design_instance_id: str | None = None,
+):
+    """Get the results for a completed job.
+
+    The result cache reads and writes files, so it is used from a worker thread to keep the
+    event loop free.
+    """
+    cache = resolve_result_cache(cache, use_cache)
+    if version_number is None:
+        version_number = await get_data_format_version(client)
+    filename = results_file_name(version_number, filtered)
+    key = ResultCache.key(job_info["job_id"], filename, calculate_units, filtered)
+    if cache is not None:
+        result = await asyncio.to_thread(cache.get, key)
+        if result is not None:
+            return result
+
+    if calculate_units:
+        params = {"design_instance_id": design_instance_id} if design_instance_id else {}
+        response = await client.post(
+            url="/jobs:result",
+            json=job_info,
+            params={
+                **params,
+                "results_file_name": filename,
+                "calculate_units": calculate_units,
+            },
+        )
+        result = process_response(response)
+    else:
+        token = await asyncio.to_thread(auth.get_token, client)
+        result = await get_job_file_signed_url(
+            token, job_info["job_id"], filename, session=ocm_session
+        )
+    if cache is not None:
+        await asyncio.to_thread(cache.set, key, result)
+    return result
+
+
+async def get_cached_results(
+    client: httpx.AsyncClient,
+    job_info: dict,
+    calculate_units: bool,
+    filtered: bool,
+    cache: ResultCache,
+    version_number: int | None = None,
+):
+    """Get the results of a job from the cache or ``None`` if they are not cached."""
+    if version_number is None:
+        version_number = await get_data_format_version(client)
+    filename = results_file_name(version_number, filtered)
+    key = ResultCache.key(job_info["job_id"], filename, calculate_units, filtered)
+    return await asyncio.to_thread(cache.get, key)
+
+
+async def get_data_format_version(client: httpx.AsyncClient, use_cache: bool = True) -> int:
+    """Get the data format version of the result files, sharing the cache of the sync client."""
+    key = (str(client.base_url),)
+    version_number = data_format_versions.get(key) if use_cache else None
+    if version_number is None:
+        version_number = await get(client, "/utilities:data_format_version")
+        data_format_versions.set(key, version_number)
+    return version_number
+
+
+async def read_results(
+    client: httpx.AsyncClient,
+    job_info: dict,
+    calculate_units: bool = True,
+    timeout: int | None = None,
+    filtered: bool = False,
+    msal_app: auth.PublicClientApplication | None = None,
+    ocm_session: AsyncOCMSession | None = None,
+    cache: ResultCache | None = None,
+    use_cache: bool = True,
+    version_number: int | None = None,
+) -> dict:
+    """Read job results, waiting for the job to complete first."""
+    job_id = job_info["job_id"]
+    cache = resolve_result_cache(cache, use_cache)
+    if cache is not None:
+        result = await get_cached_results(
+            client, job_info, calculate_units, filtered, cache, version_number
+        )
+        if result is not None:
+            return result
+    token = await asyncio.to_thread(auth.get_token, client)
+    user_id, initial_status = await asyncio.gather(
+        get_user_id(token, session=ocm_session),
+        get_status(job_info, token, session=ocm_session, use_cache=False),
+    )
+    if not check_status(initial_status):  # Job is still running
+        if msal_app is None:
+            msal_app = await asyncio.to_thread(auth.create_msal_app)
+        await monitor_job_messages(job_id, user_id, token, msal_app, timeout)
+        if client.auth is None:
+            client.headers["Authorization"] = await asyncio.to_thread(
+                auth.get_ansyId_token, msal_app
+            )
+    return await get_results(
+        client,
+        job_info,
+        calculate_units,
+        filtered,
+        ocm_session=ocm_session,
+        cache=cache,
+        use_cache=use_cache,
+        version_number=version_number,
+    )
@@ -21,16 +21,20 @@
 # SOFTWARE.
 
 """Simple API client for the Ansys ConceptEV service."""
+from concurrent.futures import ThreadPoolExecutor
 import datetime
-from typing import Literal
+from typing import Iterable, Literal
 
 import httpx
-from tenacity import retry, retry_if_result, stop_after_delay, wait_random_exponential
 
-from ansys.conceptev.core import auth
+from ansys.conceptev.core import auth, instrumentation
 from ansys.conceptev.core.auth import get_token
+from ansys.conceptev.core.connections import client_options
 from ansys.conceptev.core.exceptions import DeleteError, ProductAccessError
 from ansys.conceptev.core.ocm import (
+    JobRecord,
+    MetadataCache,
+    OCMSession,
     create_design_instance,
     create_new_project,
     delete_project,
@@ -46,14 +50,22 @@ from ansys.conceptev.core.ocm import (
     get_product_id,
     get_project_id,
     get_project_ids,
+    get_project_index,
     get_status,
     get_user_id,
+    iter_projects,
+    load_job_record,
 )
-from ansys.conceptev.core.progress import check_status, generate_ssl_context, monitor_job_progress
-from ansys.conceptev.core.responses import is_gateway_error, process_response
+from ansys.conceptev.core.progress import check_status, get_ssl_context, monitor_job_progress
+from ansys.conceptev.core.responses import process_response
+from ansys.conceptev.core.result_cache import ResultCache, resolve_result_cache
+from ansys.conceptev.core.retries import RetryPolicy, default_retry_policy, retrying
 from ansys.conceptev.core.settings import settings
 
 __all__ = [
+    "JobRecord",
+    "OCMSession",
+    "ResultCache",
     "get_or_create_project",
     "create_new_project",
     "create_design_instance",
@@ -68,8 +80,11 @@ __all__ = [
     "get_design_of_job",
     "get_design_title",
     "get_status",
+    "load_job_record",
     "get_project_ids",
     "get_project_id",
+    "get_project_index",
+    "iter_projects",
     "delete_project",
     "get_token",
 ]
@@ -97,6 +112,8 @@ Router = Literal[
     "/utilities:data_format_version",
 ]
 
+CONCEPT_PARTS = ["configurations", "components", "requirements", "architecture"]
+
 PRODUCT_ACCESS_ROUTES = [
     "/components:upload_file",
     "/components:from_file",  # extra
@@ -105,22 +122,52 @@ PRODUCT_ACCESS_ROUTES = [
     "/jobs:start",
 ]
 
-JOB_TIMEOUT = settings.job_timeout
-OCM_URL = settings.ocm_url
-BASE_URL = settings.conceptev_url
-ACCOUNT_NAME = settings.account_name
-app = auth.create_msal_app()
+SETTINGS_CONSTANTS = {
+    "JOB_TIMEOUT": "job_timeout",
+    "OCM_URL": "ocm_url",
+    "BASE_URL": "conceptev_url",
+    "ACCOUNT_NAME": "account_name",
+}
+DATA_FORMAT_VERSION_TTL = 600
+
+data_format_versions = MetadataCache(ttl=DATA_FORMAT_VERSION_TTL)
+default_msal_app: auth.PublicClientApplication | None = None
+
+
+def __getattr__(name: str):
+    """Read the module constants from the settings, and create the MSAL app, on first use."""
+    if name in SETTINGS_CONSTANTS:
+        return getattr(settings, SETTINGS_CONSTANTS[name])
+    if name == "app":
+        return get_default_msal_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_default_msal_app() -> auth.PublicClientApplication:
+    """Get the MSAL app shared by this module, creating it on first use."""
+    global default_msal_app
+    if default_msal_app is None:
+        default_msal_app = auth.create_msal_app()
+    return default_msal_app
 
 
 def get_http_client(
     token: str | None = None,
     design_instance_id: str | None = None,
     cache_filepath: str = "token_cache.bin",
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+    timeout: httpx.Timeout | float | None = None,
+    http2: bool | None = None,
+    retry_policy: RetryPolicy | None = None,
 ) -> httpx.Client:
     """Get an HTTP client.
 
     The HTTP client creates and maintains the connection, which is more performant than
-    re-creating this connection for each call.
+    re-creating this connection for each call. The pool limits, the timeouts and HTTP/2 are
+    taken from the settings unless given. Failed requests are retried by ``retry_policy``, or
+    by the policy of ``retries.default_retry_policy``.
     """
     httpx_auth = auth.AnsysIDAuth(cache_filepath=cache_filepath) if token is None else None
     params = {"design_instance_id": design_instance_id} if design_instance_id else None
@@ -130,15 +177,22 @@ def get_http_client(
         headers=header,
         auth=httpx_auth,
         params=params,
-        base_url=BASE_URL,
-        verify=generate_ssl_context(),
+        base_url=settings.conceptev_url,
+        verify=get_ssl_context(),
+        **client_options(
+            max_connections, max_keepalive_connections, keepalive_expiry, timeout, http2
+        ),
     )
-    client.send = retry(
-        retry=retry_if_result(is_gateway_error),
-        wait=wait_random_exponential(multiplier=1, max=60),
-        stop=stop_after_delay(120),
-    )(client.send)
-    return client
+    return instrumentation.attach(retrying(client, retry_policy))
+
+
+def gateway_retry(send, policy: RetryPolicy | None = None):
+    """Wrap the send method of a client so that failed requests are retried.
+
+    Works for both ``httpx.Client`` and ``httpx.AsyncClient`` send methods. See
+    ``retries.RetryPolicy`` for which requests are retried.
+    """
+    return (default_retry_policy() if policy is None else policy).wrap(send)
 
 
 def get(
@@ -182,12 +236,18 @@ def check_product_access(router: Router, account_id: str | None, params: dict) -
     return params
 
 
-def delete(client: httpx.Client, router: Router, id: str, account_id: str | None = None) -> dict:
+def delete(
+    client: httpx.Client,
+    router: Router,
+    id: str,
+    account_id: str | None = None,
+    params: dict | None = None,
+) -> dict:
     """Send a DELETE request to the base client.
 
     This HTTP verb performs the ``DELETE`` request and adds the route to the base client.
     """
-    params = check_product_access(router, account_id, {})
+    params = check_product_access(router, account_id, params or {})
     path = "/".join([router, id])
     response = client.delete(url=path, params=params)
     if response.status_code != 204:
@@ -209,6 +269,7 @@ def create_new_concept(
     project_id: str,
     product_id: str | None = None,
     title: str | None = None,
+    ocm_session: OCMSession | None = None,
 ) -> dict:
     """Create a concept within an existing project."""
     if title is None:
@@ -216,15 +277,26 @@ def create_new_concept(
 
     token = auth.get_token(client)
     if product_id is None:
-        product_id = get_product_id(token)
+        product_id = get_product_id(token, session=ocm_session)
 
     design_instance_id, design_id = create_design_instance(
-        project_id, title, token, product_id, return_design_id=True
+        project_id, title, token, product_id, return_design_id=True, session=ocm_session
     )
 
-    user_id = get_user_id(token)
+    user_id = get_user_id(token, session=ocm_session)
+
+    concept_data = new_concept_data(project_id, design_id, design_instance_id, user_id)
+    query = {
+        "design_instance_id": design_instance_id,
+    }
+
+    created_concept = post(client, "/concepts", data=concept_data, params=query)
+    return created_concept
+
 
-    concept_data = {
+def new_concept_data(project_id: str, design_id: str, design_instance_id: str, user_id: str):
+    """Get the data for an empty concept in a design instance."""
+    return {
         "capabilities_ids": [],
         "components_ids": [],
         "configurations_ids": [],
@@ -238,13 +310,6 @@ def create_new_concept(
         "user_id": user_id,
     }
 
-    query = {
-        "design_instance_id": design_instance_id,
-    }
-
-    created_concept = post(client, "/concepts", data=concept_data, params=query)
-    return created_concept
-
 
 def get_concept_ids(client: httpx.Client) -> dict:
     """Get concept IDs."""
@@ -263,17 +328,40 @@ def read_results(
     client,
     job_info: dict,
     calculate_units: bool = True,
-    timeout: int = JOB_TIMEOUT,
+    timeout: int | None = None,
     filtered: bool = False,
     msal_app: auth.PublicClientApplication | None = None,
+    ocm_session: OCMSession | None = None,
+    cache: ResultCache | None = None,
+    use_cache: bool = True,
+    version_number: int | None = None,
 ) -> dict:
-    """Read job results."""
+    """Read job results.
+
+    Results held in the result cache are returned without checking the job status.
+    """
     job_id = job_info["job_id"]
+    cache = resolve_result_cache(cache, use_cache)
+    if cache is not None:
+        result = get_cached_results(
+            client, job_info, calculate_units, filtered, cache, version_number
+        )
+        if result is not None:
+            return result
     token = auth.get_token(client)
-    user_id = get_user_id(token)
-    initial_status = get_status(job_info, token)
+    user_id = get_user_id(token, session=ocm_session)
+    initial_status = get_status(job_info, token, session=ocm_session, use_cache=False)
     if check_status(initial_status):  # Job already completed
-        return get_results(client, job_info, calculate_units, filtered)
+        return get_results(
+            client,
+            job_info,
+            calculate_units,
+            filtered,
+            ocm_session=ocm_session,
+            cache=cache,
+            use_cache=use_cache,
+            version_number=version_number,
+        )
     else:  # Job is still running
         if msal_app is None:
             msal_app = auth.create_msal_app()
@@ -281,7 +369,16 @@ def read_results(
 
         token = auth.get_ansyId_token(msal_app)
         client.headers["Authorization"] = token  # Update the token
-        return get_results(client, job_info, calculate_units, filtered)
+        return get_results(
+            client,
+            job_info,
+            calculate_units,
+            filtered,
+            ocm_session=ocm_session,
+            cache=cache,
+            use_cache=use_cache,
+            version_number=version_number,
+        )
 
 
 def post_component_file(client: httpx.Client, filename: str, component_file_type: str) -> dict:
@@ -298,27 +395,50 @@ def post_component_file(client: httpx.Client, filename: str, component_file_type
     return process_response(response)
 
 
-def get_concept(client: httpx.Client, design_instance_id: str) -> dict:
-    """Get the main parts of a concept."""
-    concept = get(
-        client, "/concepts", id=design_instance_id, params={"populated": False}
-    )  # populated True is unsupported at this time.
-    concept["configurations"] = get(client, f"/concepts/{design_instance_id}/configurations")
-    concept["components"] = get(client, f"/concepts/{design_instance_id}/components")
+def get_concept(
+    client: httpx.Client, design_instance_id: str, max_workers: int = len(CONCEPT_PARTS) + 1
+) -> dict:
+    """Get the main parts of a concept.
 
-    concept["requirements"] = get(client, f"/concepts/{design_instance_id}/requirements")
+    The concept and its parts are requested concurrently from a thread pool.
+    """
+    return get_concepts(client, [design_instance_id], max_workers=max_workers)[design_instance_id]
 
-    concept["architecture"] = get(client, f"/concepts/{design_instance_id}/architecture")
-    return concept
+
+def get_concepts(
+    client: httpx.Client, design_instance_ids: Iterable[str], max_workers: int = 8
+) -> dict:
+    """Get the main parts of many concepts.
+
+    All requests share one thread pool, so at most ``max_workers`` requests are in flight at
+    the same time. Returns a dictionary of concepts keyed by design instance ID, each with the
+    same shape as the result of ``get_concept``.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for design_instance_id in design_instance_ids:
+            params = {"design_instance_id": design_instance_id}
+            futures[design_instance_id] = [
+                executor.submit(
+                    get, client, "/concepts", design_instance_id, params | {"populated": False}
+                )  # populated True is unsupported at this time.
+            ] + [
+                executor.submit(get, client, f"/concepts/{design_instance_id}/{part}", None, params)
+                for part in CONCEPT_PARTS
+            ]
+
+        concepts = {}
+        for design_instance_id, (concept_future, *part_futures) in futures.items():
+            concept = concept_future.result()
+            for part, part_future in zip(CONCEPT_PARTS, part_futures):
+                concept[part] = part_future.result()
+            concepts[design_instance_id] = concept
+    return concepts
 
 
 def copy_concept(base_concept_id, design_instance_id, client):
     """Copy the reference concept to the new design instance."""
-    copy = {
-        "old_design_instance_id": base_concept_id,
-        "new_design_instance_id": design_instance_id,
-        "copy_jobs": False,
-    }
+    copy = copy_concept_data(base_concept_id, design_instance_id)
     # Clone the base concept
     params = {"design_instance_id": design_instance_id, "populated": False}
     client.params = params
@@ -326,6 +446,15 @@ def copy_concept(base_concept_id, design_instance_id, client):
     return concept
 
 
+def copy_concept_data(base_concept_id: str, design_instance_id: str) -> dict:
+    """Get the data to copy the reference concept to the new design instance."""
+    return {
+        "old_design_instance_id": base_concept_id,
+        "new_design_instance_id": design_instance_id,
+        "copy_jobs": False,
+    }
+
+
 def create_submit_job(
     client,
     concept: dict,
@@ -334,19 +463,44 @@ def create_submit_job(
     job_name: str | None = None,
     docker_tag: str = "default",
     extra_memory: bool = False,
+    design_instance_id: str | None = None,
 ) -> dict:
-    """Create and then submit a job."""
+    """Create and then submit a job.
+
+    The job is created in the design instance of the client unless a design instance ID is
+    given.
+    """
+    params = {"design_instance_id": design_instance_id} if design_instance_id else {}
+    job_input = job_input_data(concept, job_name)
+    job, uploaded_file = post(client, "/jobs", data=job_input, params=params, account_id=account_id)
+    job_start = job_start_data(job, uploaded_file, account_id, hpc_id, docker_tag, extra_memory)
+    job_info = post(client, "/jobs:start", data=job_start, params=params, account_id=account_id)
+    return job_info
+
+
+def job_input_data(concept: dict, job_name: str | None = None) -> dict:
+    """Get the data to create a job for a concept."""
     if job_name is None:
         job_name = f"cli_job: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}"
-    job_input = {
+    return {
         "job_name": job_name,
         "requirement_ids": concept["requirements_ids"],
         "architecture_id": concept["architecture_id"],
         "concept_id": concept["id"],
         "design_instance_id": concept["design_instance_id"],
     }
-    job, uploaded_file = post(client, "/jobs", data=job_input, account_id=account_id)
-    job_start = {
+
+
+def job_start_data(
+    job: dict,
+    uploaded_file: dict,
+    account_id: str,
+    hpc_id: str,
+    docker_tag: str = "default",
+    extra_memory: bool = False,
+) -> dict:
+    """Get the data to start a created job."""
+    return {
         "job": job,
         "uploaded_file": uploaded_file,
         "account_id": account_id,
@@ -354,8 +508,6 @@ def create_submit_job(
         "docker_tag": docker_tag,
         "extra_memory": extra_memory,
     }
-    job_info = post(client, "/jobs:start", data=job_start, account_id=account_id)
-    return job_info
 
 
 def get_results(
@@ -363,6 +515,11 @@ def get_results(
     job_info: dict,
     calculate_units: bool = True,
     filtered: bool = False,
+    ocm_session: OCMSession | None = None,
+    cache: ResultCache | None = None,
+    use_cache: bool = True,
+    version_number: int | None = None,
+    design_instance_id: str | None = None,
 ):
     """Get the results for a completed job.
 
@@ -373,32 +530,94 @@ def get_results(
 
     When ``calculate_units=True`` (default), falls back to the API server's
     ``/jobs:result`` endpoint which performs server-side unit calculation.
+
+    Results are read from and stored in ``cache``, or in the cache configured by
+    the ``result_cache_dir`` setting, unless ``use_cache=False``. The data format
+    version is looked up with ``get_data_format_version`` unless ``version_number``
+    is given.
     """
-    version_number = get(client, "/utilities:data_format_version")
-    if filtered:
-        filename = f"filtered_output_v{version_number}.json"
-    else:
-        filename = f"output_file_v{version_number}.json"
+    cache = resolve_result_cache(cache, use_cache)
+    if version_number is None:
+        version_number = get_data_format_version(client)
+    filename = results_file_name(version_number, filtered)
+    key = ResultCache.key(job_info["job_id"], filename, calculate_units, filtered)
+    if cache is not None:
+        result = cache.get(key)
+        if result is not None:
+            return result
 
     if calculate_units:
+        params = {"design_instance_id": design_instance_id} if design_instance_id else {}
         response = client.post(
             url="/jobs:result",
             json=job_info,
             params={
+                **params,
                 "results_file_name": filename,
                 "calculate_units": calculate_units,
             },
         )
-        return process_response(response)
+        result = process_response(response)
+    else:
+        token = auth.get_token(client)
+        result = get_job_file_signed_url(token, job_info["job_id"], filename, session=ocm_session)
+    if cache is not None:
+        cache.set(key, result)
+    return result
 
-    token = auth.get_token(client)
-    return get_job_file_signed_url(token, job_info["job_id"], filename)
+
+def get_cached_results(
+    client: httpx.Client,
+    job_info: dict,
+    calculate_units: bool,
+    filtered: bool,
+    cache: ResultCache,
+    version_number: int | None = None,
+):
+    """Get the results of a job from the cache or ``None`` if they are not cached."""
+    if version_number is None:
+        version_number = get_data_format_version(client)
+    filename = results_file_name(version_number, filtered)
+    return cache.get(ResultCache.key(job_info["job_id"], filename, calculate_units, filtered))
+
+
+def get_data_format_version(client: httpx.Client, use_cache: bool = True) -> int:
+    """Get the data format version of the result files.
+
+    The version is kept per base URL for ``DATA_FORMAT_VERSION_TTL`` seconds.
+    """
+    key = (str(client.base_url),)
+    version_number = data_format_versions.get(key) if use_cache else None
+    if version_number is None:
+        version_number = get(client, "/utilities:data_format_version")
+        data_format_versions.set(key, version_number)
+    return version_number
+
+
+def clear_data_format_version_cache() -> None:
+    """Clear the cached data format versions."""
+    data_format_versions.invalidate()
+
+
+def results_file_name(version_number: int, filtered: bool = False) -> str:
+    """Get the name of the results file for a data format version."""
+    if filtered:
+        return f"filtered_output_v{version_number}.json"
+    return f"output_file_v{version_number}.json"
 
 
 def get_component_id_map(client, design_instance_id):
     """Get a map of component name to component id."""
     ###TODO move to results file so its self contained.
-    components = client.get(f"/concepts/{design_instance_id}/components")
+    components = client.get(
+        f"/concepts/{design_instance_id}/components",
+        params={"design_instance_id": design_instance_id},
+    )
     components = process_response(components)
+    return component_id_map(components)
+
+
+def component_id_map(components: list) -> dict:
+    """Map component names to component IDs, including an empty slot."""
     components.append({"name": "N/A", "id": None})
     return {component["name"]: component["id"] for component in components}
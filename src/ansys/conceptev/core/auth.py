@@ -22,28 +22,52 @@
 
 """Authentication for AnsysID."""
 
+import asyncio
+import base64
+import json
 import logging
+import sys
+import threading
+import time
 
 import httpx
 from msal import PublicClientApplication
 from msal_extensions import FilePersistence, build_encrypted_persistence, token_cache
 
 from ansys.conceptev.core.exceptions import TokenError
+from ansys.conceptev.core.instrumentation import add_auth_time, count_reauth
 from ansys.conceptev.core.settings import settings
 
 logger = logging.getLogger(__name__)
-scope = settings.scope
-client_id = settings.client_id
-authority = settings.authority
-USERNAME = settings.conceptev_username
-PASSWORD = settings.conceptev_password
+SETTINGS_CONSTANTS = {
+    "scope": "scope",
+    "client_id": "client_id",
+    "authority": "authority",
+    "USERNAME": "conceptev_username",
+    "PASSWORD": "conceptev_password",
+}
+
+
+def __getattr__(name: str):
+    """Read the module constants from the settings on first use."""
+    if name in SETTINGS_CONSTANTS:
+        return getattr(settings, SETTINGS_CONSTANTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_credentials() -> tuple[str | None, str | None]:
+    """Get the username and password, from the settings unless set on this module."""
+    module = sys.modules[__name__]
+    return module.USERNAME, module.PASSWORD
 
 
 def create_msal_app(cache_filepath="token_cache.bin") -> PublicClientApplication:
     """Create MSAL App with a persistent cache."""
     persistence = build_persistence(cache_filepath)
     cache = token_cache.PersistedTokenCache(persistence)
-    app = PublicClientApplication(client_id=client_id, authority=authority, token_cache=cache)
+    app = PublicClientApplication(
+        client_id=settings.client_id, authority=settings.authority, token_cache=cache
+    )
     return app
 
 
@@ -61,6 +85,8 @@ def build_persistence(location, fallback_to_plaintext=True):
 def get_ansyId_token(app, force=False) -> str:
     """Get token from AnsysID."""
     result = None
+    scope = settings.scope
+    username, password = get_credentials()
     accounts = app.get_accounts()
     if accounts and not force:
         # Assuming the end user chose this one
@@ -68,10 +94,10 @@ def get_ansyId_token(app, force=False) -> str:
         # Now let's try to find a token in cache for this account
         logger.info("Trying to acquire token silently")
         result = app.acquire_token_silent(scopes=[scope], account=chosen)
-    if not result and USERNAME and PASSWORD:
+    if not result and username and password:
         logger.info("Trying to acquire token with username and password")
         result = app.acquire_token_by_username_password(
-            username=USERNAME, password=PASSWORD, scopes=[scope]
+            username=username, password=password, scopes=[scope]
         )
     if not result:
         logger.info("Trying to acquire token interactively")
@@ -85,31 +111,114 @@ def get_ansyId_token(app, force=False) -> str:
     raise Exception(f"Failed to get token {error}, {error_description}, {correlation_id}.")
 
 
+def get_token_claims(token: str) -> dict:
+    """Read the claims of a JSON Web Token without verifying it.
+
+    Returns an empty dictionary if the token is not a JSON Web Token.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, ValueError):
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+def get_token_expiry(token: str) -> float | None:
+    """Get the expiry time of a token as a POSIX timestamp, if the token has one."""
+    expiry = get_token_claims(token).get("exp")
+    return float(expiry) if isinstance(expiry, (int, float)) else None
+
+
 class AnsysIDAuth(httpx.Auth):
     """Custom Auth implementation for httpx.
 
     This class is used to authenticate requests to AnsysID using MSAL.
+
+    The access token is kept in memory with its expiry time, so most requests do not go to the
+    MSAL token cache at all. The token is refreshed when it is within ``refresh_margin`` seconds
+    of expiring, or when a request is rejected with a 401. Refreshes are done by one thread at a
+    time and other threads reuse the refreshed token. Tokens without an expiry claim are not
+    kept and are fetched from MSAL for every request.
     """
 
-    def __init__(self, cache_filepath="token_cache.bin"):
+    def __init__(self, cache_filepath="token_cache.bin", refresh_margin: float = 300):
         """Initialize the AnsysIDAuth class."""
         app = create_msal_app(cache_filepath=cache_filepath)
         self.app = app
+        self.refresh_margin = refresh_margin
+        self.cached_token: tuple[str, float] | None = None
+        self.lock = threading.Lock()
+
+    def cached(self) -> str | None:
+        """Get the token in memory if it is not close to expiry."""
+        cached_token = self.cached_token
+        if cached_token is not None:
+            token, expires_at = cached_token
+            if time.time() < expires_at - self.refresh_margin:
+                return token
+        return None
+
+    def get_token(self, force: bool = False, rejected: str | None = None) -> str:
+        """Get a valid token, refreshing it from MSAL if needed.
+
+        When ``rejected`` is given, the token is only refreshed if it is still the token in
+        memory, so that concurrent 401 responses cause a single refresh.
+        """
+        if not force and (token := self.cached()) is not None:
+            return token
+        with self.lock:
+            cached_token = self.cached_token
+            if rejected is not None and cached_token and cached_token[0] != rejected:
+                return cached_token[0]
+            if not force and (token := self.cached()) is not None:
+                return token
+            token = get_ansyId_token(self.app, force=force)
+            expires_at = get_token_expiry(token)
+            self.cached_token = (token, expires_at) if expires_at is not None else None
+            return token
 
     def auth_flow(self, request):
         """Send the request, with a custom `Authentication` header."""
-        token = get_ansyId_token(self.app)
+        start = time.perf_counter()
+        token = self.get_token()
+        add_auth_time(request, time.perf_counter() - start)
+        request.headers["Authorization"] = token
+        response = yield request
+        if response.status_code == 401:
+            logger.info("Token expired or rejected (401). Refreshing token and retrying.")
+            start = time.perf_counter()
+            token = self.get_token(force=True, rejected=token)
+            add_auth_time(request, time.perf_counter() - start)
+            count_reauth(request)
+            request.headers["Authorization"] = token
+            yield request
+
+    async def async_auth_flow(self, request):
+        """Send the request from an async client, refreshing the token in a worker thread.
+
+        Refreshes take the lock and call MSAL, so they are kept off the event loop.
+        """
+        start = time.perf_counter()
+        token = self.cached() or await asyncio.to_thread(self.get_token)
+        add_auth_time(request, time.perf_counter() - start)
         request.headers["Authorization"] = token
         response = yield request
         if response.status_code == 401:
             logger.info("Token expired or rejected (401). Refreshing token and retrying.")
-            token = get_ansyId_token(self.app, force=True)
+            start = time.perf_counter()
+            token = await asyncio.to_thread(self.get_token, force=True, rejected=token)
+            add_auth_time(request, time.perf_counter() - start)
+            count_reauth(request)
             request.headers["Authorization"] = token
             yield request
 
 
 def get_token(client: httpx.Client) -> str:
     """Get the token from the client."""
+    if isinstance(client.auth, AnsysIDAuth):
+        return client.auth.get_token()
     if client.auth is not None and client.auth.app is not None:
         return get_ansyId_token(client.auth.app)
     elif client.headers is not None and "Authorization" in client.headers:
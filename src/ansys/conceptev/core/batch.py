@@ -0,0 +1,292 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Bulk operations on many concepts with bounded parallelism."""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+import httpx
+
+from ansys.conceptev.core import app, auth
+from ansys.conceptev.core.ocm import (
+    OCMSession,
+    create_design_instance,
+    delete_project,
+    get_account_id,
+    get_default_hpc,
+    get_product_id,
+)
+from ansys.conceptev.core.result_cache import ResultCache
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one item of a batch operation.
+
+    ``result`` holds the value produced for the item, for example the job info of a submitted
+    job, and ``error`` holds the exception raised if the item failed. ``concept`` is the concept
+    the item worked on, when one was created or copied before the failure, and ``job_info`` the
+    job submitted for it, when there is one. ``design_instance_id`` is the design instance
+    created for the item, which is kept even when copying the concept into it failed.
+    """
+
+    item: Any
+    result: Any = None
+    error: Exception | None = None
+    concept: dict | None = None
+    job_info: dict | None = None
+    design_instance_id: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item completed without an error."""
+        return self.error is None
+
+
+def run_batch(
+    function: Callable[[Any], BatchResult], items: Iterable, max_workers: int
+) -> list[BatchResult]:
+    """Run a function on every item in a thread pool.
+
+    Exceptions raised by the function are stored on the result of the item so that one failure
+    does not stop the rest of the batch. Results are returned in the order of the items.
+    """
+
+    def run_item(item):
+        try:
+            return function(item)
+        except Exception as err:
+            return BatchResult(item, error=err)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_item, items))
+
+
+def submit_batch(
+    client: httpx.Client,
+    project_id: str,
+    base_concept_id: str,
+    specs: Iterable[dict],
+    account_id: str | None = None,
+    hpc_id: str | None = None,
+    product_id: str | None = None,
+    max_workers: int = 8,
+    docker_tag: str = "default",
+    extra_memory: bool = False,
+    ocm_session: OCMSession | None = None,
+) -> list[BatchResult]:
+    """Copy a base concept once per specification and submit a job for each copy.
+
+    Each specification is a dictionary with these keys:
+
+    - ``title``: Title of the new design instance.
+    - ``architecture`` (optional): Either the architecture data to post, or a function that
+      takes the component name to ID map of the copied concept and returns the architecture
+      data. Component IDs change when a concept is copied, so use a function to refer to
+      components by name.
+    - ``job_name`` (optional): Name of the job.
+
+    The account, HPC and product IDs are looked up once for the whole batch if not given. Up to
+    ``max_workers`` specifications are processed at the same time, so the stages of different
+    specifications overlap. Returns one ``BatchResult`` per specification, in order, holding
+    the job info or the error.
+    """
+    token = auth.get_token(client)
+    with OCMSession() if ocm_session is None else nullcontext(ocm_session) as session:
+        if account_id is None:
+            account_id = get_account_id(token, session=session)
+        if hpc_id is None:
+            hpc_id = get_default_hpc(token, account_id, session=session)
+        if product_id is None:
+            product_id = get_product_id(token, session=session)
+
+        def submit(spec: dict) -> BatchResult:
+            design_instance_id = create_design_instance(
+                project_id, spec["title"], token, product_id=product_id, session=session
+            )
+            concept = None
+            try:
+                concept = copy_base_concept(client, base_concept_id, design_instance_id)
+                params = {"design_instance_id": concept["design_instance_id"]}
+                architecture = spec.get("architecture")
+                if callable(architecture):
+                    components = app.get_component_id_map(client, concept["design_instance_id"])
+                    architecture = architecture(components)
+                if architecture is not None:
+                    created = app.post(client, "/architectures", data=architecture, params=params)
+                    concept["architecture_id"] = created["id"]
+                job_info = app.create_submit_job(
+                    client,
+                    concept,
+                    account_id,
+                    hpc_id,
+                    job_name=spec.get("job_name"),
+                    docker_tag=docker_tag,
+                    extra_memory=extra_memory,
+                    design_instance_id=concept["design_instance_id"],
+                )
+            except Exception as err:
+                return BatchResult(
+                    spec, error=err, concept=concept, design_instance_id=design_instance_id
+                )
+            return BatchResult(
+                spec, result=job_info, concept=concept, design_instance_id=design_instance_id
+            )
+
+        return run_batch(submit, specs, max_workers)
+
+
+def get_results_batch(
+    client: httpx.Client,
+    job_infos: Iterable[dict],
+    design_instance_ids: Iterable[str | None] | None = None,
+    calculate_units: bool = True,
+    filtered: bool = False,
+    max_workers: int = 8,
+    version_number: int | None = None,
+    ocm_session: OCMSession | None = None,
+    cache: ResultCache | None = None,
+) -> list[BatchResult]:
+    """Get the results of many completed jobs.
+
+    The data format version is resolved once for the whole batch. Pass the design instance of
+    each job in ``design_instance_ids`` to request results for jobs of different concepts with
+    one client. Returns one ``BatchResult`` per job info, in order, holding the results or the
+    error.
+    """
+    job_infos = list(job_infos)
+    if design_instance_ids is None:
+        design_instance_ids = [None] * len(job_infos)
+    if version_number is None:
+        version_number = app.get_data_format_version(client)
+    with OCMSession() if ocm_session is None else nullcontext(ocm_session) as session:
+
+        def fetch(item: tuple[dict, str | None]) -> BatchResult:
+            job_info, design_instance_id = item
+            try:
+                results = app.get_results(
+                    client,
+                    job_info,
+                    calculate_units,
+                    filtered,
+                    ocm_session=session,
+                    cache=cache,
+                    version_number=version_number,
+                    design_instance_id=design_instance_id,
+                )
+            except Exception as err:
+                return BatchResult(job_info, error=err)
+            return BatchResult(job_info, result=results)
+
+        return run_batch(fetch, zip(job_infos, design_instance_ids), max_workers)
+
+
+def clone_concepts(
+    client: httpx.Client,
+    project_id: str,
+    base_concept_id: str,
+    titles: Iterable[str],
+    product_id: str | None = None,
+    max_workers: int = 8,
+    ocm_session: OCMSession | None = None,
+) -> list[BatchResult]:
+    """Copy a base concept into a new design instance for each title.
+
+    The product ID is looked up once for the whole batch if not given. Up to ``max_workers``
+    copies are made at the same time. Returns one ``BatchResult`` per title, in order, holding
+    the copied concept or the error.
+    """
+    token = auth.get_token(client)
+    with OCMSession() if ocm_session is None else nullcontext(ocm_session) as session:
+        if product_id is None:
+            product_id = get_product_id(token, session=session)
+
+        def clone(title: str) -> BatchResult:
+            design_instance_id = create_design_instance(
+                project_id, title, token, product_id=product_id, session=session
+            )
+            try:
+                concept = copy_base_concept(client, base_concept_id, design_instance_id)
+            except Exception as err:
+                return BatchResult(title, error=err, design_instance_id=design_instance_id)
+            return BatchResult(
+                title, result=concept, concept=concept, design_instance_id=design_instance_id
+            )
+
+        return run_batch(clone, titles, max_workers)
+
+
+def delete_concepts(
+    client: httpx.Client, concepts: Iterable[dict], max_workers: int = 8
+) -> list[BatchResult]:
+    """Delete many concepts.
+
+    Each concept is a dictionary with the ``id`` and ``design_instance_id`` of the concept, as
+    returned by ``clone_concepts`` or ``submit_batch``. Without an ``id``, every concept found
+    in the design instance is deleted, which cleans up instances whose copy failed. The client
+    parameters are not changed, so the client can be shared between threads. Returns one
+    ``BatchResult`` per concept, in order, holding the error if the concept could not be
+    deleted.
+    """
+
+    def delete(concept: dict) -> BatchResult:
+        params = {"design_instance_id": concept["design_instance_id"]}
+        if "id" in concept:
+            concept_ids = [concept["id"]]
+        else:
+            concept_ids = [found["id"] for found in app.get(client, "/concepts", params=params)]
+        for concept_id in concept_ids:
+            app.delete(client, "/concepts", concept_id, params=params)
+        return BatchResult(concept, concept=concept)
+
+    return run_batch(delete, concepts, max_workers)
+
+
+def delete_projects(
+    token: str,
+    project_ids: Iterable[str],
+    max_workers: int = 8,
+    ocm_session: OCMSession | None = None,
+) -> list[BatchResult]:
+    """Delete many projects and everything in them.
+
+    The projects are deleted at the same time over one pooled OCM session. Returns one
+    ``BatchResult`` per project ID, in order, holding the OCM response or the error.
+    """
+    with OCMSession() if ocm_session is None else nullcontext(ocm_session) as session:
+
+        def delete(project_id: str) -> BatchResult:
+            return BatchResult(project_id, result=delete_project(project_id, token, session))
+
+        return run_batch(delete, project_ids, max_workers)
+
+
+def copy_base_concept(client: httpx.Client, base_concept_id: str, design_instance_id: str) -> dict:
+    """Copy the base concept into a design instance.
+
+    The client parameters are not changed, so the client can be shared between threads.
+    """
+    copy = app.copy_concept_data(base_concept_id, design_instance_id)
+    params = {"design_instance_id": design_instance_id, "populated": False}
+    return app.post(client, "/concepts:copy", data=copy, params=params)
@@ -0,0 +1,103 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Connection pool, timeout and HTTP/2 options shared by the HTTP clients."""
+import logging
+
+import httpx
+
+from ansys.conceptev.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def client_limits(
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+) -> httpx.Limits:
+    """Get the connection pool limits, using the settings for any limit not given."""
+    return httpx.Limits(
+        max_connections=(
+            settings.http_max_connections if max_connections is None else max_connections
+        ),
+        max_keepalive_connections=(
+            settings.http_max_keepalive_connections
+            if max_keepalive_connections is None
+            else max_keepalive_connections
+        ),
+        keepalive_expiry=(
+            settings.http_keepalive_expiry if keepalive_expiry is None else keepalive_expiry
+        ),
+    )
+
+
+def client_timeout(timeout: httpx.Timeout | float | None = None) -> httpx.Timeout:
+    """Get the timeout of each phase of a request, using the settings unless one is given."""
+    if timeout is not None:
+        return httpx.Timeout(timeout)
+    return httpx.Timeout(
+        connect=settings.http_connect_timeout,
+        read=settings.http_read_timeout,
+        write=settings.http_write_timeout,
+        pool=settings.http_pool_timeout,
+    )
+
+
+def http2_available() -> bool:
+    """Check whether the ``h2`` package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def use_http2(http2: bool | None = None) -> bool:
+    """Decide whether to use HTTP/2, using the settings unless a choice is given.
+
+    Falls back to HTTP/1.1 with a warning if HTTP/2 is asked for but ``h2`` is not installed.
+    Install it with the ``http2`` extra: ``pip install ansys-conceptev-core[http2]``.
+    """
+    if http2 is None:
+        http2 = settings.http2
+    if http2 and not http2_available():
+        logger.warning(
+            "HTTP/2 needs the h2 package, which is not installed. Using HTTP/1.1 instead. "
+            "Install it with pip install ansys-conceptev-core[http2]."
+        )
+        return False
+    return http2
+
+
+def client_options(
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+    timeout: httpx.Timeout | float | None = None,
+    http2: bool | None = None,
+) -> dict:
+    """Get the keyword arguments that configure the connections of an ``httpx`` client."""
+    return {
+        "limits": client_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+        "timeout": client_timeout(timeout),
+        "http2": use_http2(http2),
+    }
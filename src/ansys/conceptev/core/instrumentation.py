@@ -0,0 +1,353 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Opt-in timing of the HTTP requests sent to ConceptEV, OCM and S3.
+
+Register a sink, a function taking a ``RequestRecord``, before creating clients and every
+request they send is recorded once it completes:
+
+.. code-block:: python
+
+   from ansys.conceptev.core import app, instrumentation
+
+   with instrumentation.recording() as recorder:
+       with app.get_http_client() as client:
+           ...
+   recorder.to_csv("timings.csv", summary=True)
+"""
+from contextlib import contextmanager
+import csv
+from dataclasses import asdict, dataclass, fields
+import functools
+import json
+import math
+import re
+import threading
+import time
+from typing import Callable, Iterator
+
+import httpx
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+TIMING_EXTENSION = "conceptev_timing"
+SUMMARY_COLUMNS = (
+    "route",
+    "count",
+    "failed",
+    "retries",
+    "total_seconds",
+    "mean_seconds",
+    "p50_seconds",
+    "p95_seconds",
+    "max_seconds",
+    "auth_seconds",
+    "bytes_sent",
+    "bytes_received",
+)
+ID_SEGMENT = re.compile(r"^([0-9a-fA-F]{8}-[0-9a-fA-F-]{27}|[0-9a-fA-F]{16,}|\d+)$")
+
+
+@dataclass
+class RequestRecord:
+    """Timing and size of one request, including its retries.
+
+    ``latency`` is the time in seconds from sending the request until the response was
+    received, covering retries, token refreshes and, unless the response is streamed, reading
+    the body. ``auth_seconds`` is the part of it spent getting a token. ``reauths`` counts the
+    times the request was sent again with a new token after a 401, which are not retries.
+    """
+
+    method: str
+    host: str
+    route: str
+    status: int | None
+    latency: float
+    retries: int = 0
+    auth_seconds: float = 0.0
+    reauths: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    error: str | None = None
+    started: float = 0.0
+
+    @property
+    def key(self) -> str:
+        """Get the method and route the record is aggregated under."""
+        return f"{self.method} {self.route}"
+
+    @property
+    def failed(self) -> bool:
+        """Whether the request raised an error or got an error status."""
+        return self.status is None or self.status >= 400
+
+
+Sink = Callable[[RequestRecord], None]
+
+sinks: list[Sink] = []
+sinks_lock = threading.Lock()
+
+
+def add_sink(sink: Sink) -> None:
+    """Start sending request records to a sink."""
+    with sinks_lock:
+        sinks.append(sink)
+
+
+def remove_sink(sink: Sink) -> None:
+    """Stop sending request records to a sink."""
+    with sinks_lock:
+        if sink in sinks:
+            sinks.remove(sink)
+
+
+def emit(record: RequestRecord) -> None:
+    """Send a record to every registered sink."""
+    with sinks_lock:
+        targets = list(sinks)
+    for sink in targets:
+        sink(record)
+
+
+def route_of(url: httpx.URL) -> str:
+    """Get the path of a URL with IDs replaced by ``{id}``."""
+    segments = url.path.split("/")
+    return "/".join("{id}" if ID_SEGMENT.match(segment) else segment for segment in segments)
+
+
+def timing_of(request: httpx.Request) -> dict:
+    """Get the timing details stored on a request."""
+    return request.extensions.setdefault(
+        TIMING_EXTENSION, {"attempts": 0, "auth_seconds": 0.0, "reauths": 0}
+    )
+
+
+def add_auth_time(request: httpx.Request, seconds: float) -> None:
+    """Add time spent getting a token for a request."""
+    timing_of(request)["auth_seconds"] += seconds
+
+
+def count_reauth(request: httpx.Request) -> None:
+    """Count one re-send of a request with a new token, so that it is not counted as a retry."""
+    timing_of(request)["reauths"] += 1
+
+
+def count_attempt(request: httpx.Request) -> None:
+    """Count one attempt at sending a request."""
+    timing_of(request)["attempts"] += 1
+
+
+async def count_attempt_async(request: httpx.Request) -> None:
+    """Count one attempt at sending a request from an asynchronous client."""
+    count_attempt(request)
+
+
+def make_record(
+    request: httpx.Request,
+    response: httpx.Response | None,
+    error: str | None,
+    started: float,
+    latency: float,
+) -> RequestRecord:
+    """Build the record of a completed request."""
+    timing = timing_of(request)
+    bytes_received = 0
+    if response is not None:
+        bytes_received = response.num_bytes_downloaded or int(
+            response.headers.get("Content-Length", 0)
+        )
+    return RequestRecord(
+        method=request.method,
+        host=request.url.host,
+        route=route_of(request.url),
+        status=None if response is None else response.status_code,
+        latency=latency,
+        retries=max(timing["attempts"] - timing["reauths"] - 1, 0),
+        auth_seconds=timing["auth_seconds"],
+        reauths=timing["reauths"],
+        bytes_sent=int(request.headers.get("Content-Length", 0)),
+        bytes_received=bytes_received,
+        error=error,
+        started=started,
+    )
+
+
+def timed_send(send):
+    """Wrap the send method of a synchronous client so that each request is recorded."""
+
+    @functools.wraps(send)
+    def send_and_record(request: httpx.Request, **kwargs) -> httpx.Response:
+        started, start = time.time(), time.perf_counter()
+        response, error = None, None
+        try:
+            response = send(request, **kwargs)
+            return response
+        except Exception as err:
+            error = type(err).__name__
+            raise
+        finally:
+            emit(make_record(request, response, error, started, time.perf_counter() - start))
+
+    return send_and_record
+
+
+def timed_async_send(send):
+    """Wrap the send method of an asynchronous client so that each request is recorded."""
+
+    @functools.wraps(send)
+    async def send_and_record(request: httpx.Request, **kwargs) -> httpx.Response:
+        started, start = time.time(), time.perf_counter()
+        response, error = None, None
+        try:
+            response = await send(request, **kwargs)
+            return response
+        except Exception as err:
+            error = type(err).__name__
+            raise
+        finally:
+            emit(make_record(request, response, error, started, time.perf_counter() - start))
+
+    return send_and_record
+
+
+def instrument(client: httpx.Client | httpx.AsyncClient) -> httpx.Client | httpx.AsyncClient:
+    """Record every request sent by a client.
+
+    Wraps ``send`` so that retries done by an earlier wrapper are included in one record, and
+    adds an event hook counting the attempts.
+    """
+    if isinstance(client, httpx.AsyncClient):
+        client.event_hooks["request"].append(count_attempt_async)
+        client.send = timed_async_send(client.send)
+    else:
+        client.event_hooks["request"].append(count_attempt)
+        client.send = timed_send(client.send)
+    return client
+
+
+def attach(client: httpx.Client | httpx.AsyncClient) -> httpx.Client | httpx.AsyncClient:
+    """Instrument a client if a sink is registered, otherwise leave it unchanged."""
+    return instrument(client) if sinks else client
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Get a percentile of sorted values by the nearest rank method."""
+    return values[max(math.ceil(fraction * len(values)) - 1, 0)]
+
+
+class Recorder:
+    """Sink keeping request records in memory, with per-route aggregation and export."""
+
+    def __init__(self):
+        """Initialize an empty recorder."""
+        self.records: list[RequestRecord] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, record: RequestRecord) -> None:
+        """Keep a record."""
+        with self.lock:
+            self.records.append(record)
+
+    def clear(self) -> None:
+        """Remove all records."""
+        with self.lock:
+            self.records.clear()
+
+    def by_route(self) -> dict[str, list[RequestRecord]]:
+        """Group the records by method and route."""
+        with self.lock:
+            records = list(self.records)
+        routes: dict[str, list[RequestRecord]] = {}
+        for record in records:
+            routes.setdefault(record.key, []).append(record)
+        return routes
+
+    def summary(self) -> dict[str, dict]:
+        """Get the count, failures, retries, latency statistics and bytes of each route."""
+        summary = {}
+        for key, records in sorted(self.by_route().items()):
+            latencies = sorted(record.latency for record in records)
+            summary[key] = {
+                "count": len(records),
+                "failed": sum(record.failed for record in records),
+                "retries": sum(record.retries for record in records),
+                "total_seconds": sum(latencies),
+                "mean_seconds": sum(latencies) / len(latencies),
+                "p50_seconds": percentile(latencies, 0.5),
+                "p95_seconds": percentile(latencies, 0.95),
+                "max_seconds": latencies[-1],
+                "auth_seconds": sum(record.auth_seconds for record in records),
+                "bytes_sent": sum(record.bytes_sent for record in records),
+                "bytes_received": sum(record.bytes_received for record in records),
+            }
+        return summary
+
+    def histograms(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> dict[str, dict]:
+        """Count the requests of each route by latency bucket.
+
+        Each request is counted in the first bucket whose upper bound in seconds is at least its
+        latency, or in the ``inf`` bucket.
+        """
+        histograms = {}
+        for key, records in sorted(self.by_route().items()):
+            counts = {f"le_{bound:g}": 0 for bound in buckets} | {"inf": 0}
+            for record in records:
+                bound = next((bound for bound in buckets if record.latency <= bound), None)
+                counts["inf" if bound is None else f"le_{bound:g}"] += 1
+            histograms[key] = counts
+        return histograms
+
+    def to_json(self, path, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Write the records, the route summary and the histograms to a JSON file."""
+        with self.lock:
+            records = [asdict(record) for record in self.records]
+        data = {
+            "records": records,
+            "summary": self.summary(),
+            "histograms": self.histograms(buckets),
+        }
+        with open(path, "w") as file:
+            json.dump(data, file, indent=2)
+
+    def to_csv(self, path, summary: bool = False) -> None:
+        """Write one row per record, or per route if ``summary=True``, to a CSV file."""
+        if summary:
+            rows = [{"route": key} | values for key, values in self.summary().items()]
+            columns = list(SUMMARY_COLUMNS)
+        else:
+            with self.lock:
+                rows = [asdict(record) for record in self.records]
+            columns = [field.name for field in fields(RequestRecord)]
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+@contextmanager
+def recording() -> Iterator[Recorder]:
+    """Record the requests of clients created within the context."""
+    recorder = Recorder()
+    add_sink(recorder)
+    try:
+        yield recorder
+    finally:
+        remove_sink(recorder)
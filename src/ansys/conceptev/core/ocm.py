@@ -22,14 +22,25 @@
 
 """Projects/OCM Specific functionality."""
 
-from collections import defaultdict
+import codecs
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 import datetime
+import itertools
 import json
-import re
+import math
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator
 
 import httpx
 
+from ansys.conceptev.core import instrumentation
 import ansys.conceptev.core.auth as auth
+from ansys.conceptev.core.connections import client_options
 from ansys.conceptev.core.exceptions import (
     AccountsError,
     DesignError,
@@ -38,29 +49,221 @@ from ansys.conceptev.core.exceptions import (
     ResponseError,
     UserDetailsError,
 )
-from ansys.conceptev.core.progress import generate_ssl_context
+from ansys.conceptev.core.progress import FINAL_STATUSES, get_ssl_context
 from ansys.conceptev.core.responses import process_response
+from ansys.conceptev.core.retries import RetryPolicy, retrying
 from ansys.conceptev.core.settings import settings
 
-OCM_URL = settings.ocm_url
-ACCOUNT_NAME = settings.account_name
+SETTINGS_CONSTANTS = {"OCM_URL": "ocm_url", "ACCOUNT_NAME": "account_name"}
+METADATA_CACHE_TTL = 3600
+PROJECT_INDEX_TTL = 300
+JOB_RECORD_TTL = 10
+METADATA_CACHE_MAX_ENTRIES = 4096
+CACHE_PURGE_INTERVAL = 1.0
+PROJECT_PAGE_SIZE = 1000
+PROJECT_TOTAL_KEY = "totalCount"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
-def create_ocm_client(token) -> httpx.Client:
-    """Create an OCM client."""
+def __getattr__(name: str):
+    """Read the module constants from the settings on first use."""
+    if name in SETTINGS_CONSTANTS:
+        return getattr(settings, SETTINGS_CONSTANTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class MetadataCache:
+    """Time-limited cache of OCM lookups that do not change within a session.
+
+    Values are keyed by the lookup name, the subject of the token and the lookup arguments, so
+    different users never share values and a refreshed token for the same user still hits the
+    cache. Expired values are removed when values are stored, at most every
+    ``CACHE_PURGE_INTERVAL`` seconds, and the least recently used values are dropped beyond
+    ``max_entries``.
+    """
+
+    def __init__(
+        self, ttl: float = METADATA_CACHE_TTL, max_entries: int = METADATA_CACHE_MAX_ENTRIES
+    ):
+        """Initialize an empty cache."""
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.values: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self.purged_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def key(self, name: str, token: str, *args) -> tuple:
+        """Get the cache key of a lookup."""
+        subject = auth.get_token_claims(token).get("sub") or token
+        return (name, subject, *args)
+
+    def get(self, key: tuple) -> Any:
+        """Get a cached value, or ``None`` if it is missing or expired."""
+        now = time.monotonic()
+        with self.lock:
+            expires_at, value = self.values.get(key, (0, None))
+            if now >= expires_at:
+                self.values.pop(key, None)
+                return None
+            self.values.move_to_end(key)
+            return value
+
+    def set(self, key: tuple, value: Any, ttl: float | None = None) -> None:
+        """Store a value until the time to live, or the given ``ttl``, has passed."""
+        now = time.monotonic()
+        with self.lock:
+            self.values[key] = (now + (self.ttl if ttl is None else ttl), value)
+            self.values.move_to_end(key)
+            if now - self.purged_at >= CACHE_PURGE_INTERVAL:
+                self.purged_at = now
+                for expired in [
+                    k for k, (expires_at, _) in self.values.items() if now >= expires_at
+                ]:
+                    del self.values[expired]
+            while len(self.values) > self.max_entries:
+                self.values.popitem(last=False)
+
+    def invalidate(self, token: str | None = None) -> None:
+        """Remove the values of the user of a token, or all values if no token is given."""
+        with self.lock:
+            if token is None:
+                self.values.clear()
+                return
+            subject = self.key("", token)[1]
+            self.values = OrderedDict(
+                (key, entry) for key, entry in self.values.items() if key[1] != subject
+            )
+
+
+metadata_cache = MetadataCache()
+project_indexes = MetadataCache(ttl=PROJECT_INDEX_TTL)
+job_records = MetadataCache(ttl=JOB_RECORD_TTL)
+
+
+def clear_metadata_cache(token: str | None = None) -> None:
+    """Clear the cached product, user, account and HPC IDs, project indexes and job records.
+
+    Only the values of the user of the token are cleared if a token is given.
+    """
+    metadata_cache.invalidate(token)
+    project_indexes.invalidate(token)
+    job_records.invalidate(token)
+
+
+def cached_lookup(
+    name: str, token: str, args: tuple, load: Callable[[], Any], use_cache: bool = True
+) -> Any:
+    """Get a value from the metadata cache, loading and storing it if missing."""
+    if not use_cache:
+        return load()
+    key = metadata_cache.key(name, token, *args)
+    value = metadata_cache.get(key)
+    if value is None:
+        value = load()
+        metadata_cache.set(key, value)
+    return value
+
+
+def create_ocm_client(token, retry_policy: RetryPolicy | None = None) -> httpx.Client:
+    """Create an OCM client, retrying failed requests like the ConceptEV client."""
     client = httpx.Client(
-        base_url=OCM_URL,
-        verify=generate_ssl_context(),
+        base_url=settings.ocm_url,
+        verify=get_ssl_context(),
         headers={
             "Authorization": token,
         },
+        **client_options(),
     )
-    return client
+    return instrumentation.attach(retrying(client, retry_policy))
+
+
+class OCMSession:
+    """Pooled connection to the OnScale Cloud Manager.
+
+    The session keeps one ``httpx.Client`` with keep-alive connections open, so consecutive
+    OCM calls reuse the same TCP and TLS connection instead of opening a new one each time.
+    The token is sent with each request rather than stored on the client, so the same session
+    can be used with a refreshed token.
 
+    Use it as a context manager to close the connections when finished:
 
-def get_product_id(token: str) -> str:
-    """Get the product ID."""
-    products = create_ocm_client(token).get("/product/list")
+    .. code-block:: python
+
+       with OCMSession() as session:
+           user_id = get_user_id(token, session=session)
+           status = get_status(job_info, token, session=session)
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        timeout: httpx.Timeout | float | None = None,
+        http2: bool | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        """Initialize the pooled OCM client.
+
+        The pool limits, the timeouts and HTTP/2 are taken from the settings unless given.
+        Failed requests are retried by ``retry_policy``, or by the default policy.
+        """
+        client = httpx.Client(
+            base_url=settings.ocm_url,
+            verify=get_ssl_context(),
+            **client_options(
+                max_connections, max_keepalive_connections, keepalive_expiry, timeout, http2
+            ),
+        )
+        self.client = instrumentation.attach(retrying(client, retry_policy))
+
+    def request(self, token: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request with the token added to the headers."""
+        headers = {"Authorization": token} | kwargs.pop("headers", {})
+        return self.client.request(method, url, headers=headers, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.client.close()
+
+    def __enter__(self) -> "OCMSession":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the session on exit."""
+        self.close()
+
+
+def ocm_request(
+    token: str, method: str, url: str, session: OCMSession | None = None, **kwargs
+) -> httpx.Response:
+    """Send a request to OCM.
+
+    Uses the pooled connection of the session if one is given. Otherwise a single-use client is
+    created and closed after the request.
+    """
+    if session is not None:
+        return session.request(token, method, url, **kwargs)
+    with create_ocm_client(token) as client:
+        return client.request(method, url, **kwargs)
+
+
+def get_product_id(token: str, session: OCMSession | None = None, use_cache: bool = True) -> str:
+    """Get the product ID.
+
+    The value is kept in the metadata cache unless ``use_cache`` is ``False``.
+    """
+
+    def load():
+        products = ocm_request(token, "GET", "/product/list", session=session)
+        return parse_product_id(products)
+
+    return cached_lookup("product_id", token, (), load, use_cache)
+
+
+def parse_product_id(products: httpx.Response) -> str:
+    """Parse the ConceptEV product ID from a product list response."""
     if products.status_code != 200:
         raise ProductIdsError(f"Failed to get product id.")
     product_id = [
@@ -69,18 +272,42 @@ def get_product_id(token: str) -> str:
     return product_id
 
 
-def get_user_id(token):
-    """Get the user ID."""
-    user_details = create_ocm_client(token).post("/user/details")
+def get_user_id(token, session: OCMSession | None = None, use_cache: bool = True):
+    """Get the user ID.
+
+    The value is kept in the metadata cache unless ``use_cache`` is ``False``.
+    """
+
+    def load():
+        user_details = ocm_request(token, "POST", "/user/details", session=session)
+        return parse_user_id(user_details)
+
+    return cached_lookup("user_id", token, (), load, use_cache)
+
+
+def parse_user_id(user_details: httpx.Response) -> str:
+    """Parse the user ID from a user details response."""
     if user_details.status_code not in (200, 204):
         raise UserDetailsError(f"Failed to get a user details on OCM {user_details}.")
     user_id = user_details.json()["userId"]
     return user_id
 
 
-def get_account_ids(token: str) -> dict:
-    """Get account IDs."""
-    response = create_ocm_client(token).post("/account/list")
+def get_account_ids(token: str, session: OCMSession | None = None, use_cache: bool = True) -> dict:
+    """Get account IDs.
+
+    The value is kept in the metadata cache unless ``use_cache`` is ``False``.
+    """
+
+    def load():
+        response = ocm_request(token, "POST", "/account/list", session=session)
+        return parse_account_ids(response)
+
+    return dict(cached_lookup("account_ids", token, (), load, use_cache))
+
+
+def parse_account_ids(response: httpx.Response) -> dict:
+    """Parse the account names and IDs from an account list response."""
     if response.status_code != 200:
         raise AccountsError(f"Failed to get accounts {response}.")
     accounts = {
@@ -90,19 +317,36 @@ def get_account_ids(token: str) -> dict:
     return accounts
 
 
-def get_account_id(token: str) -> str:
+def get_account_id(token: str, session: OCMSession | None = None, use_cache: bool = True) -> str:
     """Get the account ID from OCM using name from config file."""
-    accounts = get_account_ids(token)
-    account_id = accounts[ACCOUNT_NAME]
+    accounts = get_account_ids(token, session=session, use_cache=use_cache)
+    account_id = accounts[settings.account_name]
     return account_id
 
 
-def get_default_hpc(token: str, account_id: str) -> dict:
-    """Get the default HPC ID."""
-    response = create_ocm_client(token).post(
-        "/account/hpc/default",
-        json={"accountId": account_id},
-    )
+def get_default_hpc(
+    token: str, account_id: str, session: OCMSession | None = None, use_cache: bool = True
+) -> dict:
+    """Get the default HPC ID.
+
+    The value is kept in the metadata cache unless ``use_cache`` is ``False``.
+    """
+
+    def load():
+        response = ocm_request(
+            token,
+            "POST",
+            "/account/hpc/default",
+            session=session,
+            json={"accountId": account_id},
+        )
+        return parse_default_hpc(response)
+
+    return cached_lookup("default_hpc", token, (account_id,), load, use_cache)
+
+
+def parse_default_hpc(response: httpx.Response) -> str:
+    """Parse the HPC ID from a default HPC response."""
     if response.status_code != 200:
         raise AccountsError(f"Failed to get accounts {response}.")
     return response.json()["hpcId"]
@@ -114,6 +358,7 @@ def create_new_project(
     hpc_id: str,
     title: str,
     project_goal: str = "Created from the CLI",
+    session: OCMSession | None = None,
 ) -> dict:
     """Create a project."""
     token = auth.get_token(client)
@@ -123,7 +368,14 @@ def create_new_project(
         "projectTitle": title,
         "projectGoal": project_goal,
     }
-    created_project = create_ocm_client(token).post("/project/create", json=project_data)
+    created_project = ocm_request(
+        token, "POST", "/project/create", session=session, json=project_data
+    )
+    return parse_created_project(created_project)
+
+
+def parse_created_project(created_project: httpx.Response) -> dict:
+    """Parse the project from a project creation response."""
     if created_project.status_code != 200 and created_project.status_code != 204:
         raise ProjectError(f"Failed to create a project {created_project}.")
 
@@ -131,58 +383,93 @@ def create_new_project(
 
 
 def create_new_design(
-    client: httpx.AsyncClient, project_id: str, product_id: str = None, title: str = None
+    client: httpx.AsyncClient,
+    project_id: str,
+    product_id: str = None,
+    title: str = None,
+    session: OCMSession | None = None,
 ) -> dict:
     """Create a new design on OCM."""
     if title is None:
         title = f"CLI concept {datetime.datetime.now()}"
 
-    token = client.headers["Authorization"]
+    token = auth.get_token(client)
     if product_id is None:
-        product_id = get_product_id(token)
+        product_id = get_product_id(token, session=session)
 
     design_data = {
         "projectId": project_id,
         "productId": product_id,
         "designTitle": title,
     }
-    created_design = create_ocm_client(token).post("/design/create", json=design_data)
+    created_design = ocm_request(token, "POST", "/design/create", session=session, json=design_data)
 
     if created_design.status_code not in (200, 204):
         raise DesignError(f"Failed to create a design on OCM {created_design.content}.")
     return created_design.json()
 
 
-def get_or_create_project(client: httpx.Client, account_id: str, hpc_id: str, title: str) -> dict:
-    """Get or create a project."""
-    stored_errors = []
-    options = [title, re.escape(title), title.split(maxsplit=1)[0]]
-    for search_string in options:
-        try:
-            projects = get_project_ids(search_string, account_id, client.headers["Authorization"])
-            project_id = projects[title][0]
-            return project_id
-        except (ProjectError, KeyError, IndexError) as err:
-            stored_errors.append(err)
+def find_project_id(projects: dict, title: str) -> str | None:
+    """Find the first project ID with the given title."""
+    try:
+        return projects[title][0]
+    except (KeyError, IndexError):
+        return None
+
+
+def get_or_create_project(
+    client: httpx.Client,
+    account_id: str,
+    hpc_id: str,
+    title: str,
+    session: OCMSession | None = None,
+) -> dict:
+    """Get or create a project.
+
+    The project is looked up in the cached project index of the account. A cached index that
+    does not hold the title is reloaded once before a project is created, so projects created
+    elsewhere are found.
+    """
+    token = auth.get_token(client)
+    cached = project_indexes.get(project_index_key(account_id, token)) is not None
+    projects = get_project_index(account_id, token, session=session)
+    project_id = find_project_id(projects, title)
+    if project_id is None and cached:
+        projects = get_project_index(account_id, token, session=session, use_cache=False)
+        project_id = find_project_id(projects, title)
+    if project_id is not None:
+        return project_id
 
-    project = create_new_project(client, account_id, hpc_id, title)
+    project = create_new_project(client, account_id, hpc_id, title, session=session)
     project_id = project["projectId"]
+    add_to_project_index(account_id, token, title, project_id)
 
     return project_id
 
 
-def create_design_instance(project_id, title, token, product_id=None, return_design_id=False):
+def create_design_instance(
+    project_id,
+    title,
+    token,
+    product_id=None,
+    return_design_id=False,
+    session: OCMSession | None = None,
+):
     """Create a design instance on OCM."""
     if product_id is None:
-        product_id = get_product_id(token)
+        product_id = get_product_id(token, session=session)
 
     design_data = {
         "projectId": project_id,
         "productId": product_id,
         "designTitle": title,
     }
-    created_design = create_ocm_client(token).post("/design/create", json=design_data)
+    created_design = ocm_request(token, "POST", "/design/create", session=session, json=design_data)
+    return parse_design_instance(created_design, return_design_id)
+
 
+def parse_design_instance(created_design: httpx.Response, return_design_id: bool = False):
+    """Parse the design instance ID from a design creation response."""
     if created_design.status_code not in (200, 204):
         raise Exception(f"Failed to create a design on OCM {created_design.content}.")
 
@@ -192,7 +479,9 @@ def create_design_instance(project_id, title, token, product_id=None, return_des
     return design_instance_id
 
 
-def get_job_file_signed_url(token, job_id, filename):
+def get_job_file_signed_url(
+    token, job_id, filename, session: OCMSession | None = None, timeout: float = 20
+):
     """Fetch JSON content from S3 using the signed download URL from the OCM file list.
 
     Uses the ``/job/files/list/{jobId}`` endpoint to obtain a pre-signed S3
@@ -203,9 +492,209 @@ def get_job_file_signed_url(token, job_id, filename):
     server-side Pydantic validation, so it works with result files produced by
     any solver version, as long as the S3 object is JSON-encoded. Returns the
     parsed JSON content as a Python object.
+
+    When a session is given, the S3 download also reuses its connection pool. The token is
+    not sent to S3 because the session only adds it to OCM requests.
+
+    The whole file is held in memory. Use ``download_job_file`` or ``iter_job_file_items``
+    for large files.
     """
-    client = create_ocm_client(token)
-    list_response = client.get(url=f"/job/files/list/{job_id}")
+    download_request = get_download_request(token, job_id, filename, session=session)
+    method, signed_url, headers = signed_request_parts(download_request)
+    with download_client(session) as client:
+        s3_response = client.request(method, signed_url, headers=headers, timeout=timeout)
+    return parse_signed_download(s3_response, filename)
+
+
+def get_download_request(
+    token: str, job_id: str, filename: str, session: OCMSession | None = None
+) -> dict:
+    """Get the signed download request of a job file from the OCM file list."""
+    list_response = ocm_request(token, "GET", f"/job/files/list/{job_id}", session=session)
+    return find_download_request(list_response, job_id, filename)
+
+
+def signed_request_parts(download_request: dict) -> tuple[str, str, dict]:
+    """Get the method, URL and headers of a signed download request."""
+    method = download_request.get("method", "GET").upper()
+    return method, download_request["uri"], download_request.get("headers", {})
+
+
+@contextmanager
+def download_client(session: OCMSession | None = None) -> Iterator[httpx.Client]:
+    """Get a client for signed URL downloads.
+
+    Uses the client of the session if one is given, otherwise a single-use client.
+    """
+    if session is not None:
+        yield session.client
+        return
+    with instrumentation.attach(httpx.Client(verify=get_ssl_context())) as client:
+        yield client
+
+
+def download_job_file(
+    token: str,
+    job_id: str,
+    filename: str,
+    destination: str | Path,
+    session: OCMSession | None = None,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    timeout: float = 20,
+    progress: Callable[[int, int | None], None] | None = None,
+    resume: bool = True,
+) -> Path:
+    """Stream a job file from its signed URL to disk.
+
+    The file is written in chunks to ``<destination>.part`` and renamed to the destination when
+    complete, so it is never held in memory. If a partial file is left over from an interrupted
+    download and ``resume`` is ``True``, only the missing bytes are requested with a range
+    request. ``progress`` is called after each chunk with the number of bytes written so far and
+    the total size, if known. The timeout applies to each network operation rather than to the
+    whole download.
+    """
+    destination = Path(destination)
+    partial = destination.with_name(destination.name + ".part")
+    download_request = get_download_request(token, job_id, filename, session=session)
+    method, signed_url, headers = signed_request_parts(download_request)
+
+    offset = partial.stat().st_size if resume and partial.exists() else 0
+    if offset:
+        headers = headers | {"Range": f"bytes={offset}-"}
+
+    with download_client(session) as client:
+        with client.stream(method, signed_url, headers=headers, timeout=timeout) as response:
+            if response.status_code == 416:  # The partial file is already complete.
+                partial.replace(destination)
+                return destination
+            if response.status_code not in (200, 206):
+                raise ResponseError(
+                    f"Failed to download '{filename}' from S3: status={response.status_code}."
+                )
+            if response.status_code == 200:  # The range was ignored, start again.
+                offset = 0
+            total = content_length(response, offset)
+            written = offset
+            with open(partial, "ab" if offset else "wb") as file:
+                for chunk in response.iter_bytes(chunk_size):
+                    file.write(chunk)
+                    written += len(chunk)
+                    if progress is not None:
+                        progress(written, total)
+    partial.replace(destination)
+    return destination
+
+
+def content_length(response: httpx.Response, offset: int = 0) -> int | None:
+    """Get the full size of a download from the response headers, if known."""
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range and not content_range.endswith("/*"):
+        return int(content_range.rsplit("/", 1)[1])
+    if "Content-Length" in response.headers:
+        return int(response.headers["Content-Length"]) + offset
+    return None
+
+
+def iter_job_file_chunks(
+    token: str,
+    job_id: str,
+    filename: str,
+    session: OCMSession | None = None,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    timeout: float = 20,
+) -> Iterator[bytes]:
+    """Stream a job file from its signed URL as chunks of bytes."""
+    download_request = get_download_request(token, job_id, filename, session=session)
+    method, signed_url, headers = signed_request_parts(download_request)
+    with download_client(session) as client:
+        with client.stream(method, signed_url, headers=headers, timeout=timeout) as response:
+            if response.status_code != 200:
+                raise ResponseError(
+                    f"Failed to download '{filename}' from S3: status={response.status_code}."
+                )
+            yield from response.iter_bytes(chunk_size)
+
+
+def iter_job_file_items(
+    token: str,
+    job_id: str,
+    filename: str,
+    session: OCMSession | None = None,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    timeout: float = 20,
+) -> Iterator:
+    """Stream a job file that holds a JSON array and yield its items one at a time.
+
+    Only the item being parsed is held as text, so the raw file and the parsed results are
+    never in memory at the same time.
+    """
+    chunks = iter_job_file_chunks(token, job_id, filename, session, chunk_size, timeout)
+    yield from iter_json_array(chunks)
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator:
+    """Parse a JSON array from chunks of UTF-8 bytes, yielding each item when complete.
+
+    An incomplete item is only parsed again once the data held for it has doubled, so an item
+    spanning many chunks is parsed a logarithmic number of times rather than once per chunk.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    pieces: list[str] = []
+    length = 0
+    min_length = 0
+    started = False
+    for chunk in itertools.chain(chunks, [None]):
+        final = chunk is None
+        text = text_decoder.decode(b"" if final else chunk, final=final)
+        pieces.append(text)
+        length += len(text)
+        if not final and length < min_length:
+            continue
+        buffer = "".join(pieces)
+        position = 0
+        while True:
+            position = skip_whitespace(buffer, position)
+            if position == len(buffer):
+                break
+            if not started:
+                if buffer[position] != "[":
+                    raise ResponseError("Expected the file to hold a JSON array.")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                return
+            if buffer[position] == ",":
+                position += 1
+                continue
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break  # Wait for more data.
+            # The item is only complete once it is followed by a separator, as a number may
+            # continue in the next chunk.
+            next_position = skip_whitespace(buffer, end)
+            if next_position == len(buffer) or buffer[next_position] not in ",]":
+                break
+            yield item
+            position = end
+        buffer = buffer[position:]
+        pieces = [buffer]
+        length = len(buffer)
+        min_length = 2 * length
+    raise ResponseError("The JSON array in the file is incomplete.")
+
+
+def skip_whitespace(text: str, position: int) -> int:
+    """Get the position of the next character that is not whitespace."""
+    while position < len(text) and text[position] in " \t\n\r":
+        position += 1
+    return position
+
+
+def find_download_request(list_response: httpx.Response, job_id: str, filename: str) -> dict:
+    """Find the signed download request for a file in a job file list response."""
     if list_response.status_code != 200:
         raise ResponseError(
             f"Failed to list job files for job {job_id}: " f"status={list_response.status_code}."
@@ -232,18 +721,11 @@ def get_job_file_signed_url(token, job_id, filename):
     download_request = matched[0].get("downloadRequest")
     if not download_request or not download_request.get("uri"):
         raise ResponseError(f"No signed download URL available for '{filename}'.")
+    return download_request
 
-    signed_url = download_request["uri"]
-    method = download_request.get("method", "GET").upper()
-    headers = download_request.get("headers", {})
 
-    s3_response = httpx.request(
-        method,
-        signed_url,
-        headers=headers,
-        verify=generate_ssl_context(),
-        timeout=20,
-    )
+def parse_signed_download(s3_response: httpx.Response, filename: str):
+    """Parse the JSON content of a signed URL download."""
     if s3_response.status_code != 200:
         raise ResponseError(
             f"Failed to download '{filename}' from S3: status={s3_response.status_code}."
@@ -252,64 +734,180 @@ def get_job_file_signed_url(token, job_id, filename):
     return json.loads(s3_response.content)
 
 
-def get_job_file(token, job_id, filename, simulation_id=None, encrypted=False):
+def get_job_file(
+    token,
+    job_id,
+    filename,
+    simulation_id=None,
+    encrypted=False,
+    session: OCMSession | None = None,
+):
     """Get the job file from the OnScale Cloud Manager."""
+    path = job_file_path(job_id, filename, simulation_id, encrypted)
+    response = ocm_request(
+        token, "GET", path, session=session, headers={"accept": "application/octet-stream"}
+    )
+    return parse_job_file(response)
+
+
+def job_file_path(job_id, filename, simulation_id=None, encrypted=False) -> str:
+    """Get the OCM path of a job file."""
     encrypted_part = "decrypted/" if encrypted else ""
     if simulation_id is not None:
-        path = f"/job/files/{encrypted_part}{job_id}/{simulation_id}/{filename}"
-    else:
-        path = f"/job/files/{encrypted_part}{job_id}/{filename}"
-    response = create_ocm_client(token).get(
-        url=path, headers={"accept": "application/octet-stream"}
-    )
+        return f"/job/files/{encrypted_part}{job_id}/{simulation_id}/{filename}"
+    return f"/job/files/{encrypted_part}{job_id}/{filename}"
+
+
+def parse_job_file(response: httpx.Response):
+    """Parse the JSON content of a job file response."""
     if response.status_code != 200:
         raise ResponseError(f"Failed to get file {response}.")
 
     return json.loads(response.content)
 
 
-def get_job_info(token, job_id):
-    """Get the job info from the OnScale Cloud Manager."""
-    response = create_ocm_client(token).post(url=f"/job/load", json={"jobId": job_id})
-    response = process_response(response)
-    job_info = {
-        "job_id": job_id,
-        "simulation_id": response["simulations"][0]["simulationId"],
-        "job_name": response["jobName"],
-        "docker_tag": response["dockerTag"],
-    }
-    return job_info
+@dataclass
+class JobRecord:
+    """The fields of a job loaded from the OnScale Cloud Manager.
+
+    Only the fields used by this package are kept, so that many cached records stay small.
+    Fields missing from the loaded job are ``None``.
+    """
+
+    job_id: str
+    last_status: str | None = None
+    status_error: str | None = None
+    simulation_id: str | None = None
+    design_instance_id: str | None = None
+    job_name: str | None = None
+    docker_tag: str | None = None
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_response(cls, job_id: str, response: dict) -> "JobRecord":
+        """Keep the fields of a loaded OCM job."""
+        try:
+            last_status, status_error = parse_job_status(response), None
+        except ResponseError as err:
+            last_status, status_error = None, str(err)
+        simulations = response.get("simulations") or [{}]
+        return cls(
+            job_id,
+            last_status=last_status,
+            status_error=status_error,
+            simulation_id=simulations[0].get("simulationId"),
+            design_instance_id=response.get("designInstanceId"),
+            job_name=response.get("jobName"),
+            docker_tag=response.get("dockerTag"),
+        )
+
+    @property
+    def status(self) -> str:
+        """Get the upper case status of the job."""
+        if self.last_status is None:
+            raise ResponseError(self.status_error)
+        return self.last_status
+
+    @property
+    def terminal(self) -> bool:
+        """Check whether the job has finished, successfully or not."""
+        return self.last_status in FINAL_STATUSES
+
+    @property
+    def job_info(self) -> dict:
+        """Get the job info used by the result functions."""
+        if self.simulation_id is None or self.job_name is None or self.docker_tag is None:
+            raise ResponseError(f"Failed to get the job info of job {self.job_id}.")
+        return {
+            "job_id": self.job_id,
+            "simulation_id": self.simulation_id,
+            "job_name": self.job_name,
+            "docker_tag": self.docker_tag,
+        }
+
+    @property
+    def age(self) -> float:
+        """Get the number of seconds since the job was loaded."""
+        return time.monotonic() - self.loaded_at
 
 
-def get_design_of_job(token, job_id):
+def load_job_record(
+    token: str,
+    job_id: str,
+    session: OCMSession | None = None,
+    use_cache: bool = True,
+    max_age: float | None = None,
+) -> JobRecord:
+    """Load a job from the OnScale Cloud Manager.
+
+    Finished jobs do not change, so they are cached for good. Other jobs are cached for
+    ``JOB_RECORD_TTL`` seconds. Pass ``max_age`` to load records older than that many seconds
+    again, or ``use_cache=False`` to always load the job, for example when polling its status.
+    """
+    key = job_records.key("job", token, job_id)
+    record = job_records.get(key) if use_cache else None
+    if record is None or (max_age is not None and record.age > max_age):
+        response = ocm_request(token, "POST", "/job/load", session=session, json={"jobId": job_id})
+        record = JobRecord.from_response(job_id, process_response(response))
+        store_job_record(key, record)
+    return record
+
+
+def store_job_record(key: tuple, record: JobRecord) -> None:
+    """Store a job record, for good if the job has finished."""
+    job_records.set(key, record, ttl=math.inf if record.terminal else None)
+
+
+def get_job_info(token, job_id, session: OCMSession | None = None, use_cache: bool = True):
     """Get the job info from the OnScale Cloud Manager."""
-    response = create_ocm_client(token).post(url="/job/load", json={"jobId": job_id})
-    response = process_response(response)
-    return response["designInstanceId"]
+    return load_job_record(token, job_id, session=session, use_cache=use_cache).job_info
+
+
+def get_design_of_job(token, job_id, session: OCMSession | None = None, use_cache: bool = True):
+    """Get the design instance ID of a job from the OnScale Cloud Manager."""
+    return load_job_record(token, job_id, session=session, use_cache=use_cache).design_instance_id
 
 
-def get_design_title(token, design_instance_id):
+def get_design_title(token, design_instance_id, session: OCMSession | None = None):
     """Get the design Title from the OnScale Cloud Manager."""
-    response = create_ocm_client(token).post(
-        url="/design/instance/load",
+    response = ocm_request(
+        token,
+        "POST",
+        "/design/instance/load",
+        session=session,
         json={"designInstanceId": design_instance_id},
     )
     response = process_response(response)
-    design = create_ocm_client(token).post(
-        url="/design/load",
+    design = ocm_request(
+        token,
+        "POST",
+        "/design/load",
+        session=session,
         json={"designId": response["designId"]},
     )
     design = process_response(design)
     return design["designTitle"]
 
 
-def get_status(job_info: dict, token: str) -> str:
-    """Get the status of the job."""
-    response = create_ocm_client(token).post(
-        url="/job/load",
-        json={"jobId": job_info["job_id"]},
+def get_status(
+    job_info: dict,
+    token: str,
+    session: OCMSession | None = None,
+    use_cache: bool = True,
+    max_age: float | None = None,
+) -> str:
+    """Get the status of the job.
+
+    See ``load_job_record`` for how the job is cached.
+    """
+    record = load_job_record(
+        token, job_info["job_id"], session=session, use_cache=use_cache, max_age=max_age
     )
-    processed_response = process_response(response)
+    return record.status
+
+
+def parse_job_status(processed_response: dict) -> str:
+    """Get the upper case status from a loaded OCM job."""
     if "finalStatus" in processed_response and processed_response["finalStatus"] is not None:
         status = processed_response["finalStatus"].upper()
     elif "lastStatus" in processed_response and processed_response["lastStatus"] is not None:
@@ -341,23 +939,134 @@ def get_status(job_info: dict, token: str) -> str:
     return status
 
 
-def get_project_ids(name: str, account_id: str, token: str) -> dict:
-    """Get projects."""
-    response = create_ocm_client(token).post(
-        url="/project/list/page",
-        json={"accountId": account_id, "filterByName": name, "pageNumber": 0, "pageSize": 1000},
+def get_project_page(
+    token: str,
+    account_id: str,
+    name: str = "",
+    page_number: int = 0,
+    page_size: int = PROJECT_PAGE_SIZE,
+    session: OCMSession | None = None,
+) -> dict:
+    """Get one page of the projects of an account whose names match a filter."""
+    response = ocm_request(
+        token,
+        "POST",
+        "/project/list/page",
+        session=session,
+        json=project_page_data(account_id, name, page_number, page_size),
     )
-    processed_response = process_response(response)
-    projects = processed_response["projects"]
+    return process_response(response)
+
+
+def project_page_data(account_id: str, name: str, page_number: int, page_size: int) -> dict:
+    """Get the data to request a page of projects."""
+    return {
+        "accountId": account_id,
+        "filterByName": name,
+        "pageNumber": page_number,
+        "pageSize": page_size,
+    }
+
+
+def project_page_count(first_page: dict, page_size: int) -> int | None:
+    """Get the number of pages from the first page, or ``None`` if the total is not reported."""
+    total = first_page.get(PROJECT_TOTAL_KEY)
+    if total is None:
+        return None
+    return max(1, math.ceil(total / page_size))
+
+
+def iter_projects(
+    account_id: str,
+    token: str,
+    name: str = "",
+    session: OCMSession | None = None,
+    page_size: int = PROJECT_PAGE_SIZE,
+    max_workers: int = 8,
+) -> Iterator[dict]:
+    """Iterate over all projects of an account whose names match a filter.
+
+    The first page is requested on its own. If it reports the total number of projects, the
+    other pages are requested concurrently and their projects are yielded as each page arrives,
+    in no particular order. Otherwise pages are requested one after another until a page is not
+    full.
+    """
+    page = get_project_page(token, account_id, name, 0, page_size, session=session)
+    yield from page["projects"]
+    page_count = project_page_count(page, page_size)
+    if page_count is None:
+        page_number = 0
+        while len(page["projects"]) >= page_size:
+            page_number += 1
+            page = get_project_page(token, account_id, name, page_number, page_size, session)
+            yield from page["projects"]
+        return
+    if page_count == 1:
+        return
+
+    pool = OCMSession(max_connections=max_workers) if session is None else nullcontext(session)
+    with pool as pooled, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(get_project_page, token, account_id, name, number, page_size, pooled)
+            for number in range(1, page_count)
+        ]
+        try:
+            for future in as_completed(futures):
+                yield from future.result()["projects"]
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def get_project_ids(
+    name: str, account_id: str, token: str, session: OCMSession | None = None
+) -> dict:
+    """Get projects."""
+    return index_projects(iter_projects(account_id, token, name, session=session))
+
+
+def index_projects(projects: Iterable[dict]) -> dict:
+    """Map project titles to the IDs of projects with that title."""
     project_dict = defaultdict(list)
     for project in projects:
         project_dict[project["projectTitle"]].append(project["projectId"])
     return project_dict
 
 
-def get_project_id(name: str, account_id: str, token: str) -> str:
+def project_index_key(account_id: str, token: str) -> tuple:
+    """Get the cache key of the project index of an account."""
+    return project_indexes.key("projects", token, account_id)
+
+
+def get_project_index(
+    account_id: str, token: str, session: OCMSession | None = None, use_cache: bool = True
+) -> dict:
+    """Get the IDs of all projects of an account keyed by project title.
+
+    The index is kept for ``PROJECT_INDEX_TTL`` seconds. It is loaded again if missing or if
+    ``use_cache`` is ``False``.
+    """
+    key = project_index_key(account_id, token)
+    projects = project_indexes.get(key) if use_cache else None
+    if projects is None:
+        projects = dict(index_projects(iter_projects(account_id, token, session=session)))
+        project_indexes.set(key, projects)
+    return projects
+
+
+def add_to_project_index(account_id: str, token: str, title: str, project_id: str) -> None:
+    """Add a created project to the cached project index of an account, if there is one."""
+    key = project_index_key(account_id, token)
+    projects = project_indexes.get(key)
+    if projects is not None:
+        project_indexes.set(key, projects | {title: projects.get(title, []) + [project_id]})
+
+
+def get_project_id(
+    name: str, account_id: str, token: str, session: OCMSession | None = None
+) -> str:
     """Get project ID."""
-    projects = get_project_ids(name, account_id, token)
+    projects = get_project_ids(name, account_id, token, session=session)
     if not projects:
         raise ProjectError(f"Project with name {name} not found.")
     if len(projects) > 1:
@@ -365,20 +1074,25 @@ def get_project_id(name: str, account_id: str, token: str) -> str:
     return projects[name][0]
 
 
-def delete_project(project_id, token):
+def delete_project(project_id, token, session: OCMSession | None = None):
     """Delete a project."""
-    ocm_delete_init = create_ocm_client(token).request(
-        method="DELETE",
-        url="/project/delete/init",
+    ocm_delete_init = ocm_request(
+        token,
+        "DELETE",
+        "/project/delete/init",
+        session=session,
         json={"projectId": project_id},
         timeout=20,
     )
     ocm_delete_init = process_response(ocm_delete_init)
-    ocm_delete = create_ocm_client(token).request(
-        method="DELETE",
-        url="/project/delete/execute",
+    ocm_delete = ocm_request(
+        token,
+        "DELETE",
+        "/project/delete/execute",
+        session=session,
         json={"projectId": project_id, "hash": ocm_delete_init["hash"]},
         timeout=20,
     )
     ocm_delete = process_response(ocm_delete)
+    project_indexes.invalidate(token)
     return ocm_delete
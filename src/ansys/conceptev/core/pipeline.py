@@ -0,0 +1,189 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Submit jobs, follow them and download their results as each job finishes.
+
+The stages overlap: while some jobs are still being submitted, others are already running and
+the results of finished jobs are being downloaded. The total time approaches that of the slowest
+job rather than the sum of all jobs.
+"""
+import asyncio
+from contextlib import nullcontext
+import queue
+import threading
+from typing import AsyncIterator, Iterable, Iterator
+
+import httpx
+
+from ansys.conceptev.core import aio, auth
+from ansys.conceptev.core.batch import BatchResult
+from ansys.conceptev.core.progress import JobMonitor, check_status
+from ansys.conceptev.core.result_cache import ResultCache
+
+
+async def wait_for_job(monitor: JobMonitor, job_id: str, timeout: float) -> str:
+    """Wait for a job to finish and return its final status."""
+    monitor.watch(job_id)
+    try:
+        _, status = await asyncio.wait_for(monitor.wait_for(job_id), timeout)
+    except asyncio.TimeoutError as err:
+        raise Exception(
+            f"Timeout Error: Job {job_id} is taking too long to complete (>{timeout} seconds)."
+        ) from err
+    return status
+
+
+async def run_jobs(
+    client: httpx.AsyncClient,
+    concepts: Iterable[dict],
+    account_id: str | None = None,
+    hpc_id: str | None = None,
+    calculate_units: bool = True,
+    filtered: bool = False,
+    max_submissions: int = 8,
+    max_downloads: int = 8,
+    timeout: float | None = None,
+    docker_tag: str = "default",
+    extra_memory: bool = False,
+    msal_app: auth.PublicClientApplication | None = None,
+    ocm_session: aio.AsyncOCMSession | None = None,
+    cache: ResultCache | None = None,
+) -> AsyncIterator[BatchResult]:
+    """Submit a job for each concept and yield the results of each job as soon as it finishes.
+
+    At most ``max_submissions`` jobs are submitted and ``max_downloads`` results downloaded at
+    the same time. All jobs are followed over one OCM websocket and each may take up to
+    ``timeout`` seconds, or the ``job_timeout`` setting. The account, HPC and user IDs and the
+    data format version are looked up once. Yields one ``BatchResult`` per concept, in the order
+    the jobs finish, holding the results or the error and the job info of the submitted job.
+    """
+    concepts = list(concepts)
+    token = await asyncio.to_thread(auth.get_token, client)
+    async with (
+        aio.AsyncOCMSession() if ocm_session is None else nullcontext(ocm_session)
+    ) as session:
+        if account_id is None:
+            account_id = await aio.get_account_id(token, session=session)
+        if hpc_id is None:
+            hpc_id = await aio.get_default_hpc(token, account_id, session=session)
+        user_id = await aio.get_user_id(token, session=session)
+        version_number = await aio.get_data_format_version(client)
+        if msal_app is None:
+            msal_app = await asyncio.to_thread(auth.create_msal_app)
+        submissions = asyncio.Semaphore(max_submissions)
+        downloads = asyncio.Semaphore(max_downloads)
+
+        async with JobMonitor(user_id, token, msal_app, timeout) as monitor:
+
+            async def run_job(concept: dict) -> BatchResult:
+                job_info = None
+                try:
+                    async with submissions:
+                        job_info = await aio.create_submit_job(
+                            client,
+                            concept,
+                            account_id,
+                            hpc_id,
+                            docker_tag=docker_tag,
+                            extra_memory=extra_memory,
+                        )
+                    status = await wait_for_job(monitor, job_info["job_id"], monitor.timeout)
+                    check_status(status)
+                    if client.auth is None:
+                        client.headers["Authorization"] = monitor.token
+                    async with downloads:
+                        results = await aio.get_results(
+                            client,
+                            job_info,
+                            calculate_units,
+                            filtered,
+                            ocm_session=session,
+                            cache=cache,
+                            version_number=version_number,
+                            design_instance_id=concept["design_instance_id"],
+                        )
+                except Exception as err:
+                    return BatchResult(concept, error=err, concept=concept, job_info=job_info)
+                return BatchResult(concept, result=results, concept=concept, job_info=job_info)
+
+            tasks = [asyncio.ensure_future(run_job(concept)) for concept in concepts]
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    yield await finished
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def iter_job_results(
+    concepts: Iterable[dict], token: str | None = None, buffer_size: int = 16, **kwargs
+) -> Iterator[BatchResult]:
+    """Submit a job for each concept and yield the results of each job as soon as it finishes.
+
+    The synchronous version of ``run_jobs``, which takes the same keyword arguments. The
+    pipeline runs in an event loop on a background thread with its own asynchronous client,
+    authenticated with the token if given. At most ``buffer_size`` results wait to be consumed,
+    and closing the generator early cancels the pipeline.
+    """
+    results: queue.Queue = queue.Queue(maxsize=buffer_size)
+    done = object()
+    started = threading.Event()
+    running: dict = {}
+
+    async def pipeline():
+        running["loop"], running["task"] = asyncio.get_running_loop(), asyncio.current_task()
+        started.set()
+        async with aio.get_http_client(token) as client:
+            async for result in run_jobs(client, concepts, **kwargs):
+                await asyncio.to_thread(results.put, result)
+
+    def run():
+        try:
+            asyncio.run(pipeline())
+        except asyncio.CancelledError:
+            pass
+        except Exception as err:
+            results.put(err)
+        finally:
+            started.set()
+            results.put(done)
+
+    thread = threading.Thread(target=run, name="conceptev-pipeline", daemon=True)
+    thread.start()
+    finished = False
+    try:
+        while (item := results.get()) is not done:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+        finished = True
+    finally:
+        if not finished:
+            started.wait()
+            if "task" in running:
+                try:
+                    running["loop"].call_soon_threadsafe(running["task"].cancel)
+                except RuntimeError:  # The loop has already finished.
+                    pass
+            while results.get() is not done:  # Unblock the pipeline until it stops.
+                pass
+        thread.join()
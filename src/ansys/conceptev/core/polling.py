@@ -0,0 +1,219 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Job status tracking by polling OCM, for networks where websockets are blocked."""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+import time
+from typing import Callable, Iterable, Iterator
+
+from ansys.conceptev.core.ocm import OCMSession, get_status
+from ansys.conceptev.core.progress import FINAL_STATUSES
+from ansys.conceptev.core.settings import settings
+
+
+@dataclass
+class PolledJob:
+    """Polling state of one job."""
+
+    job_info: dict
+    started: float
+    next_poll: float
+    status: str | None = None
+    error: Exception | None = None
+    failures: int = 0
+    done: bool = False
+
+
+class JobPoller:
+    """Track the status of many jobs by polling OCM.
+
+    The jobs are polled with one pooled ``OCMSession`` and at most ``max_workers`` requests at
+    a time. Each job is polled again after a delay that grows with the time it has been
+    watched, ``backoff`` times its runtime between ``min_interval`` and ``max_interval``
+    seconds, so short jobs are seen finishing quickly while long jobs cost few requests. Jobs
+    stop being polled once they reach a final status, or after ``max_failures`` requests in a
+    row have failed, in which case the error is kept in ``errors``.
+
+    ``token`` is either a token or a function returning a valid token, which is called before
+    each round of polls so that long runs can refresh it.
+
+    .. code-block:: python
+
+       with JobPoller(lambda: app.get_token(client)) as poller:
+           for job_info in job_infos:
+               poller.watch(job_info)
+           for job_id, status in poller.as_completed():
+               print(job_id, status)
+    """
+
+    def __init__(
+        self,
+        token: str | Callable[[], str],
+        session: OCMSession | None = None,
+        max_workers: int = 16,
+        min_interval: float = 5.0,
+        max_interval: float = 120.0,
+        backoff: float = 0.1,
+        max_failures: int = 5,
+        timeout: float | None = None,
+    ):
+        """Initialize the poller without polling."""
+        self.token = token
+        self.own_session = session is None
+        self.session = OCMSession(max_connections=max_workers) if session is None else session
+        self.max_workers = max_workers
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_failures = max_failures
+        self.timeout = settings.job_timeout if timeout is None else timeout
+        self.jobs: dict[str, PolledJob] = {}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def watch(self, job_info: dict) -> None:
+        """Start tracking a job. It is polled in the next round."""
+        job_id = job_info["job_id"]
+        if job_id not in self.jobs:
+            now = time.monotonic()
+            self.jobs[job_id] = PolledJob(job_info, started=now, next_poll=now)
+
+    def watch_all(self, job_infos: Iterable[dict]) -> None:
+        """Start tracking many jobs."""
+        for job_info in job_infos:
+            self.watch(job_info)
+
+    @property
+    def statuses(self) -> dict[str, str | None]:
+        """Get the last known status of each job."""
+        return {job_id: job.status for job_id, job in self.jobs.items()}
+
+    @property
+    def errors(self) -> dict[str, Exception]:
+        """Get the errors of the jobs that stopped being polled because their polls failed."""
+        return {job_id: job.error for job_id, job in self.jobs.items() if job.done and job.error}
+
+    def pending(self) -> list[str]:
+        """Get the IDs of the jobs that are still polled."""
+        return [job_id for job_id, job in self.jobs.items() if not job.done]
+
+    def poll_interval(self, runtime: float) -> float:
+        """Get the delay before the next poll of a job that has run for ``runtime`` seconds."""
+        return min(self.max_interval, max(self.min_interval, self.backoff * runtime))
+
+    def get_token(self) -> str:
+        """Get the token to poll with."""
+        return self.token() if callable(self.token) else self.token
+
+    def poll(self, job_id: str, token: str) -> None:
+        """Poll the status of one job and schedule its next poll."""
+        job = self.jobs[job_id]
+        try:
+            job.status = get_status(job.job_info, token, session=self.session, use_cache=False)
+            job.error = None
+            job.failures = 0
+        except Exception as err:
+            job.error = err
+            job.failures += 1
+        now = time.monotonic()
+        if job.failures >= self.max_failures:
+            job.status = None  # Given up on, the last status seen is not final.
+        job.done = job.status in FINAL_STATUSES or job.failures >= self.max_failures
+        job.next_poll = now + self.poll_interval(now - job.started)
+
+    def poll_due(self) -> Iterator[str]:
+        """Poll every job that is due and yield the IDs of those that finished."""
+        now = time.monotonic()
+        due = [job_id for job_id in self.pending() if self.jobs[job_id].next_poll <= now]
+        if not due:
+            return
+        token = self.get_token()
+        futures = {self.executor.submit(self.poll, job_id, token): job_id for job_id in due}
+        for future in as_completed(futures):
+            future.result()
+            job_id = futures[future]
+            if self.jobs[job_id].done:
+                yield job_id
+
+    def as_completed(self, timeout: float | None = None) -> Iterator[tuple[str, str | None]]:
+        """Yield the ID and final status of each job as it finishes.
+
+        The status is ``None`` for a job that stopped being polled because its polls failed.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while self.pending():
+            for job_id in self.poll_due():
+                yield job_id, self.jobs[job_id].status
+            pending = self.pending()
+            if not pending:
+                return
+            now = time.monotonic()
+            if now >= deadline:
+                raise Exception(
+                    f"Timeout Error: Jobs {pending} are taking too long to complete"
+                    f" (>{timeout} seconds)."
+                )
+            next_poll = min(self.jobs[job_id].next_poll for job_id in pending)
+            time.sleep(max(0.0, min(next_poll, deadline) - now))
+
+    def wait_all(self, timeout: float | None = None) -> dict[str, str | None]:
+        """Wait for all jobs to finish and return their final statuses."""
+        for _ in self.as_completed(timeout):
+            pass
+        return self.statuses
+
+    def close(self) -> None:
+        """Stop the worker threads and close the session if the poller created it."""
+        self.executor.shutdown(wait=True)
+        if self.own_session:
+            self.session.close()
+
+    def __enter__(self) -> "JobPoller":
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the poller on exit."""
+        self.close()
+
+
+def poll_jobs(
+    job_infos: Iterable[dict],
+    token: str | Callable[[], str],
+    session: OCMSession | None = None,
+    max_workers: int = 16,
+    min_interval: float = 5.0,
+    max_interval: float = 120.0,
+    timeout: float | None = None,
+) -> dict[str, str | None]:
+    """Poll many jobs until they have all finished and return their final statuses."""
+    with JobPoller(
+        token,
+        session=session,
+        max_workers=max_workers,
+        min_interval=min_interval,
+        max_interval=max_interval,
+        timeout=timeout,
+    ) as poller:
+        poller.watch_all(job_infos)
+        return poller.wait_all()
@@ -23,15 +23,23 @@
 """Progress monitoring with websockets."""
 
 import asyncio
+from dataclasses import dataclass
 import json
+import logging
+import random
 import ssl
 import sys
+import threading
+from typing import Callable
 
 import certifi
+import httpx
 from msal import PublicClientApplication
 from websockets.asyncio.client import connect
+from websockets.exceptions import WebSocketException
 
 from ansys.conceptev.core.auth import get_ansyId_token
+from ansys.conceptev.core.exceptions import ResponseError
 from ansys.conceptev.core.settings import settings
 
 if sys.version_info >= (3, 11):
@@ -42,8 +50,29 @@ else:
 STATUS_COMPLETE = "COMPLETED"
 STATUS_FINISHED = "FINISHED"
 STATUS_ERROR = "FAILED"
-OCM_SOCKET_URL = settings.ocm_socket_url
-JOB_TIMEOUT = settings.job_timeout
+FINAL_STATUSES = (STATUS_COMPLETE, STATUS_FINISHED, STATUS_ERROR)
+UNWATCHED_STATUS_LIMIT = 1000
+SETTINGS_CONSTANTS = {"OCM_SOCKET_URL": "ocm_socket_url", "JOB_TIMEOUT": "job_timeout"}
+MESSAGE_STATUS = "status"
+MESSAGE_PROGRESS = "progress"
+MESSAGE_ERROR = "error"
+MESSAGE_CALCULATED_VALUES = "calculated_values"
+
+RECONNECT_ERRORS = (OSError, asyncio.TimeoutError, WebSocketException)
+
+logger = logging.getLogger(__name__)
+
+ssl_contexts: dict[str | None, ssl.SSLContext] = {}
+ssl_context_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    """Read the module constants from the settings, and create the SSL context, on first use."""
+    if name in SETTINGS_CONSTANTS:
+        return getattr(settings, SETTINGS_CONSTANTS[name])
+    if name == "ssl_context":
+        return get_ssl_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def generate_ssl_context() -> ssl.SSLContext:
@@ -65,58 +94,230 @@ def generate_ssl_context() -> ssl.SSLContext:
     return context
 
 
-ssl_context = generate_ssl_context()
+def get_ssl_context() -> ssl.SSLContext:
+    """Get the SSL context shared by all HTTP and websocket connections.
 
+    The context is created on first use and kept for each value of the ``ssl_cert_file``
+    setting, so the certificate bundle is only loaded once per process.
+    """
+    cert_file = settings.ssl_cert_file
+    with ssl_context_lock:
+        if cert_file not in ssl_contexts:
+            ssl_contexts[cert_file] = generate_ssl_context()
+        return ssl_contexts[cert_file]
 
-def connect_to_ocm(user_id: str, token: str):
-    """Connect to the OnScale Cloud Messaging service."""
-    uri = f"{OCM_SOCKET_URL}/user?userId={user_id}&Authorization={token}"
-    return connect(uri, ssl=ssl_context)
 
+def reset_ssl_context() -> None:
+    """Forget the shared SSL contexts so that the next connection loads the certificates again."""
+    with ssl_context_lock:
+        ssl_contexts.clear()
 
-def get_status(message: str, job_id: str):
-    """Parse the message and return the status or progress."""
-    message_data = json.loads(message)
 
-    if message_data.get("jobId", "Unknown") == job_id:
-        message_type = message_data.get("messagetype", None)
-        if message_type == "status":
-            status = message_data.get("status", None)
-            print(f"Status:{status}")
-            return status.upper()
-        elif message_type == "progress":
-            progress = message_data.get("progress", None)
-            print(f"Progress:{progress}")
-        elif message_type == "error":
-            error = message_data.get("message", None)
-            print(f"Error:{error}")
-
-
-def get_values(message: str, job_id: str) -> dict:
-    """Parse the message and return the calculated values."""
+def connect_to_ocm(user_id: str, token: str):
+    """Connect to the OnScale Cloud Messaging service.
+
+    Keepalive pings are sent every ``websocket_ping_interval`` seconds and the connection is
+    dropped if the pong takes longer than ``websocket_ping_timeout`` seconds.
+    """
+    uri = f"{settings.ocm_socket_url}/user?userId={user_id}&Authorization={token}"
+    keepalive = {
+        "ping_interval": settings.websocket_ping_interval,
+        "ping_timeout": settings.websocket_ping_timeout,
+    }
+    if uri.startswith("ws://"):  # Unencrypted, for local test servers.
+        return connect(uri, **keepalive)
+    return connect(uri, ssl=get_ssl_context(), **keepalive)
+
+
+def reconnect_delay(attempt: int) -> float:
+    """Get a random delay before reconnecting, growing exponentially with the attempt number.
+
+    The delay is drawn between zero and ``websocket_reconnect_delay * 2**attempt``, capped at
+    ``websocket_max_reconnect_delay``, so that clients dropped together do not reconnect together.
+    """
+    ceiling = settings.websocket_reconnect_delay * 2 ** min(attempt, 32)
+    return random.uniform(0, min(ceiling, settings.websocket_max_reconnect_delay))
+
+
+def get_job_statuses(job_ids: list[str], token: str) -> dict[str, str]:
+    """Load the current status of each job from OCM, bypassing the job cache."""
+    from ansys.conceptev.core import ocm
+
+    with ocm.OCMSession() as session:
+        return {
+            job_id: ocm.get_status({"job_id": job_id}, token, session=session, use_cache=False)
+            for job_id in job_ids
+        }
+
+
+async def reconcile_messages(job_ids: list[str], token: str) -> list[str]:
+    """Get status messages for jobs whose status may have been missed while not connected."""
+    if not job_ids:
+        return []
+    try:
+        statuses = await asyncio.to_thread(get_job_statuses, job_ids, token)
+    except (httpx.HTTPError, ResponseError) as err:
+        logger.warning("Could not load the status of jobs %s: %s", job_ids, err)
+        return []
+    return [
+        json.dumps({"jobId": job_id, "messagetype": MESSAGE_STATUS, "status": status})
+        for job_id, status in statuses.items()
+    ]
+
+
+async def stream_messages(
+    user_id: str,
+    token: str,
+    refresh_token: Callable[[], str],
+    job_ids: Callable[[], list[str]],
+    on_connect: Callable[[], None] | None = None,
+):
+    """Yield OCM websocket messages, reconnecting whenever the connection is lost.
+
+    Reconnections wait for ``reconnect_delay`` and use a token from ``refresh_token``. After
+    each connection the status of the jobs returned by ``job_ids`` is loaded from OCM and
+    yielded as status messages, so a status sent before connecting or while disconnected is
+    not missed. A connection
+    error is raised once ``websocket_max_reconnects`` reconnections in a row have not received
+    any message.
+    """
+    attempt = 0
+    while True:
+        try:
+            async with connect_to_ocm(user_id, token) as websocket:
+                logger.info("Connected to OCM Websockets.")
+                if on_connect is not None:
+                    on_connect()
+                for message in await reconcile_messages(job_ids(), token):
+                    yield message
+                async for message in websocket:
+                    attempt = 0
+                    yield message
+        except RECONNECT_ERRORS as err:
+            if attempt >= settings.websocket_max_reconnects:
+                raise
+            logger.warning("Lost the connection to OCM Websockets: %s", err)
+        await asyncio.sleep(reconnect_delay(attempt))
+        attempt += 1
+        token = await asyncio.to_thread(refresh_token)
+
+
+@dataclass(slots=True)
+class JobEvent:
+    """A decoded OCM websocket message.
+
+    ``kind`` is one of ``MESSAGE_STATUS``, ``MESSAGE_PROGRESS``, ``MESSAGE_ERROR`` or
+    ``MESSAGE_CALCULATED_VALUES``, or the raw message type for other messages. Only the field of
+    that kind is set.
+    """
+
+    job_id: str | None
+    kind: str | None
+    status: str | None = None
+    progress: float | None = None
+    error: str | None = None
+    calculated_values: dict | None = None
+
+
+def decode_message(message: str | bytes) -> JobEvent:
+    """Parse a websocket message into an event.
+
+    A progress message with a progress of 1 and calculated values becomes a
+    ``MESSAGE_CALCULATED_VALUES`` event. Statuses are upper case.
+    """
     message_data = json.loads(message)
+    kind = message_data.get("messagetype")
+    event = JobEvent(message_data.get("jobId"), kind)
+    if kind == MESSAGE_STATUS:
+        event.status = (message_data.get("status") or "").upper() or None
+    elif kind == MESSAGE_PROGRESS:
+        event.progress = message_data.get("progress")
+        if event.progress == 1 and message_data.get("calculated_values") is not None:
+            event.kind = MESSAGE_CALCULATED_VALUES
+            event.calculated_values = message_data["calculated_values"]
+    elif kind == MESSAGE_ERROR:
+        event.error = message_data.get("message")
+    return event
+
+
+def format_event(event: JobEvent) -> str | None:
+    """Describe an event in one line, or ``None`` for events that are not reported."""
+    if event.kind == MESSAGE_STATUS:
+        return f"Status:{event.status}"
+    if event.kind == MESSAGE_PROGRESS:
+        return f"Progress:{event.progress}"
+    if event.kind == MESSAGE_ERROR:
+        return f"Error:{event.error}"
+    if event.kind == MESSAGE_CALCULATED_VALUES:
+        return f"Calculated Values:{event.calculated_values}"
+    return None
+
+
+def print_event(event: JobEvent) -> None:
+    """Print an event to the standard output."""
+    text = format_event(event)
+    if text is not None:
+        print(text)
+
+
+def log_event(event: JobEvent) -> None:
+    """Log an event. Progress and calculated values are only logged at debug level."""
+    level = (
+        logging.DEBUG
+        if event.kind in (MESSAGE_PROGRESS, MESSAGE_CALCULATED_VALUES)
+        else logging.INFO
+    )
+    if event.kind == MESSAGE_ERROR:
+        level = logging.ERROR
+    if logger.isEnabledFor(level):
+        text = format_event(event)
+        if text is not None:
+            logger.log(level, "Job %s %s", event.job_id, text)
+
+
+def get_status(
+    message: str | JobEvent, job_id: str, report: Callable[[JobEvent], None] | None = print_event
+):
+    """Parse the message and return the status, if it is a status message of the job.
+
+    Every message of the job is passed to ``report``.
+    """
+    event = message if isinstance(message, JobEvent) else decode_message(message)
+    if event.job_id != job_id:
+        return None
+    if report is not None:
+        report(event)
+    return event.status
 
-    if message_data.get("jobId", "Unknown") == job_id:
-        message_type = message_data.get("messagetype", None)
-        if message_type == "progress" and message_data.get("progress", None) == 1:
-            calculated_values = message_data.get("calculated_values", None)
-            print(f"Calculated Values:{calculated_values}")
-            return calculated_values
+
+def get_values(
+    message: str | JobEvent, job_id: str, report: Callable[[JobEvent], None] | None = print_event
+) -> dict:
+    """Parse the message and return the calculated values, if the message holds them."""
+    event = message if isinstance(message, JobEvent) else decode_message(message)
+    if event.job_id != job_id or event.kind != MESSAGE_CALCULATED_VALUES:
+        return None
+    if report is not None:
+        report(event)
+    return event.calculated_values
+
+
+def connected() -> None:
+    """Print that the websocket is connected."""
+    print("Connected to OCM Websockets.")
 
 
 async def get_job_messages(
-    job_id: str, user_id: str, token: str, app: PublicClientApplication, timeout=JOB_TIMEOUT
+    job_id: str, user_id: str, token: str, app: PublicClientApplication, timeout=None
 ):
     """Get job messages and error on timeout."""
+    timeout = settings.job_timeout if timeout is None else timeout
     try:
         async with async_timeout.timeout(timeout):
-            while True:
-                websocket_client = connect_to_ocm(user_id, token)
-                async with websocket_client as websocket:
-                    print("Connected to OCM Websockets.")
-                    async for message in websocket:
-                        yield message
-                token = get_ansyId_token(app)
+            async for message in stream_messages(
+                user_id, token, lambda: get_ansyId_token(app), lambda: [job_id], connected
+            ):
+                yield message
     except TimeoutError as err:
         raise Exception(
             f"Timeout Error: Job ({job_id}) is taking too long to complete (>{timeout} seconds)."
@@ -124,21 +325,34 @@ async def get_job_messages(
 
 
 async def monitor_job_messages(
-    job_id: str, user_id: str, token: str, app: PublicClientApplication, timeout=JOB_TIMEOUT
+    job_id: str,
+    user_id: str,
+    token: str,
+    app: PublicClientApplication,
+    timeout=None,
+    report: Callable[[JobEvent], None] | None = print_event,
 ):
-    """Monitor job messages and return the status when complete."""
+    """Monitor job messages and return the status when complete.
+
+    Every message of the job is passed to ``report``, which prints it by default.
+    """
     async for message in get_job_messages(job_id, user_id, token, app, timeout):
-        status = get_status(message, job_id)
+        status = get_status(message, job_id, report)
         if check_status(status):
             return status
 
 
 async def get_calculated_values(
-    job_id: str, user_id: str, token: str, app: PublicClientApplication, timeout=JOB_TIMEOUT
+    job_id: str,
+    user_id: str,
+    token: str,
+    app: PublicClientApplication,
+    timeout=None,
+    report: Callable[[JobEvent], None] | None = print_event,
 ):
     """Get Calculated Values."""
     async for message in get_job_messages(job_id, user_id, token, app, timeout):
-        values = get_values(message, job_id)
+        values = get_values(message, job_id, report)
         if values is not None:
             return values
 
@@ -154,13 +368,324 @@ def check_status(status: str):
 
 
 def monitor_job_progress(
-    job_id: str, user_id: str, token: str, app: PublicClientApplication, timeout=JOB_TIMEOUT
+    job_id: str,
+    user_id: str,
+    token: str,
+    app: PublicClientApplication,
+    timeout=None,
+    report: Callable[[JobEvent], None] | None = print_event,
 ):
     """Monitor job progress and return the status when complete."""
-    result = asyncio.run(monitor_job_messages(job_id, user_id, token, app, timeout))
+    timeout = settings.job_timeout if timeout is None else timeout
+    result = asyncio.run(monitor_job_messages(job_id, user_id, token, app, timeout, report))
     return result
 
 
+class JobMonitor:
+    """Monitor many jobs over one OCM websocket connection.
+
+    The OCM websocket sends the messages of all jobs of a user, so one connection is enough to
+    follow any number of jobs. Each message is decoded once into a ``JobEvent``, passed to
+    ``report``, which logs it by default, and dispatched by ``jobId`` to the watched job, which
+    updates its status, calls its callbacks and resolves its future when it reaches a final
+    status. The connection is only kept open while there are jobs left to finish. Final statuses
+    and calculated values of jobs that are not watched yet are remembered, so a job that
+    finishes between being submitted and being watched is not missed.
+
+    .. code-block:: python
+
+       async with JobMonitor(user_id, token, msal_app) as monitor:
+           for job_id in job_ids:
+               monitor.watch(job_id)
+           async for job_id, status in monitor.as_completed():
+               print(job_id, status)
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        token: str,
+        app: PublicClientApplication,
+        timeout=None,
+        report: Callable[[JobEvent], None] | None = log_event,
+    ):
+        """Initialize the monitor without connecting."""
+        self.user_id = user_id
+        self.token = token
+        self.app = app
+        self.timeout = settings.job_timeout if timeout is None else timeout
+        self.statuses: dict[str, str | None] = {}
+        self.futures: dict[str, asyncio.Future] = {}
+        self.report = report
+        self.callbacks: dict[str, list[Callable[[str, JobEvent], None]]] = {}
+        self.unwatched: dict[str, str] = {}
+        self.values: dict[str, asyncio.Future] = {}
+        self.unwatched_values: dict[str, dict] = {}
+        self.listener: asyncio.Task | None = None
+
+    def watch(
+        self, job_id: str, callback: Callable[[str, JobEvent], None] | None = None
+    ) -> asyncio.Future:
+        """Start watching a job and return a future resolving to its final status.
+
+        The callback, if given, is called with the job ID and the ``JobEvent`` of every
+        message of the job. Must be called from within a running event loop.
+        """
+        if job_id not in self.futures:
+            self.futures[job_id] = asyncio.get_running_loop().create_future()
+            self.statuses[job_id] = None
+            if job_id in self.unwatched:
+                self.set_status(job_id, self.unwatched.pop(job_id))
+        if callback is not None:
+            self.callbacks.setdefault(job_id, []).append(callback)
+        self.start()
+        return self.futures[job_id]
+
+    def watch_values(self, job_id: str) -> asyncio.Future:
+        """Start watching a job and return a future resolving to its calculated values.
+
+        The future resolves to ``None`` if the job fails. Must be called from within a running
+        event loop.
+        """
+        if job_id not in self.values:
+            self.values[job_id] = asyncio.get_running_loop().create_future()
+            if job_id in self.unwatched_values:
+                self.values[job_id].set_result(self.unwatched_values.pop(job_id))
+        self.watch(job_id)
+        return self.values[job_id]
+
+    def status(self, job_id: str) -> str | None:
+        """Get the last known status of a watched job."""
+        return self.statuses[job_id]
+
+    def pending(self) -> list[str]:
+        """Get the IDs of the watched jobs that have not finished or are waiting for values."""
+        return [
+            job_id
+            for job_id, future in self.futures.items()
+            if not future.done() or (job_id in self.values and not self.values[job_id].done())
+        ]
+
+    def start(self) -> None:
+        """Start listening to the websocket if there is no listener running."""
+        if self.pending() and (self.listener is None or self.listener.done()):
+            self.listener = asyncio.create_task(self.listen())
+            self.listener.add_done_callback(self.listener_done)
+
+    async def listen(self) -> None:
+        """Dispatch websocket messages until all watched jobs have finished."""
+        if not self.pending():
+            return
+        messages = stream_messages(self.user_id, self.token, self.refresh_token, self.pending)
+        try:
+            async for message in messages:
+                self.dispatch(message)
+                if not self.pending():
+                    return
+        finally:
+            await messages.aclose()
+
+    def refresh_token(self) -> str:
+        """Get a fresh token for the next connection."""
+        self.token = get_ansyId_token(self.app)
+        return self.token
+
+    def listener_done(self, listener: asyncio.Task) -> None:
+        """Pass a listener failure on to every job still waiting."""
+        if listener.cancelled() or listener.exception() is None:
+            return
+        for job_id in self.pending():
+            for futures in (self.futures, self.values):
+                if job_id in futures and not futures[job_id].done():
+                    futures[job_id].set_exception(listener.exception())
+
+    def dispatch(self, message: str) -> None:
+        """Route a websocket message to the job it belongs to."""
+        event = decode_message(message)
+        if event.job_id not in self.futures:
+            self.remember(event)
+            return
+        if self.report is not None:
+            self.report(event)
+        for callback in self.callbacks.get(event.job_id, []):
+            callback(event.job_id, event)
+        values = self.values.get(event.job_id)
+        if event.calculated_values is not None and values is not None and not values.done():
+            values.set_result(event.calculated_values)
+        if event.status:
+            self.set_status(event.job_id, event.status)
+
+    def remember(self, event: JobEvent) -> None:
+        """Remember the final status or calculated values of a job that is not watched."""
+        if event.job_id is None:
+            return
+        if event.status in FINAL_STATUSES:
+            remembered = self.unwatched
+            remembered[event.job_id] = event.status
+        elif event.calculated_values is not None:
+            remembered = self.unwatched_values
+            remembered[event.job_id] = event.calculated_values
+        else:
+            return
+        if len(remembered) > UNWATCHED_STATUS_LIMIT:
+            remembered.pop(next(iter(remembered)))
+
+    def set_status(self, job_id: str, status: str) -> None:
+        """Record the status of a job and resolve its future if the status is final."""
+        self.statuses[job_id] = status
+        future = self.futures[job_id]
+        if status in FINAL_STATUSES and not future.done():
+            future.set_result(status)
+        values = self.values.get(job_id)
+        if status == STATUS_ERROR and values is not None and not values.done():
+            values.set_result(None)
+
+    async def wait_for(self, job_id: str) -> tuple[str, str]:
+        """Wait for a watched job to finish and return its ID and final status."""
+        return job_id, await asyncio.shield(self.futures[job_id])
+
+    async def wait_all(self, timeout: float | None = None) -> dict[str, str]:
+        """Wait for all watched jobs to finish and return their final statuses."""
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            async with async_timeout.timeout(timeout):
+                finished = await asyncio.gather(*[self.wait_for(job_id) for job_id in self.futures])
+        except TimeoutError as err:
+            raise Exception(
+                f"Timeout Error: Jobs {self.pending()} are taking too long to complete"
+                f" (>{timeout} seconds)."
+            ) from err
+        return dict(finished)
+
+    async def as_completed(self, timeout: float | None = None):
+        """Yield the ID and final status of each watched job as it finishes."""
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            async with async_timeout.timeout(timeout):
+                for finished in asyncio.as_completed(
+                    [self.wait_for(job_id) for job_id in self.futures]
+                ):
+                    yield await finished
+        except TimeoutError as err:
+            raise Exception(
+                f"Timeout Error: Jobs {self.pending()} are taking too long to complete"
+                f" (>{timeout} seconds)."
+            ) from err
+
+    async def close(self) -> None:
+        """Stop listening to the websocket."""
+        if self.listener is not None and not self.listener.done():
+            self.listener.cancel()
+            try:
+                await self.listener
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self) -> "JobMonitor":
+        """Enter the context manager."""
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Stop listening on exit."""
+        await self.close()
+
+
+async def monitor_jobs_messages(
+    job_ids: list[str],
+    user_id: str,
+    token: str,
+    app: PublicClientApplication,
+    timeout=None,
+) -> dict[str, str]:
+    """Monitor many jobs over one websocket and return their final statuses."""
+    async with JobMonitor(user_id, token, app, timeout) as monitor:
+        for job_id in job_ids:
+            monitor.watch(job_id)
+        return await monitor.wait_all()
+
+
+async def wait_for_values(
+    monitor: JobMonitor,
+    job_id: str,
+    timeout: float,
+    poll: Callable[[str], dict | None] | None = None,
+    poll_interval: float = 5.0,
+) -> tuple[str, dict | None]:
+    """Wait for the calculated values of a job watched by the monitor.
+
+    If the values do not arrive within ``timeout`` seconds, or the websocket fails, ``poll`` is
+    called with the job ID every ``poll_interval`` seconds until it returns the values or the
+    timeout is over, and at least once. Returns ``None`` as values if they could not be found.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        return job_id, await asyncio.wait_for(asyncio.shield(monitor.values[job_id]), timeout)
+    except RECONNECT_ERRORS as err:
+        if poll is None:
+            logger.warning("No calculated values received for job %s: %r", job_id, err)
+            return job_id, None
+        logger.info("Polling the calculated values of job %s: %r", job_id, err)
+    while True:
+        try:
+            values = await asyncio.to_thread(poll, job_id)
+        except Exception as err:
+            logger.warning("Could not poll the calculated values of job %s: %s", job_id, err)
+            values = None
+        remaining = deadline - loop.time()
+        if values is not None or remaining <= 0:
+            return job_id, values
+        await asyncio.sleep(min(poll_interval, remaining))
+
+
+async def stream_calculated_values(
+    job_ids: list[str],
+    user_id: str,
+    token: str,
+    app: PublicClientApplication,
+    timeout=None,
+    poll: Callable[[str], dict | None] | None = None,
+    poll_interval: float = 5.0,
+):
+    """Yield the job ID and calculated values of many jobs as the values arrive.
+
+    All the jobs are followed over one websocket connection. Each job waits at most
+    ``timeout`` seconds for its values, after which, or if the websocket fails, ``poll`` is
+    used to get them instead, see ``wait_for_values``. Jobs that fail or whose values cannot be
+    found are yielded with ``None`` as values.
+
+    .. code-block:: python
+
+       async for job_id, values in stream_calculated_values(job_ids, user_id, token, msal_app):
+           print(job_id, values)
+    """
+    timeout = settings.job_timeout if timeout is None else timeout
+    async with JobMonitor(user_id, token, app, timeout) as monitor:
+        job_ids = list(dict.fromkeys(job_ids))
+        for job_id in job_ids:
+            monitor.watch_values(job_id)
+        waits = [
+            wait_for_values(monitor, job_id, timeout, poll, poll_interval) for job_id in job_ids
+        ]
+        for finished in asyncio.as_completed(waits):
+            yield await finished
+
+
+def monitor_jobs_progress(
+    job_ids: list[str],
+    user_id: str,
+    token: str,
+    app: PublicClientApplication,
+    timeout=None,
+) -> dict[str, str]:
+    """Monitor many jobs and return their final statuses when all are finished.
+
+    Unlike calling ``monitor_job_progress`` for each job, one websocket connection is shared by
+    all the jobs.
+    """
+    return asyncio.run(monitor_jobs_messages(job_ids, user_id, token, app, timeout))
+
+
 if __name__ == "__main__":
     """Monitor a single job progress."""
     from ansys.conceptev.core.app import get_user_id
@@ -0,0 +1,147 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""On-disk cache of completed job results."""
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Any
+
+from ansys.conceptev.core.settings import settings
+
+RESULT_CACHE_MAX_BYTES = 1024**3
+RESULT_SUFFIX = ".json"
+
+
+class ResultCache:
+    """Cache of job results on disk with a size limit and least recently used eviction.
+
+    The results of a completed job never change, so each entry is stored under a
+    hash of the job ID, result file name, ``calculate_units`` and ``filtered``
+    values. Reading an entry marks it as recently used by updating its
+    modification time, and the oldest entries are removed once the cache grows
+    past ``max_bytes``.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = RESULT_CACHE_MAX_BYTES):
+        """Create a cache in ``directory``, creating the directory if needed."""
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(job_id: str, filename: str, calculate_units: bool, filtered: bool) -> str:
+        """Get the cache key for a job result."""
+        parts = json.dumps([job_id, filename, bool(calculate_units), bool(filtered)])
+        return hashlib.sha256(parts.encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Get the path of the file holding an entry."""
+        return self.directory / f"{key}{RESULT_SUFFIX}"
+
+    def get(self, key: str) -> Any | None:
+        """Get a cached result or ``None`` if it is not cached."""
+        path = self.path(key)
+        try:
+            with open(path, "rb") as file:
+                result = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self.invalidate(key)  # A damaged entry is downloaded again.
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # Evicted by another process since it was read.
+        return result
+
+    def set(self, key: str, result: Any) -> None:
+        """Store a result and evict the oldest entries beyond the size limit."""
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w") as file:
+                json.dump(result, file)
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def invalidate(self, key: str) -> None:
+        """Remove an entry."""
+        self.path(key).unlink(missing_ok=True)
+
+    def entries(self) -> list[tuple[Path, os.stat_result]]:
+        """Get the paths and file details of all entries, least recently used first."""
+        entries = []
+        for path in self.directory.glob(f"*{RESULT_SUFFIX}"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        return sorted(entries, key=lambda entry: entry[1].st_mtime)
+
+    def size(self) -> int:
+        """Get the total size of the cached results in bytes."""
+        return sum(stat.st_size for _, stat in self.entries())
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits in ``max_bytes``."""
+        with self.lock:
+            entries = self.entries()
+            total = sum(stat.st_size for _, stat in entries)
+            for path, stat in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= stat.st_size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path, _ in self.entries():
+            path.unlink(missing_ok=True)
+
+
+result_caches: dict[tuple[str, int], ResultCache] = {}
+
+
+def get_default_result_cache() -> ResultCache | None:
+    """Get the cache configured by the ``result_cache_dir`` setting, if any."""
+    if not settings.result_cache_dir:
+        return None
+    directory = str(Path(settings.result_cache_dir).expanduser())
+    key = (directory, settings.result_cache_max_bytes)
+    if key not in result_caches:
+        result_caches[key] = ResultCache(directory, settings.result_cache_max_bytes)
+    return result_caches[key]
+
+
+def resolve_result_cache(cache: ResultCache | None, use_cache: bool) -> ResultCache | None:
+    """Get the cache to use for a result request."""
+    if not use_cache:
+        return None
+    return cache if cache is not None else get_default_result_cache()
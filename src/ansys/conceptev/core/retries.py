@@ -0,0 +1,261 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Retry policy shared by the ConceptEV and OCM clients.
+
+Requests rejected before being processed, with a 429 or 503 status or a failure to connect, are
+retried whatever their method. Requests that may have been processed, with a 502 or 504
+status or a failure while sending or reading, are only retried if sending them twice is
+harmless: idempotent methods, POSTs to read-only routes and requests marked with the
+``RETRY_SAFE`` extension.
+"""
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import functools
+import inspect
+import logging
+import threading
+
+import httpx
+from tenacity import (
+    RetryCallState,
+    retry,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_random_exponential,
+)
+
+from ansys.conceptev.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+UNPROCESSED_STATUSES = frozenset({429, 503})
+GATEWAY_STATUSES = frozenset({502, 504})
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+TRANSPORT_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+SAFE_POST_ROUTES = (
+    "/jobs:result",
+    "/user/details",
+    "/account/list",
+    "/account/hpc/default",
+    "/design/load",
+    "/design/instance/load",
+    "/job/load",
+    "/project/list/page",
+)
+RETRY_SAFE = "conceptev_retry_safe"
+
+
+@dataclass
+class RetryMetrics:
+    """Counts of the retries done by the clients.
+
+    ``retries`` counts retries by reason, a status code or an error name, ``gave_up`` the
+    requests that still failed when the policy stopped retrying and ``wait_seconds`` the total
+    time spent waiting between attempts.
+    """
+
+    retries: Counter = field(default_factory=Counter)
+    gave_up: int = 0
+    wait_seconds: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_retry(self, reason: str, wait: float) -> None:
+        """Count one retry."""
+        with self.lock:
+            self.retries[reason] += 1
+            self.wait_seconds += wait
+
+    def record_give_up(self) -> None:
+        """Count one request that failed after all its retries."""
+        with self.lock:
+            self.gave_up += 1
+
+    def snapshot(self) -> dict:
+        """Get a copy of the counts."""
+        with self.lock:
+            return {
+                "retries": dict(self.retries),
+                "gave_up": self.gave_up,
+                "wait_seconds": self.wait_seconds,
+            }
+
+    def reset(self) -> None:
+        """Set all counts back to zero."""
+        with self.lock:
+            self.retries.clear()
+            self.gave_up = 0
+            self.wait_seconds = 0.0
+
+
+retry_metrics = RetryMetrics()
+
+
+def retry_after(response: httpx.Response) -> float | None:
+    """Get the number of seconds to wait from the ``Retry-After`` header of a response."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def request_of(retry_state: RetryCallState) -> httpx.Request:
+    """Get the request sent by a tenacity call of a ``send`` method."""
+    return retry_state.args[0] if retry_state.args else retry_state.kwargs["request"]
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to retry a request.
+
+    A request is sent at most ``max_attempts`` times and not retried after ``max_delay``
+    seconds. Between attempts the policy waits a random, exponentially growing time of at most
+    ``max_wait`` seconds, or the time asked for by a ``Retry-After`` header, also capped at
+    ``max_wait``. When the policy gives up, the last response is returned or the last error
+    raised.
+    """
+
+    max_attempts: int = 10
+    max_delay: float = 120.0
+    max_wait: float = 60.0
+    safe_routes: tuple[str, ...] = SAFE_POST_ROUTES
+    metrics: RetryMetrics = field(default_factory=lambda: retry_metrics)
+
+    def is_retry_safe(self, request: httpx.Request) -> bool:
+        """Check whether sending the request twice is harmless."""
+        if request.method in IDEMPOTENT_METHODS or request.extensions.get(RETRY_SAFE):
+            return True
+        return request.method == "POST" and request.url.path.endswith(self.safe_routes)
+
+    def retry_reason(
+        self,
+        request: httpx.Request,
+        response: httpx.Response | None = None,
+        error: BaseException | None = None,
+    ) -> str | None:
+        """Get why a request should be retried, or ``None`` if it should not."""
+        if response is not None:
+            status = response.status_code
+            if status in UNPROCESSED_STATUSES or (
+                status in GATEWAY_STATUSES and self.is_retry_safe(request)
+            ):
+                return str(status)
+            return None
+        if isinstance(error, UNSENT_ERRORS) or (
+            isinstance(error, TRANSPORT_ERRORS) and self.is_retry_safe(request)
+        ):
+            return type(error).__name__
+        return None
+
+    def state_reason(self, retry_state: RetryCallState) -> str | None:
+        """Get why the attempt of a tenacity call should be retried."""
+        outcome = retry_state.outcome
+        if outcome.failed:
+            return self.retry_reason(request_of(retry_state), error=outcome.exception())
+        return self.retry_reason(request_of(retry_state), response=outcome.result())
+
+    def wait(self, retry_state: RetryCallState) -> float:
+        """Get the time to wait before the next attempt of a tenacity call."""
+        outcome = retry_state.outcome
+        if not outcome.failed:
+            seconds = retry_after(outcome.result())
+            if seconds is not None:
+                return min(seconds, self.max_wait)
+        return wait_random_exponential(multiplier=1, max=self.max_wait)(retry_state)
+
+    def before_sleep(self, retry_state: RetryCallState) -> None:
+        """Count and log a retry."""
+        reason = self.state_reason(retry_state)
+        wait = retry_state.next_action.sleep
+        self.metrics.record_retry(reason, wait)
+        request = request_of(retry_state)
+        logger.info(
+            "Retrying %s %s in %.1f seconds after %s.", request.method, request.url, wait, reason
+        )
+
+    def give_up(self, retry_state: RetryCallState):
+        """Count a request that is still failing and return its last response or raise."""
+        self.metrics.record_give_up()
+        return retry_state.outcome.result()
+
+    def wrap(self, send):
+        """Wrap the send method of a client so that requests are retried by this policy.
+
+        Works for both ``httpx.Client`` and ``httpx.AsyncClient`` send methods. The body of a
+        response that will be retried is read, which closes it and releases its connection
+        before waiting, even for streamed requests.
+        """
+        if inspect.iscoroutinefunction(send):
+
+            @functools.wraps(send)
+            async def send_and_release(request: httpx.Request, **kwargs) -> httpx.Response:
+                response = await send(request, **kwargs)
+                if self.retry_reason(request, response=response) is not None:
+                    await response.aread()
+                return response
+
+        else:
+
+            @functools.wraps(send)
+            def send_and_release(request: httpx.Request, **kwargs) -> httpx.Response:
+                response = send(request, **kwargs)
+                if self.retry_reason(request, response=response) is not None:
+                    response.read()
+                return response
+
+        return retry(
+            retry=lambda retry_state: self.state_reason(retry_state) is not None,
+            wait=self.wait,
+            stop=stop_after_attempt(self.max_attempts) | stop_after_delay(self.max_delay),
+            before_sleep=self.before_sleep,
+            retry_error_callback=self.give_up,
+        )(send_and_release)
+
+
+def default_retry_policy() -> RetryPolicy:
+    """Get a retry policy with the limits from the settings, counting in ``retry_metrics``."""
+    return RetryPolicy(
+        max_attempts=settings.retry_max_attempts,
+        max_delay=settings.retry_max_delay,
+        max_wait=settings.retry_max_wait,
+    )
+
+
+def retrying(
+    client: httpx.Client | httpx.AsyncClient, policy: RetryPolicy | None = None
+) -> httpx.Client | httpx.AsyncClient:
+    """Make a client retry its requests, with the default policy unless one is given."""
+    policy = default_retry_policy() if policy is None else policy
+    client.send = policy.wrap(client.send)
+    return client
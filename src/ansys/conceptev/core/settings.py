@@ -22,6 +22,7 @@
 """Settings specification and reading."""
 import os
 from pathlib import Path
+import threading
 from typing import Annotated
 
 try:
@@ -54,6 +55,24 @@ class Settings(BaseSettings):
     conceptev_username: EmailStr | None = None  # Only works in testing environment
     conceptev_password: str | None = None  # Only works in testing environment
     account_name: str | None
+    result_cache_dir: str | None = None
+    result_cache_max_bytes: int = 1024**3
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_connect_timeout: float = 10.0
+    http_read_timeout: float = 60.0
+    http_write_timeout: float = 60.0
+    http_pool_timeout: float = 30.0
+    http2: bool = False  # Needs the http2 extra: pip install ansys-conceptev-core[http2]
+    retry_max_attempts: int = 10
+    retry_max_delay: float = 120.0
+    retry_max_wait: float = 60.0
+    websocket_ping_interval: float | None = 20.0
+    websocket_ping_timeout: float | None = 20.0
+    websocket_reconnect_delay: float = 1.0
+    websocket_max_reconnect_delay: float = 60.0
+    websocket_max_reconnects: int = 10
     model_config = SettingsConfigDict(
         env_file=[
             os.environ.get("PYCONCEPTEV_SETTINGS", RESOURCE_DIRECTORY / "config.toml"),
@@ -70,4 +89,37 @@ def load_settings(toml_file) -> Settings:
     return Settings.model_validate({k.lower(): v for k, v in settings_data.items()})
 
 
-settings = Settings()
+class LazySettings:
+    """Settings that are read and validated on first use rather than on import.
+
+    Attributes are read from and written to the loaded ``Settings``, so the object can be used
+    wherever a ``Settings`` is expected.
+    """
+
+    def __init__(self):
+        """Initialize without loading the settings."""
+        self.__dict__["instance"] = None
+        self.__dict__["lock"] = threading.Lock()
+
+    def load(self) -> Settings:
+        """Get the settings, loading them if they have not been loaded yet."""
+        if self.instance is None:
+            with self.lock:
+                if self.instance is None:
+                    self.__dict__["instance"] = Settings()
+        return self.instance
+
+    def reset(self) -> None:
+        """Forget the loaded settings so that they are read again on next use."""
+        self.__dict__["instance"] = None
+
+    def __getattr__(self, name: str):
+        """Get a setting."""
+        return getattr(self.load(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        """Change a setting."""
+        setattr(self.load(), name, value)
+
+
+settings = LazySettings()
@@ -0,0 +1,140 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Fixtures for the benchmarks, which run against local mock services.
+
+The benchmarks are deselected by default. Run them with ``pytest -m benchmark tests/benchmarks``.
+Set ``CONCEPTEV_BENCHMARK_REPORT`` to a file path to write the measurements as JSON, for example
+to compare two releases. The wall-clock checks, marked ``timing``, only run when
+``CONCEPTEV_BENCHMARK_TIMING`` is set.
+"""
+
+from dataclasses import asdict, dataclass
+import json
+import os
+import statistics
+import time
+from typing import Callable
+
+from mock_services import LATENCY, MockServices
+import pytest
+
+from ansys.conceptev.core import app, ocm
+from ansys.conceptev.core.settings import settings
+
+measurements: list["Measurement"] = []
+
+
+@dataclass
+class Measurement:
+    """Timing and request count of repeated calls to one operation."""
+
+    name: str
+    calls: int
+    mean_seconds: float
+    p95_seconds: float
+    calls_per_second: float
+    requests_per_call: float
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the wall-clock checks unless ``CONCEPTEV_BENCHMARK_TIMING`` is set."""
+    if os.environ.get("CONCEPTEV_BENCHMARK_TIMING"):
+        return
+    skip = pytest.mark.skip(reason="set CONCEPTEV_BENCHMARK_TIMING to check wall-clock times")
+    for item in items:
+        if "timing" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def services():
+    """Start the mock services for the whole session."""
+    services = MockServices(settings.account_name, latency=LATENCY)
+    services.start()
+    yield services
+    services.stop()
+
+
+@pytest.fixture(autouse=True)
+def use_services(services, monkeypatch):
+    """Point the library at the mock services, with empty caches."""
+    monkeypatch.setattr(settings, "conceptev_url", services.conceptev_url)
+    monkeypatch.setattr(settings, "ocm_url", services.ocm_url)
+    monkeypatch.setattr(settings, "ocm_socket_url", services.ocm_socket_url)
+    monkeypatch.setattr(services, "latency", LATENCY)
+    monkeypatch.setattr(services, "job_duration", 0.0)
+    ocm.clear_metadata_cache()
+    app.clear_data_format_version_cache()
+    services.reset()
+    yield
+    ocm.clear_metadata_cache()
+    app.clear_data_format_version_cache()
+
+
+@pytest.fixture
+def measure(services) -> Callable[..., Measurement]:
+    """Measure calls to an operation and the requests they send.
+
+    The operation is called once to warm up connections and caches before it is measured.
+    """
+
+    def run(name: str, operation: Callable[[], object], calls: int = 10) -> Measurement:
+        operation()
+        services.reset()
+        durations = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            operation()
+            durations.append(time.perf_counter() - start)
+        durations.sort()
+        measurement = Measurement(
+            name=name,
+            calls=calls,
+            mean_seconds=statistics.mean(durations),
+            p95_seconds=durations[max(round(0.95 * calls) - 1, 0)],
+            calls_per_second=calls / sum(durations),
+            requests_per_call=services.count() / calls,
+        )
+        measurements.append(measurement)
+        return measurement
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print the measurements and write them to the report file if one is set."""
+    if not measurements:
+        return
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'operation':<40} {'mean ms':>9} {'p95 ms':>9} {'calls/s':>9} {'requests':>9}"
+    )
+    for measurement in measurements:
+        terminalreporter.write_line(
+            f"{measurement.name:<40} {measurement.mean_seconds * 1000:>9.1f}"
+            f" {measurement.p95_seconds * 1000:>9.1f} {measurement.calls_per_second:>9.1f}"
+            f" {measurement.requests_per_call:>9.1f}"
+        )
+    report = os.environ.get("CONCEPTEV_BENCHMARK_REPORT")
+    if report:
+        with open(report, "w") as file:
+            json.dump([asdict(measurement) for measurement in measurements], file, indent=2)
@@ -0,0 +1,294 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Local stand-in for the ConceptEV API, OCM, signed URL downloads and the OCM websocket."""
+
+import asyncio
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import re
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+import uuid
+
+from websockets.asyncio.server import serve
+
+LATENCY = 0.01  # Seconds added to each HTTP response in the benchmarks, like a nearby server.
+DATA_FORMAT_VERSION = 3
+RESULTS = [{"requirement": {"name": "Drive cycle"}, "capability_curve": {"speeds": [0, 10, 20]}}]
+CONCEPT_PARTS = ["configurations", "components", "requirements", "architecture"]
+
+
+def route_name(pattern: str) -> str:
+    """Get the name of a route pattern, with its groups replaced by ``{id}``."""
+    return re.sub(r"\(.*?\)", "{id}", pattern)
+
+
+def concept_of(design_instance_id: str) -> dict:
+    """Get the concept stored in a design instance."""
+    return {
+        "id": f"concept_{design_instance_id}",
+        "design_instance_id": design_instance_id,
+        "requirements_ids": ["requirement"],
+        "architecture_id": "architecture",
+        "jobs_ids": [],
+    }
+
+
+class MockServices:
+    """Serve the routes used by the library from one local HTTP server and one websocket server.
+
+    ``latency`` seconds are added to every HTTP response. Jobs complete ``job_duration``
+    seconds after they are started, which ``/job/load`` and the websocket report. Requests are
+    counted per method and route, with IDs replaced by ``{id}``.
+    """
+
+    def __init__(self, account_name: str, latency: float = 0.0, job_duration: float = 0.0):
+        """Initialize the services without starting them."""
+        self.account_name = account_name
+        self.latency = latency
+        self.job_duration = job_duration
+        self.requests: Counter = Counter()
+        self.jobs: dict[str, float] = {}
+        self.lock = threading.Lock()
+        self.routes = [
+            ("GET", r"/api/concepts/([^/]+)", self.get_concept),
+            ("GET", r"/api/concepts/([^/]+)/(\w+)", self.get_concept_part),
+            ("POST", r"/api/concepts", self.create_concept),
+            ("POST", r"/api/concepts:copy", self.create_concept),
+            ("POST", r"/api/architectures", lambda query, body: {"id": str(uuid.uuid4())}),
+            ("POST", r"/api/jobs", self.create_job),
+            ("POST", r"/api/jobs:start", self.start_job),
+            ("POST", r"/api/jobs:result", lambda query, body: RESULTS),
+            ("GET", r"/api/utilities:data_format_version", lambda query, body: DATA_FORMAT_VERSION),
+            ("GET", r"/api/health", lambda query, body: "ok"),
+            ("GET", r"/ocm/product/list", self.list_products),
+            ("POST", r"/ocm/user/details", lambda query, body: {"userId": "user"}),
+            ("POST", r"/ocm/account/list", self.list_accounts),
+            ("POST", r"/ocm/account/hpc/default", lambda query, body: {"hpcId": "hpc"}),
+            ("POST", r"/ocm/design/create", self.create_design),
+            ("POST", r"/ocm/job/load", self.load_job),
+            ("GET", r"/ocm/job/files/list/([^/]+)", self.list_job_files),
+            ("GET", r"/s3/([^/]+)/([^/]+)", lambda query, body, job_id, name: RESULTS),
+        ]
+        self.http_server: ThreadingHTTPServer | None = None
+        self.websocket_port: int | None = None
+        self.websocket_stop: asyncio.Future | None = None
+        self.websocket_loop: asyncio.AbstractEventLoop | None = None
+        self.threads: list[threading.Thread] = []
+
+    @property
+    def http_url(self) -> str:
+        """Get the URL of the HTTP server."""
+        return f"http://127.0.0.1:{self.http_server.server_port}"
+
+    @property
+    def conceptev_url(self) -> str:
+        """Get the URL of the ConceptEV API."""
+        return f"{self.http_url}/api"
+
+    @property
+    def ocm_url(self) -> str:
+        """Get the URL of OCM."""
+        return f"{self.http_url}/ocm"
+
+    @property
+    def ocm_socket_url(self) -> str:
+        """Get the URL of the OCM websocket."""
+        return f"ws://127.0.0.1:{self.websocket_port}/socket"
+
+    def start(self) -> None:
+        """Start both servers in background threads."""
+        self.http_server = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        self.http_server.daemon_threads = True
+        self.http_server.services = self
+        ready = threading.Event()
+        self.threads = [
+            threading.Thread(target=self.http_server.serve_forever, daemon=True),
+            threading.Thread(target=self.run_websocket_server, args=(ready,), daemon=True),
+        ]
+        for thread in self.threads:
+            thread.start()
+        ready.wait(timeout=10)
+
+    def stop(self) -> None:
+        """Stop both servers."""
+        self.http_server.shutdown()
+        self.http_server.server_close()
+        self.websocket_loop.call_soon_threadsafe(self.websocket_stop.set_result, None)
+        for thread in self.threads:
+            thread.join(timeout=10)
+
+    def reset(self) -> None:
+        """Forget the counted requests."""
+        with self.lock:
+            self.requests.clear()
+
+    def count(self, route: str | None = None) -> int:
+        """Get the number of requests to a route, such as ``POST /ocm/job/load``, or in total."""
+        with self.lock:
+            if route is None:
+                return sum(self.requests.values())
+            return self.requests[route]
+
+    def handle(self, method: str, url: str, body: bytes) -> tuple[int, object]:
+        """Answer a request with a status code and JSON data."""
+        time.sleep(self.latency)
+        parts = urlsplit(url)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        data = json.loads(body) if body else None
+        for route_method, pattern, respond in self.routes:
+            match = re.fullmatch(pattern, parts.path)
+            if route_method == method and match:
+                with self.lock:
+                    self.requests[f"{method} {route_name(pattern)}"] += 1
+                return 200, respond(query, data, *match.groups())
+        return 404, {"detail": f"No route for {method} {parts.path}"}
+
+    def get_concept(self, query: dict, body, design_instance_id: str) -> dict:
+        """Get a concept."""
+        return concept_of(design_instance_id)
+
+    def get_concept_part(self, query: dict, body, design_instance_id: str, part: str):
+        """Get a part of a concept."""
+        return {} if part == "architecture" else []
+
+    def create_concept(self, query: dict, body) -> dict:
+        """Create or copy a concept."""
+        return concept_of(query["design_instance_id"])
+
+    def create_job(self, query: dict, body: dict) -> list:
+        """Create a job."""
+        return [{"job_name": body["job_name"]}, {"file": "uploaded"}]
+
+    def start_job(self, query: dict, body: dict) -> dict:
+        """Start a job."""
+        job_id = str(uuid.uuid4())
+        with self.lock:
+            self.jobs[job_id] = time.monotonic()
+        return {"job_id": job_id, "simulation_id": "simulation", **body["job"]}
+
+    def list_products(self, query: dict, body) -> list:
+        """List the products."""
+        return [{"productId": "product", "productName": "CONCEPTEV"}]
+
+    def list_accounts(self, query: dict, body) -> list:
+        """List the accounts of the user."""
+        return [{"account": {"accountName": self.account_name, "accountId": "account"}}]
+
+    def create_design(self, query: dict, body: dict) -> dict:
+        """Create a design with one design instance."""
+        return {
+            "designId": "design",
+            "designInstanceList": [{"designInstanceId": str(uuid.uuid4())}],
+        }
+
+    def is_complete(self, job_id: str) -> bool:
+        """Whether a job has completed."""
+        with self.lock:
+            started = self.jobs.get(job_id)
+        return started is None or time.monotonic() - started >= self.job_duration
+
+    def load_job(self, query: dict, body: dict) -> dict:
+        """Load a job."""
+        job_id = body["jobId"]
+        status = {"finalStatus": "COMPLETED"} if self.is_complete(job_id) else {}
+        return {
+            "jobId": job_id,
+            "lastStatus": "RUNNING",
+            "jobName": "job",
+            "dockerTag": "default",
+            "designInstanceId": "design_instance",
+            "simulations": [{"simulationId": "simulation"}],
+            **status,
+        }
+
+    def list_job_files(self, query: dict, body, job_id: str) -> list:
+        """List the files of a job with their signed download URLs."""
+        return [
+            {
+                "jobId": job_id,
+                "fileName": f"simulation/{name}",
+                "directory": False,
+                "downloadRequest": {
+                    "method": "GET",
+                    "uri": f"{self.http_url}/s3/{job_id}/{name}",
+                    "headers": {},
+                },
+            }
+            for name in (
+                f"output_file_v{DATA_FORMAT_VERSION}.json",
+                f"filtered_output_v{DATA_FORMAT_VERSION}.json",
+            )
+        ]
+
+    def run_websocket_server(self, ready: threading.Event) -> None:
+        """Run the websocket server until stopped."""
+        self.websocket_loop = asyncio.new_event_loop()
+        self.websocket_loop.run_until_complete(self.serve_websocket(ready))
+        self.websocket_loop.close()
+
+    async def serve_websocket(self, ready: threading.Event) -> None:
+        """Serve websocket connections until stopped."""
+        self.websocket_stop = self.websocket_loop.create_future()
+        async with serve(self.send_job_messages, "127.0.0.1", 0) as server:
+            self.websocket_port = server.sockets[0].getsockname()[1]
+            ready.set()
+            await self.websocket_stop
+
+    async def send_job_messages(self, websocket) -> None:
+        """Send a status message for each job once it completes."""
+        sent = set()
+        while True:
+            with self.lock:
+                job_ids = list(self.jobs)
+            for job_id in job_ids:
+                if job_id not in sent and self.is_complete(job_id):
+                    message = {"jobId": job_id, "messagetype": "status", "status": "completed"}
+                    await websocket.send(json.dumps(message))
+                    sent.add(job_id)
+            await asyncio.sleep(0.005)
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """Pass HTTP requests on to the mock services."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # Headers and body are written separately.
+
+    def respond(self) -> None:
+        """Answer the request with JSON."""
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        status, data = self.server.services.handle(self.command, self.path, body)
+        content = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = respond
+
+    def log_message(self, format, *args) -> None:
+        """Keep the test output quiet."""
@@ -0,0 +1,170 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Throughput, latency and request count of the main workflows."""
+
+from mock_services import LATENCY
+import pytest
+
+from ansys.conceptev.core import app, batch, polling, progress
+
+pytestmark = pytest.mark.benchmark
+
+BATCH_SIZE = 20
+
+
+class StubMsalApp:
+    """MSAL app handing out a fixed token, for the token refresh after waiting on a job."""
+
+    def get_accounts(self):
+        return [{"username": "benchmark"}]
+
+    def acquire_token_silent(self, scopes, account):
+        return {"access_token": "token"}
+
+
+@pytest.fixture
+def client():
+    with app.get_http_client("token", design_instance_id="design_instance") as client:
+        yield client
+
+
+@pytest.fixture
+def concept():
+    return {
+        "id": "concept",
+        "design_instance_id": "design_instance",
+        "requirements_ids": ["requirement"],
+        "architecture_id": "architecture",
+    }
+
+
+def submit(client, concept):
+    return app.create_submit_job(client, concept, "account", "hpc", job_name="benchmark")
+
+
+def test_get_concept(measure, client):
+    measurement = measure("get_concept", lambda: app.get_concept(client, "design_instance"))
+    assert measurement.requests_per_call == 5
+
+
+@pytest.mark.timing
+def test_get_concept_time(measure, client):
+    measurement = measure("get_concept", lambda: app.get_concept(client, "design_instance"))
+    assert measurement.mean_seconds < 4 * LATENCY  # The parts are fetched concurrently.
+
+
+def test_create_new_concept(measure, client):
+    measurement = measure(
+        "create_new_concept", lambda: app.create_new_concept(client, "project", "product")
+    )
+    assert measurement.requests_per_call == 2  # Design and concept, user ID is cached.
+
+
+def test_create_submit_job(measure, client, concept):
+    measurement = measure("create_submit_job", lambda: submit(client, concept))
+    assert measurement.requests_per_call == 2
+
+
+def test_read_results(measure, client, concept):
+    job_info = submit(client, concept)
+    measurement = measure("read_results", lambda: app.read_results(client, job_info))
+    assert measurement.requests_per_call == 2  # Fresh job status and results.
+
+
+def test_read_results_without_units(measure, client, concept):
+    job_info = submit(client, concept)
+    measurement = measure(
+        "read_results calculate_units=False",
+        lambda: app.read_results(client, job_info, calculate_units=False),
+    )
+    assert measurement.requests_per_call == 3  # Job status, file list and signed URL download.
+
+
+def test_read_results_of_running_job(measure, services, client, concept):
+    services.job_duration = 0.1
+
+    def submit_and_read():
+        job_info = submit(client, concept)
+        return app.read_results(client, job_info, msal_app=StubMsalApp())
+
+    measurement = measure("submit and wait on websocket", submit_and_read, calls=3)
+    assert measurement.requests_per_call == 5
+
+
+def measure_submit_batch(measure, client):
+    specs = [{"title": f"Concept {index}"} for index in range(BATCH_SIZE)]
+    return measure(
+        f"submit_batch of {BATCH_SIZE}",
+        lambda: batch.submit_batch(client, "project", "base", specs),
+        calls=3,
+    )
+
+
+def test_submit_batch(measure, client):
+    measurement = measure_submit_batch(measure, client)
+    assert measurement.requests_per_call == 4 * BATCH_SIZE  # IDs are cached after warm up.
+
+
+@pytest.mark.timing
+def test_submit_batch_time(measure, client):
+    measurement = measure_submit_batch(measure, client)
+    assert measurement.mean_seconds < BATCH_SIZE * 4 * LATENCY / 2  # Concepts run concurrently.
+
+
+def measure_get_results_batch(measure, client, concept):
+    job_infos = [submit(client, concept) for _ in range(BATCH_SIZE)]
+    return measure(
+        f"get_results_batch of {BATCH_SIZE}",
+        lambda: batch.get_results_batch(client, job_infos),
+        calls=3,
+    )
+
+
+def test_get_results_batch(measure, client, concept):
+    measurement = measure_get_results_batch(measure, client, concept)
+    assert measurement.requests_per_call == BATCH_SIZE
+
+
+@pytest.mark.timing
+def test_get_results_batch_time(measure, client, concept):
+    measurement = measure_get_results_batch(measure, client, concept)
+    assert measurement.mean_seconds < BATCH_SIZE * LATENCY / 2  # Results are read concurrently.
+
+
+def test_poll_jobs(measure, client, concept):
+    job_infos = [submit(client, concept) for _ in range(BATCH_SIZE)]
+    measurement = measure(
+        f"poll_jobs of {BATCH_SIZE}", lambda: polling.poll_jobs(job_infos, "token"), calls=3
+    )
+    assert measurement.requests_per_call == BATCH_SIZE
+
+
+def test_monitor_jobs_progress(measure, services, client, concept):
+    services.job_duration = 0.05
+
+    def submit_and_monitor():
+        job_ids = [submit(client, concept)["job_id"] for _ in range(BATCH_SIZE)]
+        return progress.monitor_jobs_progress(job_ids, "user", "token", StubMsalApp())
+
+    measurement = measure(f"submit and monitor {BATCH_SIZE} jobs", submit_and_monitor, calls=3)
+    # The submissions and one status check of each job when the websocket connects.
+    assert measurement.requests_per_call == 3 * BATCH_SIZE
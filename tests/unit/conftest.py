@@ -0,0 +1,42 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Shared fixtures for the unit tests."""
+
+import pytest
+
+from ansys.conceptev.core import app, ocm, progress
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty caches so that mocked responses are always requested."""
+    ocm.clear_metadata_cache()
+    app.clear_data_format_version_cache()
+    yield
+    ocm.clear_metadata_cache()
+    app.clear_data_format_version_cache()
+
+
+@pytest.fixture
+def no_status_reconciliation(monkeypatch):
+    """Find no missed statuses when a websocket connects, instead of asking OCM."""
+    monkeypatch.setattr(progress, "get_job_statuses", lambda job_ids, token: {})
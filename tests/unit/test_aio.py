@@ -0,0 +1,239 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from ansys.conceptev.core import aio
+from ansys.conceptev.core.result_cache import ResultCache
+from ansys.conceptev.core.settings import settings
+
+conceptev_url = settings.conceptev_url
+ocm_url = settings.ocm_url
+
+
+@pytest.fixture
+def client():
+    return aio.get_http_client("value1", design_instance_id="123")
+
+
+def test_get_http_client(client):
+    assert isinstance(client, httpx.AsyncClient)
+    assert client.headers["authorization"] == "value1"
+    assert client.params["design_instance_id"] == "123"
+
+
+@pytest.mark.asyncio
+async def test_get_and_post(httpx_mock: HTTPXMock, client):
+    example = {"name": "aero_mock_response"}
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/configurations?design_instance_id=123", method="get", json=[example]
+    )
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/configurations?design_instance_id=123",
+        method="post",
+        match_json=example,
+        json=example,
+    )
+    async with client:
+        assert await aio.get(client, "/configurations") == [example]
+        assert await aio.post(client, "/configurations", example) == example
+
+
+@pytest.mark.asyncio
+async def test_get_concept(httpx_mock: HTTPXMock, client):
+    design_instance_id = "456"
+    query = f"?design_instance_id={design_instance_id}"
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/concepts/{design_instance_id}{query}&populated=false",
+        json={"name": "concept"},
+    )
+    for part in ["configurations", "components", "requirements", "architecture"]:
+        httpx_mock.add_response(
+            url=f"{conceptev_url}/concepts/{design_instance_id}/{part}{query}",
+            json={"name": part},
+        )
+    async with client:
+        concept = await aio.get_concept(client, design_instance_id)
+    assert concept == {
+        "name": "concept",
+        "configurations": {"name": "configurations"},
+        "components": {"name": "components"},
+        "requirements": {"name": "requirements"},
+        "architecture": {"name": "architecture"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_submit_job(httpx_mock: HTTPXMock, client):
+    account_id, hpc_id = "acc", "hpc"
+    concept = {
+        "requirements_ids": ["abc"],
+        "architecture_id": "def",
+        "id": "ghi",
+        "design_instance_id": "jkl",
+    }
+    mocked_job = [{"job": "data"}, {"stuff": "in file"}]
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/jobs?design_instance_id=jkl&account_id={account_id}",
+        json=mocked_job,
+    )
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/jobs:start?design_instance_id=jkl&account_id={account_id}",
+        match_json={
+            "job": mocked_job[0],
+            "uploaded_file": mocked_job[1],
+            "account_id": account_id,
+            "hpc_id": hpc_id,
+            "docker_tag": "default",
+            "extra_memory": False,
+        },
+        json={"job_id": "job_1"},
+    )
+    async with client:
+        job_info = await aio.create_submit_job(client, concept, account_id, hpc_id, "name")
+    assert job_info == {"job_id": "job_1"}
+
+
+@pytest.mark.asyncio
+async def test_ocm_session_helpers(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=f"{ocm_url}/user/details", method="post", json={"userId": "u1"})
+    httpx_mock.add_response(
+        url=f"{ocm_url}/job/load",
+        method="post",
+        match_json={"jobId": "job_1"},
+        json={"finalStatus": "finished"},
+    )
+    async with aio.AsyncOCMSession() as session:
+        user_id = await aio.get_user_id("token", session=session)
+        status = await aio.get_status({"job_id": "job_1"}, "token", session=session)
+    assert (user_id, status) == ("u1", "FINISHED")
+    assert all(r.headers["Authorization"] == "token" for r in httpx_mock.get_requests())
+
+
+@pytest.mark.asyncio
+async def test_get_job_file_signed_url_timeout(httpx_mock: HTTPXMock):
+    signed_url = "https://s3.example.com/bucket/output_file_v3.json?signed=token"
+    httpx_mock.add_response(
+        url=f"{ocm_url}/job/files/list/123",
+        method="get",
+        json=[
+            {
+                "jobId": "123",
+                "fileName": "sim-id/output_file_v3.json",
+                "directory": False,
+                "downloadRequest": {"method": "GET", "uri": signed_url, "headers": {}},
+            }
+        ],
+    )
+    httpx_mock.add_response(url=signed_url, method="get", json={"result": 1})
+    result = await aio.get_job_file_signed_url("token", "123", "output_file_v3.json", timeout=90)
+    assert result == {"result": 1}
+    assert httpx_mock.get_request(url=signed_url).extensions["timeout"]["read"] == 90
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_project_reads_every_page(httpx_mock: HTTPXMock, client):
+    def respond(request: httpx.Request) -> httpx.Response:
+        page_number = json.loads(request.content)["pageNumber"]
+        projects = [{"projectId": f"p{page_number}", "projectTitle": f"project {page_number}"}]
+        return httpx.Response(200, json={"projects": projects, "totalCount": 3000})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    async with client:
+        project_id = await aio.get_or_create_project(client, "acc", "hpc", "project 2")
+    assert project_id == "p2"
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_closing_iter_projects_waits_for_cancelled_pages(httpx_mock: HTTPXMock):
+    async def respond(request: httpx.Request) -> httpx.Response:
+        page_number = json.loads(request.content)["pageNumber"]
+        await asyncio.sleep(page_number - 1 if page_number else 0)
+        projects = [{"projectId": f"p{page_number}", "projectTitle": f"project {page_number}"}]
+        return httpx.Response(200, json={"projects": projects, "totalCount": 3000})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    projects = aio.iter_projects("acc", "token")
+    assert [(await anext(projects))["projectId"] for _ in range(2)] == ["p0", "p1"]
+    await projects.aclose()
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_get_results_uses_cache_off_the_event_loop(httpx_mock: HTTPXMock, client, tmp_path):
+    job_info = {"job": "mocked_job", "job_id": "123"}
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/utilities:data_format_version?design_instance_id=123", json=3
+    )
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/jobs:result?design_instance_id=123&"
+        f"results_file_name=output_file_v3.json&calculate_units=true",
+        method="post",
+        json={"results": "with_units"},
+    )
+    cache = ResultCache(tmp_path)
+    threads = []
+    for name in ("get", "set"):
+        method = getattr(cache, name)
+
+        def spy(*args, method=method):
+            threads.append(threading.current_thread())
+            return method(*args)
+
+        setattr(cache, name, spy)
+
+    async with client:
+        assert await aio.get_results(client, job_info, cache=cache) == {"results": "with_units"}
+        assert await aio.get_results(client, job_info, cache=cache) == {"results": "with_units"}
+        cached = await aio.get_cached_results(client, job_info, True, False, cache)
+    assert cached == {"results": "with_units"}
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+    assert len(threads) == 4
+    assert threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_read_results_completed_job(httpx_mock: HTTPXMock, client):
+    job_info = {"job": "mocked_job", "job_id": "123"}
+    httpx_mock.add_response(url=f"{ocm_url}/user/details", method="post", json={"userId": "u1"})
+    httpx_mock.add_response(
+        url=f"{ocm_url}/job/load", method="post", json={"finalStatus": "COMPLETED"}
+    )
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/utilities:data_format_version?design_instance_id=123", json=3
+    )
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/jobs:result?design_instance_id=123&"
+        f"results_file_name=output_file_v3.json&calculate_units=true",
+        method="post",
+        match_json=job_info,
+        json={"results": "with_units"},
+    )
+    async with client:
+        results = await aio.read_results(client, job_info)
+    assert results == {"results": "with_units"}
@@ -19,13 +19,13 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-import re
+import threading
 
 import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from ansys.conceptev.core import app
+from ansys.conceptev.core import app, ocm
 from ansys.conceptev.core.auth import AnsysIDAuth
 from ansys.conceptev.core.exceptions import ResponseError
 from ansys.conceptev.core.progress import (
@@ -415,6 +415,104 @@ def test_read_results_with_units(httpx_mock: HTTPXMock, client: httpx.Client):
     assert example_results == results
 
 
+def test_read_results_from_cache(httpx_mock: HTTPXMock, client: httpx.Client, tmp_path):
+    """Cached results are returned without downloading them or checking the job status."""
+    example_job_info = {"job": "mocked_job", "job_id": "123"}
+    example_results = {"results": "with_units"}
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/utilities:data_format_version?design_instance_id=123",
+        method="get",
+        json=3,
+        is_reusable=True,
+    )
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/jobs:result?design_instance_id=123&"
+        f"results_file_name=output_file_v3.json&calculate_units=true",
+        method="post",
+        json=example_results,
+    )
+    cache = app.ResultCache(tmp_path)
+    assert app.get_results(client, example_job_info, cache=cache) == example_results
+    assert app.read_results(client, example_job_info, cache=cache) == example_results
+    assert app.get_results(client, example_job_info, cache=cache) == example_results
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+
+
+def test_get_results_uses_configured_cache(
+    httpx_mock: HTTPXMock, client: httpx.Client, tmp_path, monkeypatch
+):
+    """The ``result_cache_dir`` setting enables the cache unless ``use_cache=False``."""
+    monkeypatch.setattr(settings, "result_cache_dir", str(tmp_path))
+    example_job_info = {"job": "mocked_job", "job_id": "123"}
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/utilities:data_format_version?design_instance_id=123",
+        method="get",
+        json=3,
+        is_reusable=True,
+    )
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/jobs:result?design_instance_id=123&"
+        f"results_file_name=output_file_v3.json&calculate_units=true",
+        method="post",
+        json={"results": "with_units"},
+        is_reusable=True,
+    )
+    app.get_results(client, example_job_info)
+    app.get_results(client, example_job_info)
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+    app.get_results(client, example_job_info, use_cache=False)
+    assert len(httpx_mock.get_requests(method="POST")) == 2
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_data_format_version_is_cached(httpx_mock: HTTPXMock, client: httpx.Client):
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/utilities:data_format_version?design_instance_id=123",
+        method="get",
+        json=3,
+    )
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/jobs:result?design_instance_id=123&"
+        f"results_file_name=output_file_v3.json&calculate_units=true",
+        method="post",
+        json={"results": "with_units"},
+        is_reusable=True,
+    )
+    app.get_results(client, {"job_id": "1"})
+    app.get_results(client, {"job_id": "2"})
+    assert len(httpx_mock.get_requests(method="GET")) == 1
+
+
+def test_get_results_with_version_number(httpx_mock: HTTPXMock, client: httpx.Client):
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/jobs:result?design_instance_id=other&"
+        f"results_file_name=filtered_output_v5.json&calculate_units=true",
+        method="post",
+        json={"results": "with_units"},
+    )
+    results = app.get_results(
+        client, {"job_id": "1"}, filtered=True, version_number=5, design_instance_id="other"
+    )
+    assert results == {"results": "with_units"}
+    assert not httpx_mock.get_requests(method="GET")
+
+
+def test_data_format_version_expires(httpx_mock: HTTPXMock, client: httpx.Client, monkeypatch):
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/utilities:data_format_version?design_instance_id=123",
+        method="get",
+        json=3,
+    )
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/utilities:data_format_version?design_instance_id=123",
+        method="get",
+        json=4,
+    )
+    monkeypatch.setattr(app.data_format_versions, "ttl", -1)
+    assert app.get_data_format_version(client) == 3
+    assert app.get_data_format_version(client) == 4
+
+
 def test_post_file(mocker, httpx_mock: HTTPXMock, client: httpx.Client):
     file_data = "Simple Data"
     file_post_response_data = {"file": "read"}
@@ -438,20 +536,17 @@ def test_post_file(mocker, httpx_mock: HTTPXMock, client: httpx.Client):
 def test_successful_create(httpx_mock: HTTPXMock, client: httpx.Client):
     mocked_account_id, mocked_hpc_id = "123", "456"
     name = "some name"
-    first_word = name.split()[0]
-    escaped = re.escape(name)
-    for search_string in [name, escaped, first_word]:
-        httpx_mock.add_response(
-            url=f"{ocm_url}/project/list/page",
-            method="post",
-            match_json={
-                "filterByName": search_string,
-                "accountId": mocked_account_id,
-                "pageNumber": 0,
-                "pageSize": 1000,
-            },
-            json={"projects": []},
-        )
+    httpx_mock.add_response(
+        url=f"{ocm_url}/project/list/page",
+        method="post",
+        match_json={
+            "filterByName": "",
+            "accountId": mocked_account_id,
+            "pageNumber": 0,
+            "pageSize": 1000,
+        },
+        json={"projects": [{"projectId": "111", "projectTitle": "some other name"}]},
+    )
 
     httpx_mock.add_response(
         url=f"{ocm_url}/project/create",
@@ -466,39 +561,80 @@ def test_successful_create(httpx_mock: HTTPXMock, client: httpx.Client):
     )
     results = app.get_or_create_project(client, mocked_account_id, mocked_hpc_id, "some name")
     assert results == "789"
+    # The created project is added to the cached index.
+    results = app.get_or_create_project(client, mocked_account_id, mocked_hpc_id, "some name")
+    assert results == "789"
+
 
+def test_successful_get(httpx_mock: HTTPXMock, client: httpx.Client):
+    """Test get or create project."""
 
-search_strings = ["some name", re.escape("some name"), "some"]
+    mocked_account_id, mocked_hpc_id = "123", "456"
+    projects = [
+        {"projectId": "111", "projectTitle": "some"},
+        {"projectId": "789", "projectTitle": "some name"},
+    ]
+    httpx_mock.add_response(
+        url=f"{ocm_url}/project/list/page",
+        method="post",
+        match_json={
+            "filterByName": "",
+            "accountId": mocked_account_id,
+            "pageNumber": 0,
+            "pageSize": 1000,
+        },
+        json={"projects": projects},
+    )
 
+    results = app.get_or_create_project(client, mocked_account_id, mocked_hpc_id, "some name")
+    assert results == "789"
 
-@pytest.mark.parametrize("search_string", search_strings)
-def test_successful_get(httpx_mock: HTTPXMock, client: httpx.Client, search_string):
-    """Test get or create project."""
 
+def test_get_reloads_stale_project_index(httpx_mock: HTTPXMock, client: httpx.Client):
+    """A cached index without the project is reloaded before a project is created."""
     mocked_account_id, mocked_hpc_id = "123", "456"
-    for search_string_try in search_strings:
-        if search_string_try == search_string:
-            project_response = [{"projectId": "789", "projectTitle": "some name"}]
-        else:
-            project_response = []
+    for projects in ([], [{"projectId": "789", "projectTitle": "some name"}]):
         httpx_mock.add_response(
-            url=f"{ocm_url}/project/list/page",
-            method="post",
-            match_json={
-                "filterByName": search_string_try,
-                "accountId": mocked_account_id,
-                "pageNumber": 0,
-                "pageSize": 1000,
-            },
-            json={"projects": project_response},
+            url=f"{ocm_url}/project/list/page", method="post", json={"projects": projects}
         )
-        if search_string_try == search_string:
-            break
 
+    app.get_project_index(mocked_account_id, client.headers["Authorization"])
     results = app.get_or_create_project(client, mocked_account_id, mocked_hpc_id, "some name")
     assert results == "789"
 
 
+@pytest.fixture
+def auth_client(mocker):
+    """Client authenticating through ``AnsysIDAuth`` instead of a static header."""
+    mocker.patch.object(AnsysIDAuth, "get_token", return_value="auth token")
+    with app.get_http_client() as client:
+        yield client
+
+
+@pytest.mark.parametrize("existing", [True, False])
+def test_get_or_create_project_with_auth_client(httpx_mock: HTTPXMock, auth_client, existing):
+    projects = [{"projectId": "789", "projectTitle": "some name"}] if existing else []
+    httpx_mock.add_response(
+        url=f"{ocm_url}/project/list/page", method="post", json={"projects": projects}
+    )
+    if not existing:
+        httpx_mock.add_response(
+            url=f"{ocm_url}/project/create", method="post", json={"projectId": "789"}
+        )
+
+    assert app.get_or_create_project(auth_client, "123", "456", "some name") == "789"
+    assert all(r.headers["Authorization"] == "auth token" for r in httpx_mock.get_requests())
+
+
+def test_create_new_design_with_auth_client(httpx_mock: HTTPXMock, auth_client):
+    httpx_mock.add_response(
+        url=f"{ocm_url}/design/create", method="post", json={"designId": "design"}
+    )
+    design = ocm.create_new_design(auth_client, "project", product_id="product")
+    assert design == {"designId": "design"}
+    assert httpx_mock.get_request().headers["Authorization"] == "auth token"
+
+
 def test_get_job_file(httpx_mock: HTTPXMock):
     job_id = "123"
     file_name = "cev_job.json"
@@ -552,6 +688,46 @@ def test_get_concept(httpx_mock: HTTPXMock, client: httpx.Client):
     }
 
 
+def test_get_concept_requests_parts_concurrently(httpx_mock: HTTPXMock, client: httpx.Client):
+    """All five requests for a concept are in flight at the same time."""
+    barrier = threading.Barrier(5, timeout=5)
+
+    def respond(request: httpx.Request):
+        barrier.wait()
+        return httpx.Response(status_code=200, json={"path": request.url.path})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    response = app.get_concept(client, "123")
+    assert response["architecture"]["path"].endswith("/concepts/123/architecture")
+
+
+def test_get_concepts(httpx_mock: HTTPXMock, client: httpx.Client):
+    design_instance_ids = ["abc", "def"]
+    for design_instance_id in design_instance_ids:
+        query = f"?design_instance_id={design_instance_id}"
+        httpx_mock.add_response(
+            url=f"{conceptev_url}/concepts/{design_instance_id}{query}&populated=false",
+            method="get",
+            json={"name": design_instance_id},
+        )
+        for part in ["configurations", "components", "requirements", "architecture"]:
+            httpx_mock.add_response(
+                url=f"{conceptev_url}/concepts/{design_instance_id}/{part}{query}",
+                method="get",
+                json=[part],
+            )
+    concepts = app.get_concepts(client, design_instance_ids, max_workers=2)
+    assert list(concepts) == design_instance_ids
+    for design_instance_id, concept in concepts.items():
+        assert concept == {
+            "name": design_instance_id,
+            "configurations": ["configurations"],
+            "components": ["components"],
+            "requirements": ["requirements"],
+            "architecture": ["architecture"],
+        }
+
+
 statuses = [STATUS_COMPLETE, STATUS_FINISHED, STATUS_ERROR, None]
 
 
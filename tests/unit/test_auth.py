@@ -19,6 +19,12 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import base64
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+import time
+
 import httpx
 from msal_extensions import (
     FilePersistence,
@@ -191,3 +197,96 @@ def test_auth_flow_token_expires_mid_sequence(mocker, httpx_mock: HTTPXMock):
     assert mock_get_ansyId_token.call_count == 5
     # The force-refresh must have been triggered on the 4th call (req 3 retry)
     assert mock_get_ansyId_token.call_args_list[3] == mocker.call(auth_instance.app, force=True)
+
+
+def make_jwt(expires_at: float, subject: str = "user") -> str:
+    """Build an unsigned JSON Web Token with the given expiry."""
+
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    return f"{encode({'alg': 'none'})}.{encode({'exp': expires_at, 'sub': subject})}.signature"
+
+
+def test_get_token_expiry():
+    assert auth.get_token_expiry(make_jwt(1234.0)) == 1234.0
+    assert auth.get_token_expiry("not_a_jwt") is None
+    assert auth.get_token_claims(make_jwt(1234.0, subject="someone"))["sub"] == "someone"
+
+
+def test_auth_flow_reuses_token_until_close_to_expiry(mocker, httpx_mock: HTTPXMock):
+    """A token with an expiry is kept in memory and refreshed shortly before it expires."""
+    now = time.time()
+    first, second = make_jwt(now + 3600), make_jwt(now + 7200)
+    mock_get_ansyId_token = mocker.patch(
+        "ansys.conceptev.core.auth.get_ansyId_token", side_effect=[first, second]
+    )
+    auth_instance = auth.AnsysIDAuth(refresh_margin=300)
+    httpx_mock.add_response(url="http://example.com", is_reusable=True)
+    client = httpx.Client(auth=auth_instance)
+
+    responses = [client.get("http://example.com") for _ in range(3)]
+    assert all(r.request.headers["Authorization"] == first for r in responses)
+    assert mock_get_ansyId_token.call_count == 1
+
+    mocker.patch("ansys.conceptev.core.auth.time.time", return_value=now + 3400)
+    response = client.get("http://example.com")
+    assert response.request.headers["Authorization"] == second
+    assert mock_get_ansyId_token.call_count == 2
+    assert auth.get_token(client) == second
+
+
+@pytest.mark.asyncio
+async def test_async_auth_flow_refreshes_off_the_event_loop(mocker, httpx_mock: HTTPXMock):
+    """Async clients get and refresh the token in a worker thread."""
+    now = time.time()
+    tokens = [make_jwt(now + 3600), make_jwt(now + 7200)]
+    threads = []
+
+    def get_token(app, force=False):
+        threads.append(threading.current_thread())
+        return tokens[len(threads) - 1]
+
+    mocker.patch("ansys.conceptev.core.auth.get_ansyId_token", side_effect=get_token)
+    httpx_mock.add_response(url="http://example.com", status_code=401)
+    httpx_mock.add_response(url="http://example.com", is_reusable=True)
+    async with httpx.AsyncClient(auth=auth.AnsysIDAuth()) as client:
+        responses = [await client.get("http://example.com") for _ in range(2)]
+
+    assert [r.status_code for r in responses] == [200, 200]
+    assert all(r.request.headers["Authorization"] == tokens[1] for r in responses)
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+def test_auth_refresh_is_single_flight(mocker):
+    """Concurrent requests for an expired token cause a single refresh."""
+    token = make_jwt(time.time() + 3600)
+    started = threading.Event()
+
+    def slow_token(app, force=False):
+        started.set()
+        time.sleep(0.1)
+        return token
+
+    mock_get_ansyId_token = mocker.patch(
+        "ansys.conceptev.core.auth.get_ansyId_token", side_effect=slow_token
+    )
+    auth_instance = auth.AnsysIDAuth()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(lambda _: auth_instance.get_token(), range(8)))
+    assert tokens == [token] * 8
+    assert mock_get_ansyId_token.call_count == 1
+
+
+def test_concurrent_401_refreshes_once(mocker):
+    """A rejected token is only refreshed if no other thread has refreshed it already."""
+    old, new = make_jwt(time.time() + 3600), make_jwt(time.time() + 7200)
+    mock_get_ansyId_token = mocker.patch(
+        "ansys.conceptev.core.auth.get_ansyId_token", side_effect=[old, new]
+    )
+    auth_instance = auth.AnsysIDAuth()
+    assert auth_instance.get_token() == old
+    assert auth_instance.get_token(force=True, rejected=old) == new
+    assert auth_instance.get_token(force=True, rejected=old) == new
+    assert mock_get_ansyId_token.call_count == 2
@@ -0,0 +1,221 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from ansys.conceptev.core import app, batch
+from ansys.conceptev.core.exceptions import DeleteError, ResponseError
+from ansys.conceptev.core.settings import settings
+
+conceptev_url = settings.conceptev_url
+ocm_url = settings.ocm_url
+
+
+@pytest.fixture
+def client():
+    return app.get_http_client("token", design_instance_id="base")
+
+
+def mock_services(
+    httpx_mock: HTTPXMock, failing_title: str | None = None, failing_copy: str | None = None
+):
+    """Mock the OCM and ConceptEV routes used by a batch submission."""
+
+    def respond(request: httpx.Request):
+        path = request.url.path
+        design_instance_id = request.url.params.get("design_instance_id")
+        if path.endswith("/product/list"):
+            return httpx.Response(200, json=[{"productId": "p1", "productName": "CONCEPTEV"}])
+        if path.endswith("/account/list"):
+            account = {"accountName": settings.account_name, "accountId": "acc"}
+            return httpx.Response(200, json=[{"account": account}])
+        if path.endswith("/account/hpc/default"):
+            return httpx.Response(200, json={"hpcId": "hpc"})
+        if path.endswith("/design/create"):
+            title = json.loads(request.content)["designTitle"]
+            instance = {"designInstanceId": f"di_{title}"}
+            return httpx.Response(200, json={"designId": "d", "designInstanceList": [instance]})
+        if path.endswith("/concepts:copy"):
+            if design_instance_id == f"di_{failing_copy}":
+                return httpx.Response(422, json={"detail": "bad copy"})
+            concept = {
+                "id": f"concept_{design_instance_id}",
+                "design_instance_id": design_instance_id,
+                "requirements_ids": [],
+                "architecture_id": "base_arch",
+            }
+            return httpx.Response(200, json=concept)
+        if path.endswith("/components"):
+            return httpx.Response(200, json=[{"name": "Motor", "id": f"m_{design_instance_id}"}])
+        if path.endswith("/architectures"):
+            if design_instance_id == f"di_{failing_title}":
+                return httpx.Response(422, json={"detail": "bad architecture"})
+            return httpx.Response(200, json={"id": f"arch_{design_instance_id}"})
+        if path.endswith("/jobs"):
+            return httpx.Response(200, json=[{"job": design_instance_id}, {"file": "uploaded"}])
+        if path.endswith("/jobs:start"):
+            job = json.loads(request.content)["job"]["job"]
+            return httpx.Response(200, json={"job_id": f"job_{job}"})
+        return httpx.Response(404)
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+
+
+def test_submit_batch(httpx_mock: HTTPXMock, client):
+    mock_services(httpx_mock, failing_title="broken", failing_copy="uncopied")
+    specs = [
+        {"title": "first", "architecture": lambda components: {"motor": components["Motor"]}},
+        {"title": "broken", "architecture": {"motor": "m"}},
+        {"title": "third"},
+        {"title": "uncopied"},
+    ]
+    results = batch.submit_batch(client, "project", "base", specs, max_workers=2)
+
+    assert [result.item for result in results] == specs
+    assert [result.ok for result in results] == [True, False, True, False]
+    assert results[0].result == {"job_id": "job_di_first"}
+    assert results[0].concept["architecture_id"] == "arch_di_first"
+    assert results[2].concept["architecture_id"] == "base_arch"
+    assert isinstance(results[1].error, ResponseError)
+    assert results[1].concept["design_instance_id"] == "di_broken"
+    assert results[1].design_instance_id == "di_broken"
+    # The design instance is reported even though the concept could not be copied into it.
+    assert isinstance(results[3].error, ResponseError)
+    assert results[3].concept is None
+    assert results[3].design_instance_id == "di_uncopied"
+
+    requests = httpx_mock.get_requests()
+    paths = [request.url.path for request in requests]
+    assert sum(path.endswith("/product/list") for path in paths) == 1
+    assert sum(path.endswith("/account/list") for path in paths) == 1
+    assert sum(path.endswith("/account/hpc/default") for path in paths) == 1
+    architecture = [
+        request
+        for request in requests
+        if request.url.path.endswith("/architectures")
+        and request.url.params["design_instance_id"] == "di_first"
+    ][0]
+    assert json.loads(architecture.content) == {"motor": "m_di_first"}
+    assert client.params["design_instance_id"] == "base"
+
+
+def test_submit_batch_uses_given_ids(httpx_mock: HTTPXMock, client):
+    mock_services(httpx_mock)
+    results = batch.submit_batch(
+        client,
+        "project",
+        "base",
+        [{"title": "only"}],
+        account_id="acc",
+        hpc_id="hpc",
+        product_id="p1",
+    )
+    assert results[0].result == {"job_id": "job_di_only"}
+    paths = [request.url.path for request in httpx_mock.get_requests()]
+    assert not any("/account/" in path or "/product/" in path for path in paths)
+
+
+def test_get_results_batch(httpx_mock: HTTPXMock, client):
+    def respond(request: httpx.Request):
+        if request.url.path.endswith("/utilities:data_format_version"):
+            return httpx.Response(200, json=3)
+        job_id = json.loads(request.content)["job_id"]
+        if job_id == "broken":
+            return httpx.Response(500, json={"detail": "no results"})
+        design_instance_id = request.url.params["design_instance_id"]
+        return httpx.Response(200, json={"job": job_id, "design": design_instance_id})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+    job_infos = [{"job_id": "first"}, {"job_id": "broken"}, {"job_id": "third"}]
+    results = batch.get_results_batch(client, job_infos, ["di_1", "di_2", "di_3"])
+    assert [result.item for result in results] == job_infos
+    assert results[0].result == {"job": "first", "design": "di_1"}
+    assert results[2].result == {"job": "third", "design": "di_3"}
+    assert isinstance(results[1].error, ResponseError)
+    paths = [request.url.path for request in httpx_mock.get_requests()]
+    assert sum(path.endswith("/utilities:data_format_version") for path in paths) == 1
+
+
+def test_clone_concepts(httpx_mock: HTTPXMock, client):
+    mock_services(httpx_mock)
+    results = batch.clone_concepts(client, "project", "base", ["first", "second"])
+
+    assert [result.item for result in results] == ["first", "second"]
+    assert [result.result["design_instance_id"] for result in results] == [
+        "di_first",
+        "di_second",
+    ]
+    copies = [r for r in httpx_mock.get_requests() if r.url.path.endswith("/concepts:copy")]
+    assert [json.loads(r.content)["old_design_instance_id"] for r in copies] == ["base"] * 2
+    assert client.params["design_instance_id"] == "base"
+
+
+def test_delete_concepts(httpx_mock: HTTPXMock, client):
+    for concept_id, status_code in [("c1", 204), ("c2", 404)]:
+        httpx_mock.add_response(
+            url=f"{conceptev_url}/concepts/{concept_id}?design_instance_id=di_{concept_id}",
+            method="delete",
+            status_code=status_code,
+        )
+    concepts = [
+        {"id": "c1", "design_instance_id": "di_c1"},
+        {"id": "c2", "design_instance_id": "di_c2"},
+    ]
+
+    results = batch.delete_concepts(client, concepts)
+
+    assert [result.ok for result in results] == [True, False]
+    assert isinstance(results[1].error, DeleteError)
+
+
+def test_delete_concepts_of_design_instance(httpx_mock: HTTPXMock, client):
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/concepts?design_instance_id=di_uncopied",
+        method="get",
+        json=[{"id": "c1", "name": "partial copy"}],
+    )
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/concepts/c1?design_instance_id=di_uncopied",
+        method="delete",
+        status_code=204,
+    )
+    results = batch.delete_concepts(client, [{"design_instance_id": "di_uncopied"}])
+    assert [result.ok for result in results] == [True]
+
+
+def test_delete_projects(httpx_mock: HTTPXMock):
+    def respond(request: httpx.Request):
+        project_id = json.loads(request.content)["projectId"]
+        if request.url.path.endswith("/project/delete/init"):
+            return httpx.Response(200, json={"hash": f"hash_{project_id}"})
+        return httpx.Response(200, json={"deleted": project_id})
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+
+    results = batch.delete_projects("token", ["p1", "p2"])
+
+    assert [result.result for result in results] == [{"deleted": "p1"}, {"deleted": "p2"}]
+    executes = [r for r in httpx_mock.get_requests() if r.url.path.endswith("/delete/execute")]
+    assert sorted(json.loads(r.content)["hash"] for r in executes) == ["hash_p1", "hash_p2"]
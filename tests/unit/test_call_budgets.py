@@ -0,0 +1,278 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Guard the number of HTTP requests made by the high-level workflows.
+
+Every workflow is run twice against the same fake services: once with empty metadata caches
+and once with the caches filled by the first run. The requests of the first run are compared
+with the expected requests and the number of requests of the second run with the warm budget.
+The budgets are published in the user guide, which is checked against ``CALL_BUDGETS``.
+"""
+from collections import Counter
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import re
+from typing import Callable
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from ansys.conceptev.core import app, batch, ocm
+from ansys.conceptev.core.settings import settings
+
+USER_GUIDE = Path(__file__).parents[2] / "doc" / "source" / "user_guide.rst"
+SIGNED_URL = "https://s3.example.com/bucket/output_file_v3.json?signed=token"
+JOB_INFO = {"job_id": "job1", "simulation_id": "sim1"}
+CONCEPT = {
+    "id": "concept1",
+    "design_instance_id": "di1",
+    "requirements_ids": [],
+    "architecture_id": "arch1",
+}
+SPECS = [{"title": f"variant {index}"} for index in range(3)]
+
+
+@dataclass
+class Budget:
+    """Expected requests of a workflow with empty and with warm caches."""
+
+    operation: Callable[[httpx.Client], object]
+    cold: list[str]
+    warm: int
+
+
+CALL_BUDGETS = {
+    "`create_new_concept`": Budget(
+        lambda client: app.create_new_concept(client, "project1", title="concept"),
+        [
+            "OCM GET /product/list",
+            "OCM POST /design/create",
+            "OCM POST /user/details",
+            "ConceptEV POST /concepts",
+        ],
+        2,
+    ),
+    "`get_concept`": Budget(
+        lambda client: app.get_concept(client, "di1"),
+        ["ConceptEV GET /concepts/di1"]
+        + [f"ConceptEV GET /concepts/di1/{part}" for part in app.CONCEPT_PARTS],
+        1 + len(app.CONCEPT_PARTS),
+    ),
+    "`copy_concept`": Budget(
+        lambda client: app.copy_concept("concept1", "di2", client),
+        ["ConceptEV POST /concepts:copy"],
+        1,
+    ),
+    "`create_submit_job`": Budget(
+        lambda client: app.create_submit_job(client, CONCEPT, "acc", "hpc"),
+        ["ConceptEV POST /jobs", "ConceptEV POST /jobs:start"],
+        2,
+    ),
+    "`get_results`": Budget(
+        lambda client: app.get_results(client, JOB_INFO, use_cache=False),
+        ["ConceptEV GET /utilities:data_format_version", "ConceptEV POST /jobs:result"],
+        1,
+    ),
+    "`read_results`": Budget(
+        lambda client: app.read_results(client, JOB_INFO, use_cache=False),
+        [
+            "OCM POST /user/details",
+            "OCM POST /job/load",
+            "ConceptEV GET /utilities:data_format_version",
+            "ConceptEV POST /jobs:result",
+        ],
+        2,
+    ),
+    "`read_results` with `calculate_units=False`": Budget(
+        lambda client: app.read_results(client, JOB_INFO, calculate_units=False, use_cache=False),
+        [
+            "OCM POST /user/details",
+            "OCM POST /job/load",
+            "ConceptEV GET /utilities:data_format_version",
+            "OCM GET /job/files/list/job1",
+            "S3 GET /bucket/output_file_v3.json",
+        ],
+        3,
+    ),
+    "`get_status`": Budget(
+        lambda client: ocm.get_status(JOB_INFO, "token"),
+        ["OCM POST /job/load"],
+        0,
+    ),
+    "`get_status`, `get_job_info` and `get_design_of_job`": Budget(
+        lambda client: (
+            ocm.get_status(JOB_INFO, "token"),
+            ocm.get_job_info("token", "job1"),
+            ocm.get_design_of_job("token", "job1"),
+        ),
+        ["OCM POST /job/load"],
+        0,
+    ),
+    "`get_design_title`": Budget(
+        lambda client: ocm.get_design_title("token", "di1"),
+        ["OCM POST /design/instance/load", "OCM POST /design/load"],
+        2,
+    ),
+    "`get_or_create_project` with an existing project": Budget(
+        lambda client: ocm.get_or_create_project(client, "acc", "hpc", "existing project"),
+        ["OCM POST /project/list/page"],
+        0,
+    ),
+    "`get_or_create_project` with a new project": Budget(
+        lambda client: ocm.get_or_create_project(client, "acc", "hpc", "new project"),
+        ["OCM POST /project/list/page", "OCM POST /project/create"],
+        0,
+    ),
+    "`submit_batch` with three specifications": Budget(
+        lambda client: batch.submit_batch(client, "project1", "base", SPECS),
+        [
+            "OCM POST /account/list",
+            "OCM POST /account/hpc/default",
+            "OCM GET /product/list",
+        ]
+        + [
+            "OCM POST /design/create",
+            "ConceptEV POST /concepts:copy",
+            "ConceptEV POST /jobs",
+            "ConceptEV POST /jobs:start",
+        ]
+        * len(SPECS),
+        4 * len(SPECS),
+    ),
+    "`get_results_batch` with three jobs": Budget(
+        lambda client: batch.get_results_batch(
+            client, [{"job_id": f"job{index}"} for index in range(3)]
+        ),
+        ["ConceptEV GET /utilities:data_format_version"] + ["ConceptEV POST /jobs:result"] * 3,
+        3,
+    ),
+}
+
+
+def request_name(request: httpx.Request) -> str:
+    """Name a request by service, method and path relative to the base URL of the service."""
+    path = request.url.path
+    for service, url in (("ConceptEV", settings.conceptev_url), ("OCM", settings.ocm_url)):
+        base_url = httpx.URL(url)
+        if request.url.host == base_url.host and path.startswith(base_url.path):
+            return f"{service} {request.method} {path.removeprefix(base_url.path.rstrip('/'))}"
+    return f"S3 {request.method} {path}"
+
+
+def respond(request: httpx.Request) -> httpx.Response:
+    """Answer every request of the workflows like the real services would."""
+    name = request_name(request)
+    data = json.loads(request.content) if request.content else {}
+    design_instance_id = request.url.params.get("design_instance_id", "di1")
+    if name.startswith("S3"):
+        return httpx.Response(200, json={"results": "raw"})
+    route = name.split(" ", 2)[2]
+    if route == "/product/list":
+        return httpx.Response(200, json=[{"productId": "p1", "productName": "CONCEPTEV"}])
+    if route == "/user/details":
+        return httpx.Response(200, json={"userId": "user1"})
+    if route == "/account/list":
+        account = {"accountName": settings.account_name, "accountId": "acc"}
+        return httpx.Response(200, json=[{"account": account}])
+    if route == "/account/hpc/default":
+        return httpx.Response(200, json={"hpcId": "hpc"})
+    if route == "/design/create":
+        instance = {"designInstanceId": f"di_{data['designTitle']}"}
+        return httpx.Response(200, json={"designId": "d1", "designInstanceList": [instance]})
+    if route == "/design/instance/load":
+        return httpx.Response(200, json={"designId": "d1"})
+    if route == "/design/load":
+        return httpx.Response(200, json={"designTitle": "concept"})
+    if route == "/job/load":
+        return httpx.Response(
+            200,
+            json={
+                "jobName": "job",
+                "dockerTag": "default",
+                "finalStatus": "COMPLETED",
+                "simulations": [{"simulationId": "sim1"}],
+                "designInstanceId": "di1",
+            },
+        )
+    if route.startswith("/job/files/list/"):
+        download_request = {"method": "GET", "uri": SIGNED_URL, "headers": {}}
+        file = {"fileName": "sim1/output_file_v3.json", "downloadRequest": download_request}
+        return httpx.Response(200, json=[file])
+    if route == "/project/list/page":
+        projects = [{"projectTitle": "existing project", "projectId": "project1"}]
+        return httpx.Response(200, json={"projects": projects})
+    if route == "/project/create":
+        return httpx.Response(200, json={"projectId": "project2"})
+    if route == "/concepts":
+        return httpx.Response(200, json=CONCEPT)
+    if route == "/concepts:copy":
+        return httpx.Response(200, json=CONCEPT | {"design_instance_id": design_instance_id})
+    if route.startswith("/concepts/"):
+        return httpx.Response(200, json={"id": route})
+    if route == "/jobs":
+        return httpx.Response(200, json=[{"job": design_instance_id}, {"file": "uploaded"}])
+    if route == "/jobs:start":
+        return httpx.Response(200, json={"job_id": f"job_{design_instance_id}"})
+    if route == "/jobs:result":
+        return httpx.Response(200, json={"results": "calculated"})
+    if route == "/utilities:data_format_version":
+        return httpx.Response(200, json=3)
+    return httpx.Response(404)
+
+
+def run_recorded(httpx_mock: HTTPXMock, operation: Callable[[], object]) -> list[str]:
+    """Run an operation and get the names of the requests it sent."""
+    sent = len(httpx_mock.get_requests())
+    operation()
+    return [request_name(request) for request in httpx_mock.get_requests()[sent:]]
+
+
+def published_budgets() -> dict[str, tuple[int, int]]:
+    """Read the table of request budgets from the user guide."""
+    budgets = {}
+    for line in USER_GUIDE.read_text().splitlines():
+        row = re.fullmatch(r"(`.+?)\s{2,}(\d+)\s+(\d+)\s*", line)
+        if row:
+            budgets[row[1]] = (int(row[2]), int(row[3]))
+    return budgets
+
+
+@pytest.mark.parametrize("name", CALL_BUDGETS)
+def test_call_budget(httpx_mock: HTTPXMock, name: str):
+    budget = CALL_BUDGETS[name]
+    httpx_mock.add_callback(respond, is_reusable=True)
+    client = app.get_http_client("token", design_instance_id="di1")
+
+    cold = run_recorded(httpx_mock, lambda: budget.operation(client))
+    warm = run_recorded(httpx_mock, lambda: budget.operation(client))
+
+    assert Counter(cold) == Counter(budget.cold)
+    assert len(warm) == budget.warm
+
+
+def test_call_budgets_are_published():
+    published = published_budgets()
+
+    assert published == {
+        name: (len(budget.cold), budget.warm) for name, budget in CALL_BUDGETS.items()
+    }
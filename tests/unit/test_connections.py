@@ -0,0 +1,90 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+
+import httpx
+import pytest
+
+from ansys.conceptev.core import aio, app, connections, ocm
+from ansys.conceptev.core.settings import settings
+
+
+@pytest.fixture
+def pool_settings(monkeypatch):
+    monkeypatch.setattr(settings, "http_max_connections", 7)
+    monkeypatch.setattr(settings, "http_max_keepalive_connections", 3)
+    monkeypatch.setattr(settings, "http_keepalive_expiry", 12.0)
+    monkeypatch.setattr(settings, "http_connect_timeout", 2.0)
+    monkeypatch.setattr(settings, "http_read_timeout", 90.0)
+    monkeypatch.setattr(settings, "http_write_timeout", 30.0)
+    monkeypatch.setattr(settings, "http_pool_timeout", 5.0)
+
+
+def test_limits_and_timeouts_from_settings(pool_settings):
+    options = connections.client_options()
+
+    assert options["limits"] == httpx.Limits(
+        max_connections=7, max_keepalive_connections=3, keepalive_expiry=12.0
+    )
+    assert options["timeout"] == httpx.Timeout(connect=2.0, read=90.0, write=30.0, pool=5.0)
+    assert options["http2"] is False
+
+
+def test_given_options_override_settings(pool_settings):
+    options = connections.client_options(max_connections=50, keepalive_expiry=1.0, timeout=4.0)
+
+    assert options["limits"] == httpx.Limits(
+        max_connections=50, max_keepalive_connections=3, keepalive_expiry=1.0
+    )
+    assert options["timeout"] == httpx.Timeout(4.0)
+
+
+def test_http2_falls_back_without_h2(mocker, caplog):
+    mocker.patch.object(connections, "http2_available", return_value=False)
+
+    with caplog.at_level(logging.WARNING):
+        assert connections.use_http2(True) is False
+
+    assert "h2" in caplog.text
+
+
+def test_http2_from_settings(mocker, monkeypatch):
+    mocker.patch.object(connections, "http2_available", return_value=True)
+    monkeypatch.setattr(settings, "http2", True)
+
+    assert connections.use_http2() is True
+    assert connections.use_http2(False) is False
+
+
+def test_clients_use_pool_settings(pool_settings):
+    client = app.get_http_client("token", max_keepalive_connections=1)
+    session = ocm.OCMSession()
+    async_client = aio.get_http_client("token")
+
+    for pool in (client._transport._pool, session.client._transport._pool):
+        assert pool._max_connections == 7
+        assert pool._keepalive_expiry == 12.0
+    assert client._transport._pool._max_keepalive_connections == 1
+    assert async_client._transport._pool._max_connections == 7
+    assert client.timeout == httpx.Timeout(connect=2.0, read=90.0, write=30.0, pool=5.0)
+    client.close()
+    session.close()
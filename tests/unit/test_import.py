@@ -0,0 +1,68 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+import subprocess
+import sys
+
+IMPORT_TIME_BUDGET = 3.0  # Seconds, generous for slow CI runners.
+
+MEASURE_IMPORT = """
+import json, time
+start = time.perf_counter()
+import ansys.conceptev.core.app as app
+elapsed = time.perf_counter() - start
+from ansys.conceptev.core import progress, settings
+print(json.dumps({
+    "elapsed": elapsed,
+    "settings_loaded": settings.settings.instance is not None,
+    "ssl_context_created": bool(progress.ssl_contexts),
+    "msal_app_created": app.default_msal_app is not None,
+}))
+"""
+
+
+def test_import_is_cheap_and_side_effect_free(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_IMPORT],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    measured = json.loads(result.stdout)
+    assert not measured["settings_loaded"]
+    assert not measured["ssl_context_created"]
+    assert not measured["msal_app_created"]
+    assert list(tmp_path.iterdir()) == []
+    assert measured["elapsed"] < IMPORT_TIME_BUDGET
+
+
+def test_module_constants_are_read_on_first_use():
+    from ansys.conceptev.core import app, auth, ocm, progress
+    from ansys.conceptev.core.settings import settings
+
+    assert app.BASE_URL == settings.conceptev_url
+    assert app.JOB_TIMEOUT == settings.job_timeout
+    assert ocm.OCM_URL == settings.ocm_url
+    assert progress.OCM_SOCKET_URL == settings.ocm_socket_url
+    assert auth.client_id == settings.client_id
+    assert progress.ssl_context is progress.get_ssl_context()
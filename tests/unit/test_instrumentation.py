@@ -0,0 +1,170 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import csv
+import json
+import time
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from ansys.conceptev.core import aio, app, instrumentation, ocm
+from ansys.conceptev.core.auth import AnsysIDAuth
+from ansys.conceptev.core.instrumentation import Recorder, RequestRecord
+from ansys.conceptev.core.retries import RetryPolicy
+from ansys.conceptev.core.settings import settings
+
+conceptev_url = settings.conceptev_url
+ocm_url = settings.ocm_url
+base_path = httpx.URL(conceptev_url).path.rstrip("/")
+concept_id = "0123456789abcdef0123"
+
+
+def test_clients_are_unchanged_without_sink():
+    client = app.get_http_client("token")
+    assert client.event_hooks["request"] == []
+    with ocm.OCMSession() as session:
+        assert session.client.event_hooks["request"] == []
+
+
+def test_records_requests_and_retries(httpx_mock: HTTPXMock, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)  # Skip the retry wait.
+    url = f"{conceptev_url}/concepts/{concept_id}?design_instance_id=123"
+    httpx_mock.add_response(url=url, method="get", status_code=502)
+    httpx_mock.add_response(url=url, method="get", json={"name": "concept"})
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/configurations?design_instance_id=123",
+        method="post",
+        json={"id": "configuration"},
+    )
+    with instrumentation.recording() as recorder:
+        with app.get_http_client("token", design_instance_id="123") as client:
+            app.get(client, "/concepts", id=concept_id)
+            app.post(client, "/configurations", {"name": "aero"})
+
+    fetched, created = recorder.records
+    assert fetched.key == f"GET {base_path}/concepts/{{id}}"
+    assert fetched.status == 200
+    assert fetched.retries == 1
+    assert fetched.bytes_received == len(b'{"name":"concept"}')
+    assert created.key == f"POST {base_path}/configurations"
+    assert created.retries == 0
+    assert created.bytes_sent == len(b'{"name":"aero"}')
+    assert created.host == httpx.URL(conceptev_url).host
+
+
+def test_records_failed_requests(httpx_mock: HTTPXMock, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)  # Skip the retry wait.
+    httpx_mock.add_exception(
+        httpx.ConnectError("refused"), url=f"{ocm_url}/user/details", is_reusable=True
+    )
+    with instrumentation.recording() as recorder:
+        with ocm.OCMSession(retry_policy=RetryPolicy(max_attempts=3)) as session:
+            with pytest.raises(httpx.ConnectError):
+                session.request("token", "POST", "/user/details")
+    (record,) = recorder.records
+    assert record.status is None
+    assert record.error == "ConnectError"
+    assert record.retries == 2
+    assert record.failed
+
+
+def test_records_auth_time(httpx_mock: HTTPXMock, mocker):
+    def slow_token(self, force=False, rejected=None):
+        time.sleep(0.01)
+        return "token"
+
+    mocker.patch.object(AnsysIDAuth, "get_token", slow_token)
+    httpx_mock.add_response(url=f"{conceptev_url}/health", json="ok")
+    with instrumentation.recording() as recorder:
+        with app.get_http_client() as client:
+            app.get(client, "/health")
+    assert recorder.records[0].auth_seconds >= 0.01
+
+
+def test_reauth_is_not_counted_as_retry(httpx_mock: HTTPXMock, mocker):
+    mocker.patch.object(AnsysIDAuth, "get_token", lambda self, force=False, rejected=None: "token")
+    httpx_mock.add_response(url=f"{conceptev_url}/health", status_code=401)
+    httpx_mock.add_response(url=f"{conceptev_url}/health", json="ok")
+    with instrumentation.recording() as recorder:
+        with app.get_http_client() as client:
+            app.get(client, "/health")
+    (record,) = recorder.records
+    assert record.status == 200
+    assert record.retries == 0
+    assert record.reauths == 1
+
+
+@pytest.mark.asyncio
+async def test_records_async_requests(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        url=f"{conceptev_url}/configurations?design_instance_id=123", method="get", json=[]
+    )
+    with instrumentation.recording() as recorder:
+        async with aio.get_http_client("token", design_instance_id="123") as client:
+            await aio.get(client, "/configurations")
+    assert [record.key for record in recorder.records] == [f"GET {base_path}/configurations"]
+
+
+def make_record(route: str, latency: float, status: int = 200, retries: int = 0):
+    return RequestRecord("GET", "host", route, status, latency, retries=retries, bytes_sent=10)
+
+
+def test_summary_and_histograms():
+    recorder = Recorder()
+    for latency in [0.01, 0.2, 0.3, 4.0]:
+        recorder(make_record("/concepts/{id}", latency))
+    recorder(make_record("/health", 100.0, status=500, retries=2))
+
+    summary = recorder.summary()
+    assert summary["GET /concepts/{id}"]["count"] == 4
+    assert summary["GET /concepts/{id}"]["p50_seconds"] == 0.2
+    assert summary["GET /concepts/{id}"]["max_seconds"] == 4.0
+    assert summary["GET /concepts/{id}"]["bytes_sent"] == 40
+    assert summary["GET /health"]["failed"] == 1
+    assert summary["GET /health"]["retries"] == 2
+
+    histogram = recorder.histograms(buckets=(0.1, 1.0))["GET /concepts/{id}"]
+    assert histogram == {"le_0.1": 1, "le_1": 2, "inf": 1}
+
+
+def test_export(tmp_path):
+    recorder = Recorder()
+    recorder(make_record("/concepts/{id}", 0.5))
+    recorder(make_record("/health", 1.5))
+
+    recorder.to_json(tmp_path / "timings.json")
+    exported = json.loads((tmp_path / "timings.json").read_text())
+    assert [record["route"] for record in exported["records"]] == ["/concepts/{id}", "/health"]
+    routes = {"GET /concepts/{id}", "GET /health"}
+    assert set(exported["summary"]) == set(exported["histograms"]) == routes
+
+    recorder.to_csv(tmp_path / "records.csv")
+    with open(tmp_path / "records.csv") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["latency"] for row in rows] == ["0.5", "1.5"]
+
+    recorder.to_csv(tmp_path / "summary.csv", summary=True)
+    with open(tmp_path / "summary.csv") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["route"] for row in rows] == ["GET /concepts/{id}", "GET /health"]
+    assert rows[0]["count"] == "1"
@@ -0,0 +1,335 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import base64
+import json
+import time
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from ansys.conceptev.core import ocm
+from ansys.conceptev.core.exceptions import ResponseError
+from ansys.conceptev.core.settings import settings
+
+ocm_url = settings.ocm_url
+
+
+def make_jwt(expires_at: float, subject: str) -> str:
+    """Build an unsigned JSON Web Token for a subject."""
+
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    return f"{encode({'alg': 'none'})}.{encode({'exp': expires_at, 'sub': subject})}.signature"
+
+
+def test_session_reuses_one_client(httpx_mock: HTTPXMock, mocker):
+    """All calls made through a session share its client and send the given token."""
+    create_client = mocker.spy(ocm, "create_ocm_client")
+    httpx_mock.add_response(url=f"{ocm_url}/user/details", method="post", json={"userId": "u1"})
+    httpx_mock.add_response(
+        url=f"{ocm_url}/product/list",
+        method="get",
+        json=[{"productId": "p1", "productName": "CONCEPTEV"}],
+    )
+    with ocm.OCMSession() as session:
+        assert ocm.get_user_id("token_1", session=session) == "u1"
+        assert ocm.get_product_id("token_2", session=session) == "p1"
+
+    assert create_client.call_count == 0
+    assert session.client.is_closed
+    requests = httpx_mock.get_requests()
+    assert [request.headers["Authorization"] for request in requests] == ["token_1", "token_2"]
+
+
+def test_session_pool_limits():
+    """Pool limits are passed to the underlying transport."""
+    with ocm.OCMSession(max_connections=3, max_keepalive_connections=2) as session:
+        pool = session.client._transport._pool
+        assert pool._max_connections == 3
+        assert pool._max_keepalive_connections == 2
+
+
+def test_request_without_session_closes_client(httpx_mock: HTTPXMock, mocker):
+    """Without a session a single-use client is created and closed."""
+    clients = []
+
+    def create_client(token):
+        client = httpx.Client(base_url=ocm_url, headers={"Authorization": token})
+        clients.append(client)
+        return client
+
+    mocker.patch("ansys.conceptev.core.ocm.create_ocm_client", side_effect=create_client)
+    httpx_mock.add_response(url=f"{ocm_url}/user/details", method="post", json={"userId": "u1"})
+    assert ocm.get_user_id("token") == "u1"
+    assert len(clients) == 1
+    assert clients[0].is_closed
+
+
+def test_metadata_lookups_are_cached(httpx_mock: HTTPXMock):
+    """Stable lookups go to OCM once per user until invalidated."""
+    httpx_mock.add_response(url=f"{ocm_url}/user/details", method="post", json={"userId": "u1"})
+    httpx_mock.add_response(
+        url=f"{ocm_url}/account/hpc/default", method="post", json={"hpcId": "hpc"}
+    )
+    for _ in range(3):
+        assert ocm.get_user_id("token") == "u1"
+        assert ocm.get_default_hpc("token", "account") == "hpc"
+    assert len(httpx_mock.get_requests()) == 2
+
+    httpx_mock.add_response(url=f"{ocm_url}/user/details", method="post", json={"userId": "u2"})
+    ocm.clear_metadata_cache("token")
+    assert ocm.get_user_id("token") == "u2"
+
+
+def test_metadata_cache_is_keyed_by_token_subject(httpx_mock: HTTPXMock):
+    """Tokens of the same subject share values and tokens of other subjects do not."""
+    httpx_mock.add_response(url=f"{ocm_url}/user/details", method="post", json={"userId": "u1"})
+    httpx_mock.add_response(url=f"{ocm_url}/user/details", method="post", json={"userId": "u2"})
+    first, refreshed = make_jwt(1, "subject_1"), make_jwt(2, "subject_1")
+    assert ocm.get_user_id(first) == "u1"
+    assert ocm.get_user_id(refreshed) == "u1"
+    assert ocm.get_user_id(make_jwt(1, "subject_2")) == "u2"
+
+
+def test_metadata_cache_expires(httpx_mock: HTTPXMock, mocker):
+    httpx_mock.add_response(
+        url=f"{ocm_url}/product/list",
+        method="get",
+        json=[{"productId": "p1", "productName": "CONCEPTEV"}],
+        is_reusable=True,
+    )
+    now = time.monotonic()
+    mocker.patch("ansys.conceptev.core.ocm.time.monotonic", return_value=now)
+    ocm.get_product_id("token")
+    ocm.get_product_id("token", use_cache=False)
+    mocker.patch(
+        "ansys.conceptev.core.ocm.time.monotonic", return_value=now + ocm.METADATA_CACHE_TTL + 1
+    )
+    ocm.get_product_id("token")
+    assert len(httpx_mock.get_requests()) == 3
+
+
+signed_url = "https://s3.example.com/bucket/output_file_v3.json?signed=token"
+
+
+def add_file_list(httpx_mock: HTTPXMock, job_id: str = "123"):
+    httpx_mock.add_response(
+        url=f"{ocm_url}/job/files/list/{job_id}",
+        method="get",
+        json=[
+            {
+                "jobId": job_id,
+                "fileName": "sim-id/output_file_v3.json",
+                "directory": False,
+                "downloadRequest": {"method": "GET", "uri": signed_url, "headers": {}},
+            }
+        ],
+    )
+
+
+def test_job_record_is_loaded_once(httpx_mock: HTTPXMock):
+    job = {
+        "finalStatus": "completed",
+        "simulations": [{"simulationId": "sim1"}],
+        "designInstanceId": "di1",
+        "jobName": "job",
+        "dockerTag": "default",
+    }
+    httpx_mock.add_response(url=f"{ocm_url}/job/load", method="post", json=job)
+
+    assert ocm.get_status({"job_id": "job1"}, "token") == "COMPLETED"
+    assert ocm.get_design_of_job("token", "job1") == "di1"
+    assert ocm.get_job_info("token", "job1")["simulation_id"] == "sim1"
+    record = ocm.load_job_record("token", "job1", max_age=3600)
+    assert (record.terminal, record.job_name) == (True, "job")
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_running_job_record_expires(httpx_mock: HTTPXMock, mocker):
+    for status in ["running", "running", "completed"]:
+        httpx_mock.add_response(url=f"{ocm_url}/job/load", json={"lastStatus": status})
+    clock = mocker.patch.object(ocm.time, "monotonic", return_value=1000.0)
+
+    assert ocm.get_status({"job_id": "job1"}, "token") == "RUNNING"
+    clock.return_value += 5
+    assert ocm.get_status({"job_id": "job1"}, "token") == "RUNNING"
+    assert ocm.get_status({"job_id": "job1"}, "token", use_cache=False) == "RUNNING"
+    clock.return_value += ocm.JOB_RECORD_TTL + 1
+    assert ocm.get_status({"job_id": "job1"}, "token") == "COMPLETED"
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_job_record_keeps_only_parsed_fields():
+    job = {
+        "lastStatus": "running",
+        "simulations": [{"simulationId": "sim1", "logs": "x" * 1000}],
+        "jobName": "job",
+        "dockerTag": "default",
+        "inputFiles": ["large"] * 100,
+    }
+
+    record = ocm.JobRecord.from_response("job1", job)
+
+    assert not hasattr(record, "data")
+    assert (record.status, record.simulation_id, record.design_instance_id) == (
+        "RUNNING",
+        "sim1",
+        None,
+    )
+    assert not record.terminal
+    with pytest.raises(ResponseError):
+        ocm.JobRecord.from_response("job2", {}).status
+
+
+def test_metadata_cache_purges_expired_values(mocker):
+    clock = mocker.patch.object(ocm.time, "monotonic", return_value=1000.0)
+    cache = ocm.MetadataCache(ttl=10)
+    cache.set(("old",), 1)
+    clock.return_value += 11
+
+    cache.set(("new",), 2)
+
+    assert list(cache.values) == [("new",)]
+
+
+def test_metadata_cache_drops_least_recently_used_values():
+    cache = ocm.MetadataCache(max_entries=2)
+    cache.set(("a",), 1)
+    cache.set(("b",), 2)
+    cache.get(("a",))
+
+    cache.set(("c",), 3)
+
+    assert list(cache.values) == [("a",), ("c",)]
+
+
+def respond_with_project_pages(total: int | None, count: int):
+    """Answer project list requests with pages of ``count`` projects."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        data = json.loads(request.content)
+        first = data["pageNumber"] * data["pageSize"]
+        projects = [
+            {"projectId": f"p{index}", "projectTitle": f"project {index % 3}"}
+            for index in range(first, min(first + data["pageSize"], count))
+        ]
+        page = {"projects": projects}
+        if total is not None:
+            page["totalCount"] = total
+        return httpx.Response(200, json=page)
+
+    return respond
+
+
+@pytest.mark.parametrize("total", [7, None])
+def test_iter_projects_reads_every_page(httpx_mock: HTTPXMock, total):
+    """All pages are read, concurrently if the total is known and one by one otherwise."""
+    httpx_mock.add_callback(respond_with_project_pages(total, 7), is_reusable=True)
+
+    projects = list(ocm.iter_projects("acc", "token", page_size=2, max_workers=3))
+
+    assert sorted(project["projectId"] for project in projects) == [f"p{i}" for i in range(7)]
+    page_numbers = [json.loads(r.content)["pageNumber"] for r in httpx_mock.get_requests()]
+    assert sorted(page_numbers) == [0, 1, 2, 3]
+
+
+def test_project_index_is_cached_per_account(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(respond_with_project_pages(None, 5), is_reusable=True)
+
+    index = ocm.get_project_index("acc", "token")
+    assert ocm.get_project_index("acc", "token") is index
+    ocm.get_project_index("other", "token")
+
+    assert index == {"project 0": ["p0", "p3"], "project 1": ["p1", "p4"], "project 2": ["p2"]}
+    accounts = [json.loads(r.content)["accountId"] for r in httpx_mock.get_requests()]
+    assert accounts == ["acc", "other"]
+
+
+def test_download_job_file(httpx_mock: HTTPXMock, tmp_path):
+    content = json.dumps([{"requirement": index} for index in range(100)]).encode()
+    add_file_list(httpx_mock)
+    httpx_mock.add_response(url=signed_url, method="get", content=content)
+    progress = []
+    destination = ocm.download_job_file(
+        "token",
+        "123",
+        "output_file_v3.json",
+        tmp_path / "results.json",
+        chunk_size=256,
+        progress=lambda written, total: progress.append((written, total)),
+    )
+    assert destination.read_bytes() == content
+    assert progress[-1] == (len(content), len(content))
+    assert len(progress) > 1
+    assert not (tmp_path / "results.json.part").exists()
+
+
+def test_download_job_file_resumes(httpx_mock: HTTPXMock, tmp_path):
+    content = b"0123456789" * 10
+    (tmp_path / "results.json.part").write_bytes(content[:30])
+    add_file_list(httpx_mock)
+    httpx_mock.add_response(
+        url=signed_url,
+        method="get",
+        match_headers={"Range": "bytes=30-"},
+        status_code=206,
+        headers={"Content-Range": f"bytes 30-99/{len(content)}"},
+        content=content[30:],
+    )
+    destination = ocm.download_job_file(
+        "token", "123", "output_file_v3.json", tmp_path / "results.json"
+    )
+    assert destination.read_bytes() == content
+
+
+def test_iter_job_file_items(httpx_mock: HTTPXMock):
+    items = [{"name": "é" * index, "values": [1.5, -2, None, True]} for index in range(20)]
+    add_file_list(httpx_mock)
+    httpx_mock.add_response(url=signed_url, method="get", content=json.dumps(items).encode())
+    parsed = list(ocm.iter_job_file_items("token", "123", "output_file_v3.json", chunk_size=7))
+    assert parsed == items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1000])
+def test_iter_json_array(chunk_size):
+    content = b' [ 12345 , "a,]b" , {"x": [1, 2]}, [] ,-0.5e3 ]\n'
+    chunks = [content[i : i + chunk_size] for i in range(0, len(content), chunk_size)]
+    assert list(ocm.iter_json_array(chunks)) == [12345, "a,]b", {"x": [1, 2]}, [], -500.0]
+
+
+def test_iter_json_array_parses_a_long_item_a_few_times(mocker):
+    item = {"values": list(range(20000))}
+    content = json.dumps([item, 1]).encode()
+    chunks = [content[i : i + 100] for i in range(0, len(content), 100)]
+    raw_decode = mocker.spy(json.JSONDecoder, "raw_decode")
+    assert list(ocm.iter_json_array(chunks)) == [item, 1]
+    assert len(chunks) > 1000
+    assert raw_decode.call_count < 20
+
+
+def test_iter_json_array_errors():
+    with pytest.raises(ResponseError, match="incomplete"):
+        list(ocm.iter_json_array([b'[{"a": 1}, {"b"']))
+    with pytest.raises(ResponseError, match="JSON array"):
+        list(ocm.iter_json_array([b'{"a": 1}']))
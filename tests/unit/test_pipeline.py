@@ -0,0 +1,152 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+from msal import PublicClientApplication
+import pytest
+from pytest_httpx import HTTPXMock
+
+from ansys.conceptev.core import aio, pipeline
+from ansys.conceptev.core.progress import STATUS_COMPLETE, STATUS_ERROR
+
+pytestmark = pytest.mark.usefixtures("no_status_reconciliation")
+
+CONCEPTS = [
+    {"id": f"c_{name}", "design_instance_id": name, "requirements_ids": [], "architecture_id": "a"}
+    for name in ["slow", "fast", "broken"]
+]
+FINISH_ORDER = [
+    ("job_fast", STATUS_COMPLETE),
+    ("job_broken", STATUS_ERROR),
+    ("job_slow", "FINISHED"),
+]
+
+
+class StatusSocket:
+    """A websocket that sends the final status of each job after a short delay."""
+
+    def __init__(self, statuses):
+        self.messages = [
+            json.dumps({"jobId": job_id, "messagetype": "status", "status": status})
+            for job_id, status in statuses
+        ]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0.02)
+        if not self.messages:
+            await asyncio.sleep(10)
+        return self.messages.pop(0)
+
+
+def mock_services(httpx_mock: HTTPXMock):
+    """Mock the OCM and ConceptEV routes used by the pipeline."""
+
+    def respond(request: httpx.Request):
+        path = request.url.path
+        if path.endswith("/user/details"):
+            return httpx.Response(200, json={"userId": "user"})
+        if path.endswith("/utilities:data_format_version"):
+            return httpx.Response(200, json=3)
+        if path.endswith("/jobs"):
+            design_instance_id = json.loads(request.content)["design_instance_id"]
+            return httpx.Response(200, json=[{"job": design_instance_id}, {"file": "uploaded"}])
+        if path.endswith("/jobs:start"):
+            job = json.loads(request.content)["job"]["job"]
+            return httpx.Response(200, json={"job_id": f"job_{job}"})
+        if path.endswith("/jobs:result"):
+            job_id = json.loads(request.content)["job_id"]
+            return httpx.Response(200, json={"results": job_id})
+        return httpx.Response(404)
+
+    httpx_mock.add_callback(respond, is_reusable=True)
+
+
+@pytest.mark.asyncio
+async def test_run_jobs_yields_in_completion_order(httpx_mock: HTTPXMock):
+    mock_services(httpx_mock)
+    app = PublicClientApplication("123")
+    with patch("ansys.conceptev.core.progress.connect_to_ocm") as mock_connect:
+        mock_connect.return_value = StatusSocket(FINISH_ORDER)
+        async with aio.get_http_client("token") as client:
+            results = [
+                result
+                async for result in pipeline.run_jobs(
+                    client, CONCEPTS, "acc", "hpc", msal_app=app, max_submissions=2
+                )
+            ]
+
+    assert [result.job_info["job_id"] for result in results] == [
+        job_id for job_id, _ in FINISH_ORDER
+    ]
+    assert results[0].result == {"results": "job_fast"}
+    assert results[1].error.args == ("Job Failed",)
+    assert results[2].concept == CONCEPTS[0]
+    assert mock_connect.call_count == 1
+    paths = [request.url.path for request in httpx_mock.get_requests()]
+    assert sum(path.endswith("/jobs:result") for path in paths) == 2
+    assert sum(path.endswith("/utilities:data_format_version") for path in paths) == 1
+
+
+def test_iter_job_results_times_out(httpx_mock: HTTPXMock):
+    mock_services(httpx_mock)
+    app = PublicClientApplication("123")
+    with patch("ansys.conceptev.core.progress.connect_to_ocm") as mock_connect:
+        mock_connect.return_value = StatusSocket(FINISH_ORDER[:1])
+        results = list(
+            pipeline.iter_job_results(
+                CONCEPTS[:2], "token", account_id="acc", hpc_id="hpc", msal_app=app, timeout=0.2
+            )
+        )
+
+    assert [result.ok for result in results] == [True, False]
+    assert "Timeout Error" in str(results[1].error)
+
+
+def test_closing_iter_job_results_stops_the_pipeline(httpx_mock: HTTPXMock):
+    mock_services(httpx_mock)
+    app = PublicClientApplication("123")
+    with patch("ansys.conceptev.core.progress.connect_to_ocm") as mock_connect:
+        mock_connect.return_value = StatusSocket(FINISH_ORDER[:1])
+        start = time.monotonic()
+        results = pipeline.iter_job_results(
+            CONCEPTS, "token", buffer_size=1, account_id="acc", hpc_id="hpc", msal_app=app
+        )
+        first = next(results)
+        results.close()
+
+    assert first.job_info["job_id"] == "job_fast"
+    assert time.monotonic() - start < 5
+    assert not any(thread.name == "conceptev-pipeline" for thread in threading.enumerate())
@@ -0,0 +1,123 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from ansys.conceptev.core import polling
+from ansys.conceptev.core.exceptions import ResponseError
+from ansys.conceptev.core.ocm import OCMSession
+from ansys.conceptev.core.settings import settings
+
+ocm_url = settings.ocm_url
+
+
+def mock_job_load(httpx_mock: HTTPXMock, statuses: dict[str, list]):
+    """Answer ``/job/load`` with the next status of each job, repeating the last one."""
+
+    def respond(request: httpx.Request):
+        job_id = json.loads(request.content)["jobId"]
+        remaining = statuses[job_id]
+        status = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        if status is None:
+            return httpx.Response(500, json={"detail": "unavailable"})
+        return httpx.Response(200, json={"lastStatus": status})
+
+    httpx_mock.add_callback(respond, url=f"{ocm_url}/job/load", is_reusable=True)
+
+
+def loads(httpx_mock: HTTPXMock) -> list[str]:
+    return [json.loads(request.content)["jobId"] for request in httpx_mock.get_requests()]
+
+
+def test_poll_interval_grows_with_runtime():
+    poller = polling.JobPoller("token", min_interval=5, max_interval=60, backoff=0.1)
+    assert poller.poll_interval(10) == 5
+    assert poller.poll_interval(300) == 30
+    assert poller.poll_interval(3600) == 60
+    poller.close()
+
+
+def test_as_completed(httpx_mock: HTTPXMock):
+    mock_job_load(
+        httpx_mock,
+        {
+            "quick": ["completed"],
+            "slow": ["queued", "running", "running", "finished"],
+            "broken": ["running", "failed"],
+        },
+    )
+    with polling.JobPoller("token", min_interval=0.01, max_interval=0.01) as poller:
+        poller.watch_all([{"job_id": "quick"}, {"job_id": "slow"}, {"job_id": "broken"}])
+        finished = list(poller.as_completed(timeout=5))
+    assert finished == [("quick", "COMPLETED"), ("broken", "FAILED"), ("slow", "FINISHED")]
+    polled = loads(httpx_mock)
+    assert polled.count("quick") == 1
+    assert polled.count("broken") == 2
+    assert polled.count("slow") == 4
+
+
+def test_failing_polls_stop_a_job(httpx_mock: HTTPXMock):
+    mock_job_load(httpx_mock, {"lost": [None], "fine": [None, "completed"]})
+    with polling.JobPoller("token", min_interval=0.01, max_interval=0.01, max_failures=3) as poller:
+        poller.watch_all([{"job_id": "lost"}, {"job_id": "fine"}])
+        statuses = poller.wait_all(timeout=5)
+    assert statuses == {"lost": None, "fine": "COMPLETED"}
+    assert list(poller.errors) == ["lost"]
+    assert loads(httpx_mock).count("lost") == 3
+
+
+def test_job_given_up_after_running_has_no_status(httpx_mock: HTTPXMock):
+    mock_job_load(httpx_mock, {"flaky": ["running", None]})
+    with polling.JobPoller("token", min_interval=0.01, max_interval=0.01, max_failures=2) as poller:
+        poller.watch({"job_id": "flaky"})
+        finished = list(poller.as_completed(timeout=5))
+    assert finished == [("flaky", None)]
+    assert poller.statuses["flaky"] is None
+    assert isinstance(poller.errors["flaky"], ResponseError)
+
+
+def test_timeout(httpx_mock: HTTPXMock):
+    mock_job_load(httpx_mock, {"stuck": ["running"]})
+    with polling.JobPoller("token", min_interval=0.01, max_interval=0.01) as poller:
+        poller.watch({"job_id": "stuck"})
+        with pytest.raises(Exception, match="taking too long"):
+            poller.wait_all(timeout=0.05)
+
+
+def test_poll_jobs_shares_session_and_refreshes_token(httpx_mock: HTTPXMock):
+    mock_job_load(httpx_mock, {"a": ["running", "completed"], "b": ["completed"]})
+    tokens = iter(["token_1", "token_2"])
+    with OCMSession() as session:
+        statuses = polling.poll_jobs(
+            [{"job_id": "a"}, {"job_id": "b"}],
+            lambda: next(tokens),
+            session=session,
+            min_interval=0.01,
+            max_interval=0.01,
+        )
+        assert not session.client.is_closed
+    assert statuses == {"a": "COMPLETED", "b": "COMPLETED"}
+    authorizations = [request.headers["Authorization"] for request in httpx_mock.get_requests()]
+    assert authorizations == ["token_1", "token_1", "token_2"]
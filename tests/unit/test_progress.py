@@ -20,28 +20,46 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
 import json
 import ssl
 import tempfile
 from unittest.mock import AsyncMock, patch
 
 import certifi
+import httpx
 from msal import PublicClientApplication
 import pytest
+from pytest_httpx import HTTPXMock
 
 from ansys.conceptev.core.progress import (
+    MESSAGE_CALCULATED_VALUES,
+    MESSAGE_ERROR,
+    MESSAGE_PROGRESS,
+    MESSAGE_STATUS,
     OCM_SOCKET_URL,
     STATUS_COMPLETE,
     STATUS_ERROR,
     STATUS_FINISHED,
+    JobEvent,
+    JobMonitor,
     check_status,
     connect_to_ocm,
+    decode_message,
     generate_ssl_context,
+    get_job_statuses,
     get_status,
     monitor_job_messages,
     monitor_job_progress,
+    monitor_jobs_progress,
+    print_event,
+    reconcile_messages,
     ssl_context,
+    stream_calculated_values,
 )
+from ansys.conceptev.core.settings import settings
+
+pytestmark = pytest.mark.usefixtures("no_status_reconciliation")
 
 
 @pytest.mark.asyncio
@@ -52,7 +70,22 @@ async def test_connect_to_ocm():
 
     with patch("ansys.conceptev.core.progress.connect") as mock_connect:
         connect_to_ocm(user_id, token)
-        mock_connect.assert_called_with(expected_uri, ssl=ssl_context)
+        mock_connect.assert_called_with(
+            expected_uri, ssl=ssl_context, ping_interval=20.0, ping_timeout=20.0
+        )
+
+
+def test_connect_to_local_ocm_without_ssl(monkeypatch):
+    from ansys.conceptev.core import progress
+
+    monkeypatch.setattr(progress.settings, "ocm_socket_url", "ws://127.0.0.1:8765/socket")
+    with patch("ansys.conceptev.core.progress.connect") as mock_connect:
+        connect_to_ocm("user", "token")
+        mock_connect.assert_called_with(
+            "ws://127.0.0.1:8765/socket/user?userId=user&Authorization=token",
+            ping_interval=20.0,
+            ping_timeout=20.0,
+        )
 
 
 def test_parse_message():
@@ -66,6 +99,42 @@ def test_parse_message():
     assert get_status(progress_message, job_id) is None
 
 
+def test_decode_message():
+    status = decode_message(
+        json.dumps({"jobId": "job", "messagetype": "status", "status": "running"})
+    )
+    values = decode_message(
+        json.dumps(
+            {
+                "jobId": "job",
+                "messagetype": "progress",
+                "progress": 1,
+                "calculated_values": {"a": 1},
+            }
+        )
+    )
+    error = decode_message(json.dumps({"jobId": "job", "messagetype": "error", "message": "bad"}))
+
+    assert status == JobEvent("job", MESSAGE_STATUS, status="RUNNING")
+    assert values == JobEvent(
+        "job", MESSAGE_CALCULATED_VALUES, progress=1, calculated_values={"a": 1}
+    )
+    assert error == JobEvent("job", MESSAGE_ERROR, error="bad")
+    assert not hasattr(status, "__dict__")
+
+
+def test_get_status_reports_event(capsys):
+    event = JobEvent("job", MESSAGE_PROGRESS, progress=0.5)
+    reported = []
+
+    assert get_status(event, "job", reported.append) is None
+    assert get_status(event, "other job", reported.append) is None
+    assert get_status(event, "job") is None
+
+    assert reported == [event]
+    assert capsys.readouterr().out == "Progress:0.5\n"
+
+
 class AsyncContextManager:
 
     def __init__(self, items):
@@ -129,7 +198,7 @@ def test_monitor_job_progress():
     ) as mock_monitor:
         mock_monitor.return_value = STATUS_COMPLETE
         result = monitor_job_progress(job_id, user_id, token, app)
-        mock_monitor.assert_called_with(job_id, user_id, token, app, 3600)
+        mock_monitor.assert_called_with(job_id, user_id, token, app, 3600, print_event)
         assert result == STATUS_COMPLETE
 
 
@@ -152,6 +221,39 @@ def test_ssl_cert_custom():
             assert ssl_context.verify_mode == ssl.CERT_REQUIRED
 
 
+def test_ssl_context_is_shared(monkeypatch):
+    from ansys.conceptev.core import progress
+
+    shared = progress.get_ssl_context()
+    assert progress.get_ssl_context() is shared
+    assert progress.connect_to_ocm("user", "token") is not None
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".pem", delete=False) as temp_cert:
+        with open(certifi.where(), "r") as certifi_file:
+            temp_cert.write(certifi_file.read())
+    monkeypatch.setattr(progress.settings, "ssl_cert_file", temp_cert.name)
+    custom = progress.get_ssl_context()
+    assert custom is not shared
+    assert progress.get_ssl_context() is custom
+
+    progress.reset_ssl_context()
+    assert progress.get_ssl_context() is not custom
+
+
+def test_ssl_context_is_created_once_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ansys.conceptev.core import progress
+
+    with patch(
+        "ansys.conceptev.core.progress.generate_ssl_context", side_effect=generate_ssl_context
+    ) as mock_generate:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            contexts = list(executor.map(lambda _: progress.get_ssl_context(), range(32)))
+    assert mock_generate.call_count == 1
+    assert all(context is contexts[0] for context in contexts)
+
+
 @pytest.mark.asyncio
 async def test_token_refreshed_on_websocket_reconnect():
     """When a long-running job causes a WebSocket disconnection, a fresh token should
@@ -181,7 +283,11 @@ async def test_token_refreshed_on_websocket_reconnect():
         "ansys.conceptev.core.progress.connect_to_ocm", side_effect=fake_connect_to_ocm
     ), patch(
         "ansys.conceptev.core.progress.get_ansyId_token", return_value=refreshed_token
-    ) as mock_refresh:
+    ) as mock_refresh, patch(
+        "ansys.conceptev.core.progress.reconnect_delay", return_value=0
+    ), patch(
+        "ansys.conceptev.core.progress.get_job_statuses", return_value={job_id: "RUNNING"}
+    ):
         result = await monitor_job_messages(job_id, user_id, initial_token, app)
 
     assert result == STATUS_COMPLETE
@@ -191,3 +297,287 @@ async def test_token_refreshed_on_websocket_reconnect():
     assert connection_calls[1] == refreshed_token
     # get_ansyId_token was called once to refresh after the first WebSocket disconnected
     mock_refresh.assert_called_once_with(app)
+
+
+def test_reconnect_delay_grows_and_is_capped(monkeypatch):
+    from ansys.conceptev.core import progress
+
+    monkeypatch.setattr(progress.settings, "websocket_reconnect_delay", 1.0)
+    monkeypatch.setattr(progress.settings, "websocket_max_reconnect_delay", 8.0)
+    with patch("ansys.conceptev.core.progress.random.uniform", side_effect=lambda a, b: b):
+        delays = [progress.reconnect_delay(attempt) for attempt in range(6)]
+
+    assert delays == [1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
+
+
+@pytest.mark.asyncio
+async def test_status_missed_while_disconnected_is_recovered():
+    """A job that finished while the websocket was down is found by asking OCM."""
+    app = PublicClientApplication("123")
+    connections = [
+        AsyncContextManager([status_message("test_job", "running")]),
+        AsyncContextManager([]),
+    ]
+    with patch("ansys.conceptev.core.progress.connect_to_ocm", side_effect=connections), patch(
+        "ansys.conceptev.core.progress.get_ansyId_token", return_value="token"
+    ), patch("ansys.conceptev.core.progress.reconnect_delay", return_value=0), patch(
+        "ansys.conceptev.core.progress.get_job_statuses",
+        return_value={"test_job": STATUS_COMPLETE},
+    ) as mock_statuses:
+        result = await monitor_job_messages("test_job", "user", "token", app)
+
+    assert result == STATUS_COMPLETE
+    mock_statuses.assert_called_once_with(["test_job"], "token")
+
+
+@pytest.mark.asyncio
+async def test_job_monitor_reconnects_after_connection_errors():
+    app = PublicClientApplication("123")
+    connections = [OSError("reset"), OSError("reset"), DelayedSocket([])]
+    with patch("ansys.conceptev.core.progress.connect_to_ocm", side_effect=connections), patch(
+        "ansys.conceptev.core.progress.get_ansyId_token", return_value="new token"
+    ), patch("ansys.conceptev.core.progress.reconnect_delay", return_value=0) as mock_delay, patch(
+        "ansys.conceptev.core.progress.get_job_statuses",
+        side_effect=lambda job_ids, token: {job_id: STATUS_FINISHED for job_id in job_ids},
+    ):
+        async with JobMonitor("user", "token", app) as monitor:
+            monitor.watch("job_1")
+            monitor.watch("job_2")
+            result = await monitor.wait_all()
+
+    assert result == {"job_1": STATUS_FINISHED, "job_2": STATUS_FINISHED}
+    assert [call.args for call in mock_delay.call_args_list] == [(0,), (1,)]
+    assert monitor.token == "new token"
+
+
+@pytest.mark.asyncio
+async def test_connection_error_raised_after_max_reconnects(monkeypatch):
+    from ansys.conceptev.core import progress
+
+    monkeypatch.setattr(progress.settings, "websocket_max_reconnects", 2)
+    app = PublicClientApplication("123")
+    with patch(
+        "ansys.conceptev.core.progress.connect_to_ocm", side_effect=OSError("unreachable")
+    ) as mock_connect, patch(
+        "ansys.conceptev.core.progress.get_ansyId_token", return_value="token"
+    ), patch(
+        "ansys.conceptev.core.progress.reconnect_delay", return_value=0
+    ):
+        with pytest.raises(OSError, match="unreachable"):
+            await monitor_job_messages("test_job", "user", "token", app)
+
+    assert mock_connect.call_count == 3
+
+
+class DelayedSocket(AsyncContextManager):
+    """A websocket that lets other tasks run before each message, like a real connection."""
+
+    async def __aenter__(self):
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0.01)
+        if not self.items:
+            raise StopAsyncIteration
+        return self.items.pop(0)
+
+
+def status_message(job_id, status):
+    return json.dumps({"jobId": job_id, "messagetype": "status", "status": status})
+
+
+@pytest.mark.asyncio
+async def test_job_monitor_dispatches_by_job_id():
+    """Messages from one connection are routed to the job they belong to."""
+    app = PublicClientApplication("123")
+    messages = [
+        json.dumps({"jobId": "job_1", "messagetype": "progress", "progress": 0.5}),
+        status_message("other_job", STATUS_COMPLETE),
+        status_message("job_2", "running"),
+        status_message("job_2", STATUS_ERROR),
+        status_message("job_1", STATUS_COMPLETE),
+    ]
+    received = []
+    with patch("ansys.conceptev.core.progress.connect_to_ocm") as mock_connect:
+        mock_connect.return_value = DelayedSocket(messages)
+        async with JobMonitor("user", "token", app) as monitor:
+            monitor.watch("job_1", callback=lambda job_id, data: received.append(data))
+            monitor.watch("job_2")
+            finished = [item async for item in monitor.as_completed()]
+
+    assert finished == [("job_2", STATUS_ERROR), ("job_1", STATUS_COMPLETE)]
+    assert monitor.status("job_2") == STATUS_ERROR
+    assert [event.kind for event in received] == ["progress", "status"]
+    mock_connect.assert_called_once_with("user", "token")
+
+
+def test_monitor_jobs_progress():
+    app = PublicClientApplication("123")
+    job_ids = [f"job_{index}" for index in range(50)]
+    messages = [status_message(job_id, STATUS_FINISHED) for job_id in reversed(job_ids)]
+    with patch("ansys.conceptev.core.progress.connect_to_ocm") as mock_connect:
+        mock_connect.return_value = AsyncContextManager(messages)
+        result = monitor_jobs_progress(job_ids, "user", "token", app)
+    assert result == {job_id: STATUS_FINISHED for job_id in job_ids}
+    assert mock_connect.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_job_monitor_timeout():
+    app = PublicClientApplication("123")
+
+    class SilentSocket:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            pass
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            await asyncio.sleep(10)
+
+    with patch("ansys.conceptev.core.progress.connect_to_ocm", return_value=SilentSocket()):
+        async with JobMonitor("user", "token", app, timeout=0.1) as monitor:
+            monitor.watch("job_1")
+            with pytest.raises(Exception, match="Timeout Error"):
+                await monitor.wait_all()
+
+
+@pytest.mark.asyncio
+async def test_job_monitor_remembers_jobs_finished_before_watched():
+    app = PublicClientApplication("123")
+    monitor = JobMonitor("user", "token", app)
+    monitor.dispatch(status_message("job_1", "running"))
+    monitor.dispatch(status_message("job_2", STATUS_COMPLETE))
+
+    future = monitor.watch("job_2")
+
+    assert future.result() == STATUS_COMPLETE
+    assert monitor.unwatched == {}
+    await monitor.close()
+
+
+class HangingSocket(DelayedSocket):
+    """A websocket that stays open without messages once its messages are sent."""
+
+    async def __anext__(self):
+        while not self.items:
+            await asyncio.sleep(10)
+        return await super().__anext__()
+
+
+def values_message(job_id, values):
+    return json.dumps(
+        {"jobId": job_id, "messagetype": "progress", "progress": 1, "calculated_values": values}
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_calculated_values():
+    app = PublicClientApplication("123")
+    messages = [
+        values_message("job_2", {"range": 2}),
+        status_message("job_3", STATUS_ERROR),
+        values_message("other_job", {"range": 0}),
+        values_message("job_1", {"range": 1}),
+    ]
+    with patch("ansys.conceptev.core.progress.connect_to_ocm") as mock_connect:
+        mock_connect.return_value = DelayedSocket(messages)
+        streamed = [
+            item
+            async for item in stream_calculated_values(
+                ["job_1", "job_2", "job_3"], "user", "token", app
+            )
+        ]
+
+    assert streamed == [("job_2", {"range": 2}), ("job_3", None), ("job_1", {"range": 1})]
+    mock_connect.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stream_calculated_values_polls_after_timeout():
+    app = PublicClientApplication("123")
+    polled = {"job_1": {"range": 1}}
+    with patch(
+        "ansys.conceptev.core.progress.connect_to_ocm",
+        return_value=HangingSocket([values_message("job_2", {"range": 2})]),
+    ):
+        streamed = {
+            job_id: values
+            async for job_id, values in stream_calculated_values(
+                ["job_1", "job_2", "job_3"], "user", "token", app, timeout=0.1, poll=polled.get
+            )
+        }
+
+    assert streamed == {"job_1": {"range": 1}, "job_2": {"range": 2}, "job_3": None}
+
+
+@pytest.mark.asyncio
+async def test_job_monitor_remembers_values_before_watched():
+    monitor = JobMonitor("user", "token", PublicClientApplication("123"))
+    monitor.dispatch(values_message("job_1", {"range": 1}))
+
+    future = monitor.watch_values("job_1")
+
+    assert future.result() == {"range": 1}
+    assert monitor.unwatched_values == {}
+    await monitor.close()
+
+
+def respond_job_load(request: httpx.Request) -> httpx.Response:
+    job_id = json.loads(request.content)["jobId"]
+    if job_id == "missing_job":
+        return httpx.Response(404, json={"detail": "not found"})
+    assert request.headers["Authorization"] == "token"
+    return httpx.Response(
+        200,
+        json={"finalStatus": "completed" if job_id == "done" else None, "lastStatus": "running"},
+    )
+
+
+@pytest.fixture
+def status_reconciliation(no_status_reconciliation, monkeypatch):
+    from ansys.conceptev.core import progress
+
+    monkeypatch.setattr(progress, "get_job_statuses", get_job_statuses)
+
+
+def test_get_job_statuses(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(
+        respond_job_load, url=f"{settings.ocm_url.rstrip('/')}/job/load", is_reusable=True
+    )
+
+    assert get_job_statuses(["done", "busy"], "token") == {
+        "done": STATUS_COMPLETE,
+        "busy": "RUNNING",
+    }
+
+
+@pytest.mark.asyncio
+async def test_reconcile_messages_skips_failed_lookups(
+    httpx_mock: HTTPXMock, status_reconciliation
+):
+    httpx_mock.add_callback(respond_job_load, url=f"{settings.ocm_url.rstrip('/')}/job/load")
+
+    assert await reconcile_messages(["missing_job"], "token") == []
+
+
+@pytest.mark.asyncio
+async def test_job_monitor_finds_jobs_finished_before_connecting(
+    httpx_mock: HTTPXMock, status_reconciliation
+):
+    httpx_mock.add_callback(
+        respond_job_load, url=f"{settings.ocm_url.rstrip('/')}/job/load", is_reusable=True
+    )
+    with patch("ansys.conceptev.core.progress.connect_to_ocm", return_value=HangingSocket([])):
+        async with JobMonitor("user", "token", PublicClientApplication("123")) as monitor:
+            monitor.watch("done")
+            result = await monitor.wait_all(timeout=5)
+
+    assert result == {"done": STATUS_COMPLETE}
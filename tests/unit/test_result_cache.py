@@ -0,0 +1,85 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import os
+
+from ansys.conceptev.core import result_cache
+from ansys.conceptev.core.result_cache import ResultCache
+from ansys.conceptev.core.settings import settings
+
+
+def test_key_depends_on_every_parameter():
+    keys = {
+        ResultCache.key("job", "output_file_v3.json", True, False),
+        ResultCache.key("other", "output_file_v3.json", True, False),
+        ResultCache.key("job", "output_file_v4.json", True, False),
+        ResultCache.key("job", "output_file_v3.json", False, False),
+        ResultCache.key("job", "output_file_v3.json", True, True),
+    }
+    assert len(keys) == 5
+
+
+def test_set_and_get(tmp_path):
+    cache = ResultCache(tmp_path / "results")
+    key = ResultCache.key("job", "output_file_v3.json", True, False)
+    assert cache.get(key) is None
+    cache.set(key, [{"requirement": {"name": "test"}}])
+    assert cache.get(key) == [{"requirement": {"name": "test"}}]
+    assert ResultCache(tmp_path / "results").get(key) == [{"requirement": {"name": "test"}}]
+
+
+def test_damaged_entry_is_dropped(tmp_path):
+    cache = ResultCache(tmp_path)
+    key = ResultCache.key("job", "output_file_v3.json", True, False)
+    cache.path(key).write_text("[1, 2")
+    assert cache.get(key) is None
+    assert not cache.path(key).exists()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=250)
+    keys = [ResultCache.key(str(job), "output_file_v3.json", True, False) for job in range(3)]
+    for age, key in enumerate(keys[:2]):
+        cache.set(key, "x" * 100)
+        os.utime(cache.path(key), (age, age))
+    cache.get(keys[0])  # Mark the oldest entry as recently used.
+    cache.set(keys[2], "x" * 100)
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+    assert cache.size() <= 250
+
+
+def test_clear(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.set(ResultCache.key("job", "output_file_v3.json", True, False), {})
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_default_cache_follows_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "result_cache_dir", None)
+    assert result_cache.get_default_result_cache() is None
+    monkeypatch.setattr(settings, "result_cache_dir", str(tmp_path))
+    cache = result_cache.get_default_result_cache()
+    assert cache.directory == tmp_path
+    assert result_cache.get_default_result_cache() is cache
+    assert result_cache.resolve_result_cache(None, use_cache=False) is None
@@ -0,0 +1,186 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import time
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from ansys.conceptev.core import aio, app, ocm
+from ansys.conceptev.core.retries import (
+    RETRY_SAFE,
+    RetryMetrics,
+    RetryPolicy,
+    default_retry_policy,
+    retry_after,
+)
+from ansys.conceptev.core.settings import settings
+
+conceptev_url = settings.conceptev_url.rstrip("/")
+ocm_url = settings.ocm_url.rstrip("/")
+
+
+@pytest.fixture
+def waits(monkeypatch):
+    waits = []
+    monkeypatch.setattr(time, "sleep", waits.append)
+    return waits
+
+
+@pytest.fixture
+def policy():
+    return RetryPolicy(max_attempts=3, metrics=RetryMetrics())
+
+
+def test_honours_retry_after(httpx_mock: HTTPXMock, waits, policy):
+    url = f"{conceptev_url}/concepts"
+    httpx_mock.add_response(url=url, status_code=429, headers={"Retry-After": "7"})
+    httpx_mock.add_response(url=url, json=[])
+    with app.get_http_client("token", retry_policy=policy) as client:
+        assert app.get(client, "/concepts") == []
+
+    assert waits == [7.0]
+    assert policy.metrics.snapshot() == {"retries": {"429": 1}, "gave_up": 0, "wait_seconds": 7.0}
+
+
+def test_retry_after_date():
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    response = httpx.Response(503, headers={"Retry-After": format_datetime(when)})
+
+    assert 28 < retry_after(response) <= 30
+    assert retry_after(httpx.Response(503, headers={"Retry-After": "soon"})) is None
+
+
+@pytest.mark.parametrize(
+    "method, path, status, retried",
+    [
+        ("POST", "/concepts:copy", 503, True),
+        ("POST", "/concepts:copy", 429, True),
+        ("POST", "/concepts:copy", 502, False),
+        ("POST", "/jobs:result", 504, True),
+        ("GET", "/concepts", 502, True),
+        ("DELETE", "/concepts/1", 504, True),
+        ("GET", "/concepts", 500, False),
+    ],
+)
+def test_only_retries_safe_requests(policy, method, path, status, retried):
+    request = httpx.Request(method, f"{conceptev_url}{path}")
+    response = httpx.Response(status)
+
+    assert (policy.retry_reason(request, response=response) is not None) is retried
+
+
+def test_retry_safe_extension(policy):
+    request = httpx.Request("POST", f"{conceptev_url}/jobs", extensions={RETRY_SAFE: True})
+
+    assert policy.retry_reason(request, error=httpx.ReadTimeout("slow")) == "ReadTimeout"
+    assert policy.retry_reason(httpx.Request("POST", f"{conceptev_url}/jobs"), error=None) is None
+
+
+def test_ocm_client_retries_transport_errors(httpx_mock: HTTPXMock, waits, policy):
+    httpx_mock.add_exception(httpx.ReadTimeout("slow"), url=f"{ocm_url}/job/load")
+    httpx_mock.add_exception(httpx.ConnectError("reset"), url=f"{ocm_url}/job/load")
+    httpx_mock.add_response(url=f"{ocm_url}/job/load", json={"jobName": "job"})
+    with ocm.OCMSession(retry_policy=policy) as session:
+        response = session.request("token", "POST", "/job/load", json={"jobId": "job1"})
+
+    assert response.json() == {"jobName": "job"}
+    assert policy.metrics.retries == {"ReadTimeout": 1, "ConnectError": 1}
+    assert len(waits) == 2
+
+
+def test_returns_last_response_when_giving_up(httpx_mock: HTTPXMock, waits, policy):
+    httpx_mock.add_response(url=f"{ocm_url}/product/list", status_code=503, is_reusable=True)
+    client = ocm.create_ocm_client("token", retry_policy=policy)
+
+    response = client.get("/product/list")
+
+    assert response.status_code == 503
+    assert len(httpx_mock.get_requests()) == 3
+    assert policy.metrics.gave_up == 1
+
+
+def test_does_not_retry_unsafe_post_after_read_error(httpx_mock: HTTPXMock, policy):
+    httpx_mock.add_exception(httpx.ReadError("reset"), url=f"{conceptev_url}/jobs:start")
+    with app.get_http_client("token", retry_policy=policy) as client:
+        with pytest.raises(httpx.ReadError):
+            client.post("/jobs:start", json={})
+
+    assert policy.metrics.snapshot()["retries"] == {}
+
+
+@pytest.mark.asyncio
+async def test_async_client_retries(httpx_mock: HTTPXMock, policy):
+    url = f"{conceptev_url}/concepts"
+    httpx_mock.add_response(url=url, status_code=429, headers={"Retry-After": "0"})
+    httpx_mock.add_response(url=url, json=[])
+    async with aio.get_http_client("token", retry_policy=policy) as client:
+        assert await aio.get(client, "/concepts") == []
+
+    assert policy.metrics.retries == {"429": 1}
+
+
+def test_default_policy_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, "retry_max_attempts", 4)
+    monkeypatch.setattr(settings, "retry_max_wait", 5.0)
+
+    policy = default_retry_policy()
+
+    assert (policy.max_attempts, policy.max_delay, policy.max_wait) == (4, 120.0, 5.0)
+
+
+def test_streamed_response_is_closed_before_retry(httpx_mock: HTTPXMock, waits, policy):
+    url = f"{ocm_url}/job/files/job1"
+    httpx_mock.add_response(url=url, status_code=503, content=b"busy")
+    httpx_mock.add_response(url=url, content=b"file")
+    responses = []
+    client = ocm.create_ocm_client("token", retry_policy=policy)
+    client.event_hooks["response"].append(responses.append)
+
+    with client.stream("GET", url) as response:
+        assert response.read() == b"file"
+
+    assert responses[0].status_code == 503
+    assert responses[0].is_closed
+    assert len(waits) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_streamed_response_is_closed_before_retry(httpx_mock: HTTPXMock, policy):
+    url = f"{ocm_url}/job/files/job1"
+    httpx_mock.add_response(url=url, status_code=429, headers={"Retry-After": "0"})
+    httpx_mock.add_response(url=url, content=b"file")
+    responses = []
+
+    async def keep(response):
+        responses.append(response)
+
+    client = aio.create_ocm_client("token", retry_policy=policy)
+    client.event_hooks["response"].append(keep)
+    async with client.stream("GET", url) as response:
+        assert await response.aread() == b"file"
+    await client.aclose()
+
+    assert responses[0].status_code == 429
+    assert responses[0].is_closed